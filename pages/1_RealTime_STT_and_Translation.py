@@ -1,22 +1,21 @@
 # pages/1_RealTime_STT_and_Translation.py
 
-import os
 import sys
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict
 
 import streamlit as st
 from dotenv import load_dotenv
 
-import azure.cognitiveservices.speech as speechsdk
-
 # Import your helper modules from scripts/
 BASE_DIR = Path(__file__).resolve().parent.parent
 SCRIPTS_DIR = BASE_DIR / "scripts"
 sys.path.append(str(SCRIPTS_DIR))  # allow importing scripts as modules
 
+from speech_resources import TTS_CONCURRENCY, get_speech_resources
 from language_config import (
     LANGUAGE_NAMES,
     SUPPORTED_LANGUAGES,
@@ -25,7 +24,7 @@ from language_config import (
     get_language_name,
     get_tts_voice,
 )
-from translator import translate_with_retry
+from translator import translate_with_retry, get_translator_client
 
 load_dotenv()
 
@@ -95,37 +94,28 @@ def load_partial_transcript() -> str:
         return ""
 
 
-def synthesize_speech(text: str, lang_code: str, gender: str = "female") -> Path:
+def synthesize_speech(text: str, lang_code: str, gender: str = "female") -> Dict:
     """
-    Use Azure TTS to synthesize speech to a WAV file for the given language code.
-    Returns path to the generated audio file.
+    Use Azure TTS to stream speech for the given language code into a WAV file.
+    Returns the synthesize_streaming() outcome: file path and
+    first_audio_time / total_time in seconds.
     """
-    speech_key = os.getenv("AZURE_SPEECH_KEY")
-    speech_region = os.getenv("AZURE_REGION")
-    if not speech_key or not speech_region:
+    resources = get_speech_resources()
+    if not resources.has_credentials:
         raise RuntimeError("Missing Azure Speech credentials")
 
-    speech_config = speechsdk.SpeechConfig(subscription=speech_key, region=speech_region)
-
     # Map 2-letter language to Azure voice name using your language_config helper
     voice_name = get_tts_voice(lang_code, gender=gender)
-    speech_config.speech_synthesis_voice_name = voice_name
 
     TTS_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     safe_lang = lang_code.replace("-", "_")
     audio_file = TTS_OUTPUT_DIR / f"tts_{safe_lang}.wav"
 
-    audio_config = speechsdk.audio.AudioOutputConfig(filename=str(audio_file))
-    synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=audio_config)
-
-    result = synthesizer.speak_text_async(text).get()
-    if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-        return audio_file
-    elif result.reason == speechsdk.ResultReason.Canceled:
-        cancellation = speechsdk.CancellationDetails(result)
-        raise RuntimeError(f"TTS canceled: {cancellation.reason} ({cancellation.error_details})")
-    else:
-        raise RuntimeError(f"TTS failed with reason: {result.reason}")
+    # Warm pooled synthesizer for this voice; chunks are written to disk as they arrive
+    outcome = resources.synthesize_streaming(voice_name, text, output_path=str(audio_file))
+    if outcome["status"] != "success":
+        raise RuntimeError(outcome["error"])
+    return outcome
 
 
 # ---- Session state ----------------------------------------------------------
@@ -252,6 +242,7 @@ if st.button("🚀 Translate & Generate Speech"):
                 text,
                 target_languages=target_langs,
                 source_language=src_lang_code,
+                client=get_translator_client(),
             )
 
         if not result["success"]:
@@ -263,14 +254,26 @@ if st.button("🚀 Translate & Generate Speech"):
             st.info(result["original_text"])
 
             st.markdown("### 🌍 Translations")
+            audio_slots = {}
             for lang_code, translated in result["translations"].items():
                 lang_name = get_language_name(lang_code)
                 with st.expander(f"{lang_name} ({lang_code})"):
                     st.write(translated)
-                    try:
-                        with st.spinner(f"Generating TTS for {lang_name}..."):
-                            audio_path = synthesize_speech(translated, lang_code, gender=tts_gender)
-                        audio_bytes = audio_path.read_bytes()
-                        st.audio(audio_bytes, format="audio/wav")
-                    except Exception as e:
-                        st.warning(f"TTS error for {lang_code}: {e}")
+                    audio_slots[lang_code] = st.empty()
+
+            # Synthesize every language concurrently and show each player as soon as its voice is done
+            with st.spinner("Generating TTS..."), ThreadPoolExecutor(max_workers=TTS_CONCURRENCY) as pool:
+                tts_jobs = {
+                    pool.submit(synthesize_speech, translated, lang_code, tts_gender): lang_code
+                    for lang_code, translated in result["translations"].items()
+                }
+                for job in as_completed(tts_jobs):
+                    lang_code = tts_jobs[job]
+                    with audio_slots[lang_code].container():
+                        try:
+                            tts = job.result()
+                            st.audio(tts["audio_file"], format="audio/wav")
+                            st.caption(f"⚡ First audio after {tts['first_audio_time'] * 1000:.0f} ms · "
+                                       f"complete after {tts['total_time'] * 1000:.0f} ms")
+                        except Exception as e:
+                            st.warning(f"TTS error for {lang_code}: {e}")
@@ -20,33 +20,34 @@ from language_config import (
     get_speech_language_code,
     get_language_name,
 )
-from translator import translate_with_retry
-from transcribe_files import transcribe_file, get_language_info
+from async_translator import translate_many_sync
+from transcribe_files import get_language_info, transcribe_text_for
+from batch_transcriber import STT_MAX_WORKERS, iter_transcriptions
 
 load_dotenv()
 
 st.set_page_config(page_title="Batch Processing", page_icon="📂", layout="wide")
 
 st.title("📂 Batch Processing")
-st.caption("Transcribe multiple WAV files and translate transcript CSVs in one go.")
+st.caption("Transcribe multiple audio files and translate transcript CSVs in one go.")
 
-tab_wav, tab_csv = st.tabs(["🎧 Batch WAV → Transcript", "🌐 Batch CSV Translation"])
+tab_wav, tab_csv = st.tabs(["🎧 Batch Audio → Transcript", "🌐 Batch CSV Translation"])
 
 
 # ---- TAB 1: Batch WAV transcription ----------------------------------------
 
 
 with tab_wav:
-    st.subheader("🎧 Batch WAV → Transcript CSV")
+    st.subheader("🎧 Batch Audio → Transcript CSV")
 
     st.markdown(
-        "Upload one or more `.wav` audio files. "
-        "Transcripts will be generated using Azure Speech-to-Text."
+        "Upload one or more `.wav`, `.mp3`, `.m4a` or `.ogg` audio files. "
+        "Compressed files are decoded on all CPU cores, then transcribed using Azure Speech-to-Text."
     )
 
     uploaded_files = st.file_uploader(
-        "Upload WAV files",
-        type=["wav"],
+        "Upload audio files",
+        type=["wav", "mp3", "m4a", "ogg"],
         accept_multiple_files=True,
         help="You can select multiple files at once.",
         key="wav_uploader"
@@ -72,45 +73,59 @@ with tab_wav:
         default_lang_code = None
         default_lang_name = None
 
+    max_workers = st.slider(
+        "Files transcribed in parallel",
+        min_value=1,
+        max_value=32,
+        value=min(STT_MAX_WORKERS, 32),
+        key="stt_workers"
+    )
+
     # ---------------- FIXED BUTTON (unique key and used only once) ----------------
     run_button = st.button("🚀 Run Batch Transcription", key="run_batch_stt")
     # ------------------------------------------------------------------------------
 
     if run_button:
         if not uploaded_files:
-            st.error("Please upload at least one WAV file before running transcription.")
+            st.error("Please upload at least one audio file before running transcription.")
         else:
             rows = []
-            work_dir = BASE_DIR / "temp_batch_wav"
-            work_dir.mkdir(parents=True, exist_ok=True)
-
-            with st.spinner("Transcribing audio files..."):
-                for up in uploaded_files:
-                    file_name = up.name
-                    file_path = work_dir / file_name
-
-                    # Save uploaded file
-                    with open(file_path, "wb") as f:
-                        f.write(up.read())
-
-                    # Determine language
-                    if infer_language:
-                        lang_code, lang_name = get_language_info(file_name)
-                    else:
-                        lang_code, lang_name = default_lang_code, default_lang_name
-
-                    # Convert using Azure STT
-                    transcript = transcribe_file(str(file_path), language=lang_code or "en-US")
-
-                    rows.append(
-                        {
-                            "filename": file_name,
-                            "language": lang_code or "en-US",
-                            "language_name": lang_name or "English",
-                            "transcript": transcript,
-                        }
-                    )
+            jobs = []
+            names = {}
+            for up in uploaded_files:
+                file_name = up.name
+
+                # Determine language
+                if infer_language:
+                    lang_code, lang_name = get_language_info(file_name)
+                else:
+                    lang_code, lang_name = default_lang_code, default_lang_name
+
+                # Uploads are streamed to Azure straight from memory, no temp files
+                # (MP3/M4A/OGG are decoded in worker processes on the way)
+                jobs.append((file_name, up.getbuffer(), lang_code or "en-US"))
+                names[file_name] = lang_name or "English"
+
+            # Azure STT, several files at once; the bar advances as each finishes
+            progress = st.progress(0.0, text="Transcribing audio files...")
+            for done, result in enumerate(iter_transcriptions(jobs, max_workers=max_workers), 1):
+                progress.progress(
+                    done / len(jobs),
+                    text=f"Transcribed {done}/{len(jobs)} · {result['filename']} ({result['elapsed_seconds']:.1f}s)"
+                )
+                rows.append(
+                    {
+                        "filename": result["filename"],
+                        "language": result["language"],
+                        "language_name": names[result["filename"]],
+                        "transcript": transcribe_text_for(result),
+                        "status": result["status"],
+                        "cached": result["cached"],
+                        "seconds": result["elapsed_seconds"],
+                    }
+                )
 
+            rows.sort(key=lambda row: row["filename"])
             df = pd.DataFrame(rows)
             st.success("Batch transcription completed!")
             st.dataframe(df, use_container_width=True)
@@ -171,21 +186,29 @@ with tab_csv:
             else:
                 rows_out: List[Dict] = []
                 with st.spinner("Translating rows..."):
+                    texts: List[str] = []
+                    sources: List = []
                     for idx, row in df_input.iterrows():
-                        text = str(row[text_column])
+                        texts.append(str(row[text_column]))
                         source_lang_raw = row.get("language", "")
 
                         if "-" in str(source_lang_raw):
-                            source_lang_base = str(source_lang_raw).split("-")[0]
+                            sources.append(str(source_lang_raw).split("-")[0])
                         else:
-                            source_lang_base = source_lang_raw or None
-
-                        result = translate_with_retry(
-                            text,
-                            target_languages=target_langs,
-                            source_language=source_lang_base,
-                        )
+                            sources.append(source_lang_raw or None)
+
+                    # Many rows per Translator request, many requests in flight
+                    progress = st.progress(0.0, text="Translating rows...")
+                    results = translate_many_sync(
+                        texts,
+                        target_languages=target_langs,
+                        source_language=sources,
+                        progress_callback=lambda done, total: progress.progress(
+                            done / total, text=f"Translated {done}/{total} requests"
+                        ),
+                    )
 
+                    for (idx, row), result in zip(df_input.iterrows(), results):
                         out_row = dict(row)  # keep original columns
                         out_row["detected_language"] = result.get("source_language")
                         out_row["translation_timestamp"] = result.get("timestamp")
@@ -10,6 +10,11 @@ from dotenv import load_dotenv
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 SCRIPTS_DIR = BASE_DIR / "scripts"
+sys.path.append(str(SCRIPTS_DIR))
+
+from translator import get_rate_limiter, get_translation_cache, get_single_flight
+from speech_resources import get_speech_resources
+from stt_cache import get_stt_cache
 
 load_dotenv()
 
@@ -102,3 +107,65 @@ if st.button("▶️ Run Pipeline Tests"):
             st.success("All tests passed according to test_pipeline.py.")
         else:
             st.warning("Some tests failed. Check the output above for details.")
+
+st.markdown("---")
+
+st.markdown("### 📈 Translator Runtime Stats")
+
+st.write(
+    "Live counters for this Streamlit process: the shared Translator rate limiter, "
+    "request coalescing and the translation cache."
+)
+
+limiter_stats = get_rate_limiter().stats()
+rl_cols = st.columns(4)
+rl_cols[0].metric("Chars / second", f"{limiter_stats['chars_per_second']:g}" if limiter_stats["chars_per_second"] else "unlimited")
+rl_cols[1].metric("Requests / second", f"{limiter_stats['requests_per_second']:g}" if limiter_stats["requests_per_second"] else "unlimited")
+rl_cols[2].metric("Current wait", f"{limiter_stats['current_wait']:.2f}s")
+rl_cols[3].metric("Requests delayed", f"{limiter_stats['delayed']}/{limiter_stats['acquisitions']}")
+
+flight_stats = get_single_flight().stats()
+sf_cols = st.columns(4)
+sf_cols[0].metric("Translations executed", flight_stats["leaders"])
+sf_cols[1].metric("Coalesced callers", flight_stats["coalesced"])
+sf_cols[2].metric("Batch duplicates skipped", flight_stats["batch_duplicates"])
+sf_cols[3].metric("In flight", flight_stats["in_flight"])
+
+cache = get_translation_cache()
+if cache is None:
+    st.caption("Translation cache is disabled (TRANSLATION_CACHE_ENABLED=0).")
+else:
+    cache_stats = cache.stats()
+    cache_cols = st.columns(4)
+    cache_cols[0].metric("Cache hit rate", f"{cache_stats['hit_rate']:.0%}")
+    cache_cols[1].metric("Hits (disk)", f"{cache_stats['hits']} ({cache_stats['disk_hits']})")
+    cache_cols[2].metric("Misses", cache_stats["misses"])
+    cache_cols[3].metric("Evictions", cache_stats["evictions"])
+
+st.markdown("### 🗣️ Speech Resource Stats")
+
+st.caption("Shared SpeechConfig / recognizer / synthesizer creation for this Streamlit process.")
+
+speech_stats = get_speech_resources().stats()
+sp_cols = st.columns(4)
+sp_cols[0].metric("Configs (reused)", f"{speech_stats['configs_created']} ({speech_stats['config_hits']})")
+pool_stats = speech_stats["synthesizer_pool"]
+sp_cols[1].metric("Synthesizer pool hit rate", f"{pool_stats['hit_rate']:.0%}")
+sp_cols[2].metric("Recognizers created", speech_stats["recognizers_created"])
+sp_cols[3].metric("Connections pre-opened", speech_stats["connections_opened"])
+pool_cols = st.columns(4)
+pool_cols[0].metric("Synthesizers idle / in use", f"{pool_stats['idle']} / {pool_stats['in_use']}")
+pool_cols[1].metric("Created (misses)", f"{pool_stats['created']} ({pool_stats['misses']})")
+pool_cols[2].metric("Reconnected / rebuilt", f"{pool_stats['reconnected']} / {pool_stats['rebuilt']}")
+pool_cols[3].metric("Evicted idle / discarded", f"{pool_stats['evicted']} / {pool_stats['discarded']}")
+
+stt_cache = get_stt_cache()
+if stt_cache is None:
+    st.caption("STT result cache is disabled (STT_CACHE_ENABLED=0).")
+else:
+    stt_stats = stt_cache.stats()
+    stt_cols = st.columns(4)
+    stt_cols[0].metric("STT cache hit rate", f"{stt_stats['hit_rate']:.0%}")
+    stt_cols[1].metric("STT hits / misses", f"{stt_stats['hits']} / {stt_stats['misses']}")
+    stt_cols[2].metric("Cached transcripts", stt_stats["entries"])
+    stt_cols[3].metric("Cache size", f"{stt_stats['bytes'] / 1024:.0f} / {stt_stats['max_bytes'] / 1024:.0f} KB")
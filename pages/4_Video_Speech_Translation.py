@@ -1,9 +1,15 @@
 import streamlit as st
 import yt_dlp
-import os
+import sys
+import shutil
+import tempfile
 from pathlib import Path
-from transcribe_files import transcribe_file
-from translator import translate_with_retry
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from transcribe_files import iter_split_pieces
+from subtitles import format_cue, iter_cues, iter_translated_cues
+from translator import translate_with_retry, get_translator_client
 
 st.set_page_config(page_title="YouTube Speech Translation", page_icon="📺")
 
@@ -14,31 +20,17 @@ BASE_DIR = Path(__file__).resolve().parents[1]
 TEMP_DIR = BASE_DIR / "temp_youtube"
 TEMP_DIR.mkdir(exist_ok=True)
 
-import azure.cognitiveservices.speech as speechsdk
+from speech_resources import get_speech_resources
 from language_config import get_tts_voice
 
 def synthesize_speech(text, lang_code):
     try:
-        speech_key = os.getenv("AZURE_SPEECH_KEY")
-        region = os.getenv("AZURE_REGION")
-
-        speech_config = speechsdk.SpeechConfig(
-            subscription=speech_key,
-            region=region
-        )
-
-        # Pick correct Azure neural voice
+        # Pick correct Azure neural voice; a pooled synthesizer streams the audio back
         voice_name = get_tts_voice(lang_code)
-        speech_config.speech_synthesis_voice_name = voice_name
-
-        # Save output to memory stream
-        audio_config = speechsdk.audio.AudioOutputConfig(use_default_speaker=False)
-        synthesizer = speechsdk.SpeechSynthesizer(speech_config, audio_config)
-
-        result = synthesizer.speak_text_async(text).get()
+        outcome = get_speech_resources().synthesize_streaming(voice_name, text)
 
-        if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-            return result.audio_data
+        if outcome["status"] == "success":
+            return outcome
         else:
             return None
 
@@ -55,12 +47,13 @@ if st.button("🎬 Process Video"):
 
     st.info("Downloading audio from YouTube… please wait.")
 
-    audio_path = TEMP_DIR / "video_audio.wav"
+    # Per-run download directory, so concurrent sessions never pick up each other's audio
+    run_dir = Path(tempfile.mkdtemp(dir=TEMP_DIR))
 
     # -------------------- YT-DLP DOWNLOAD --------------------
     ydl_opts = {
         "format": "bestaudio/best",
-        "outtmpl": str(TEMP_DIR / "downloaded"),
+        "outtmpl": str(run_dir / "downloaded"),
         "postprocessors": [{
             "key": "FFmpegExtractAudio",
             "preferredcodec": "wav",
@@ -72,25 +65,49 @@ if st.button("🎬 Process Video"):
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             ydl.download([url])
 
-        # Find audio file
-        for f in TEMP_DIR.glob("*.wav"):
-            audio_path = f
-            break
+        # The WAV stays on disk until STT is done so it can be memory-mapped
+        audio_path = next(run_dir.glob("*.wav"))
 
         st.success("Audio extracted successfully!")
-        st.audio(str(audio_path))
+        st.audio(str(audio_path), format="audio/wav")
 
     except Exception as e:
+        shutil.rmtree(run_dir, ignore_errors=True)
         st.error(f"YouTube download failed: {e}")
         st.stop()
 
     # -------------------- STT --------------------
     st.info("Running Speech-to-Text…")
 
-    transcript = transcribe_file(str(audio_path))
+    # Cut at silences into pieces that are transcribed in parallel and shown in order
+    live_status = st.empty()
+    stt_progress = st.progress(0.0)
+    segments = []
+    incomplete = []
+    try:
+        for piece in iter_split_pieces(str(audio_path), words=True):
+            segments.extend(piece["segments"])
+            if piece["status"] in ("partial", "error"):
+                incomplete.append(piece)
+            stt_progress.progress((piece["index"] + 1) / piece["total"])
+            live_status.caption(
+                f"🎙️ {piece['index'] + 1}/{piece['total']} pieces · {piece['end']:.0f}s transcribed"
+            )
+    except Exception as e:
+        st.error(f"STT failed: {e}")
+        st.stop()
+    finally:
+        shutil.rmtree(run_dir, ignore_errors=True)
 
-    if not transcript or transcript.startswith("["):
-        st.error(f"STT failed: {transcript}")
+    if incomplete:
+        st.warning(
+            f"{len(incomplete)} of {incomplete[0]['total']} pieces incomplete ({incomplete[0]['error']}) "
+            "— continuing with the partial transcript."
+        )
+
+    transcript = " ".join(segment["text"] for segment in segments)
+    if not transcript:
+        st.error("STT failed: no speech recognized")
         st.stop()
 
     st.success("Transcription complete!")
@@ -100,7 +117,8 @@ if st.button("🎬 Process Video"):
     # -------------------- TRANSLATION --------------------
     st.info("Translating transcript into all languages…")
 
-    result = translate_with_retry(transcript)
+    # Long transcripts are split at sentence boundaries and translated in parallel
+    result = translate_with_retry(transcript, client=get_translator_client(), return_alignment=True)
 
     if not result["success"]:
         st.error("Translation failed.")
@@ -109,16 +127,47 @@ if st.button("🎬 Process Video"):
 
     st.success("Translations ready!")
 
+    chunks = result.get("chunks", [])
+    if len(chunks) > 1:
+        with st.expander(f"🧩 Sentence alignment ({len(chunks)} chunks)"):
+            st.dataframe(
+                [{"source": c["source"].strip(), **c["translations"]} for c in chunks],
+                use_container_width=True,
+            )
+
+    # -------------------- SUBTITLES --------------------
+    # Cues from the word timings; translated tracks come from batch-translating the cue texts
+    subtitle_languages = list(result["translations"])
+    tracks = {lang: {"srt": [], "vtt": ["WEBVTT\n\n"]} for lang in [None, *subtitle_languages]}
+    for cue, cue_translations in iter_translated_cues(iter_cues(segments), subtitle_languages):
+        for lang, text in [(None, cue["text"]), *cue_translations.items()]:
+            for fmt, blocks in tracks[lang].items():
+                blocks.append(format_cue(cue, fmt, text or cue["text"]))
+
+    st.write("### 🎞️ Subtitles")
+    srt_col, vtt_col = st.columns(2)
+    srt_col.download_button("⬇️ Original (.srt)", "".join(tracks[None]["srt"]), "subtitles.srt", "text/plain")
+    vtt_col.download_button("⬇️ Original (.vtt)", "".join(tracks[None]["vtt"]), "subtitles.vtt", "text/vtt")
+    with st.expander("🌐 Translated subtitles"):
+        for lang in subtitle_languages:
+            srt_col, vtt_col = st.columns(2)
+            srt_col.download_button(f"⬇️ {lang} (.srt)", "".join(tracks[lang]["srt"]),
+                                    f"subtitles.{lang}.srt", "text/plain", key=f"srt_{lang}")
+            vtt_col.download_button(f"⬇️ {lang} (.vtt)", "".join(tracks[lang]["vtt"]),
+                                    f"subtitles.{lang}.vtt", "text/vtt", key=f"vtt_{lang}")
+
     st.write("### 🔊 Listen to Translations")
 
     for lang, text in result["translations"].items():
         st.markdown(f"**🌐 {lang}:** {text}")
 
         if st.button(f"▶ Speak {lang}", key=f"tts_{lang}"):
-            audio_bytes = synthesize_speech(text, lang)
+            tts = synthesize_speech(text, lang)
 
-            if audio_bytes:
-                st.audio(audio_bytes, format="audio/wav")
+            if tts:
+                st.audio(tts["audio"], format="audio/wav")
+                st.caption(f"⚡ First audio after {tts['first_audio_time'] * 1000:.0f} ms · "
+                           f"complete after {tts['total_time'] * 1000:.0f} ms")
             else:
                 st.error(f"TTS failed for {lang}.")
 
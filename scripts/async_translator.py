@@ -0,0 +1,299 @@
+"""
+Async Translation Engine
+asyncio + aiohttp variant of the translator for large batch jobs:
+keeps many packed Translator requests in flight instead of one at a time
+"""
+
+import os
+import time
+import asyncio
+import threading
+from typing import List, Dict, Optional, Any, Union, Callable
+
+from translator import (
+    DEFAULT_TARGET_LANGUAGES,
+    TRANSLATOR_KEY,
+    TRANSLATOR_REGION,
+    TRANSLATOR_ENDPOINT,
+    TRANSLATOR_POOL_SIZE,
+    TRANSLATOR_CONNECT_TIMEOUT,
+    TRANSLATOR_READ_TIMEOUT,
+    RateLimiter,
+    RateLimitTimeout,
+    billed_characters,
+    get_rate_limiter,
+    ERROR_TRANSIENT,
+    ERROR_THROTTLED,
+    ERROR_CLIENT,
+    classify_status,
+    parse_retry_after,
+    get_translation_cache,
+    translate_batch,
+    translate_with_retry,
+    _missing_credentials_result,
+    _plan_batch,
+    _apply_pack_response,
+    _finish_batch,
+    _retry_sleep,
+)
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Maximum number of Translator requests in flight per translate_many() call
+TRANSLATOR_MAX_CONCURRENCY = int(os.getenv("AZURE_TRANSLATOR_MAX_CONCURRENCY", "16"))
+
+
+def _classify_async_exception(e: Exception) -> tuple:
+    """
+    aiohttp counterpart of translator._classify_exception.
+
+    Returns:
+        (error_kind, error message, retry_after seconds or None)
+    """
+    if isinstance(e, RateLimitTimeout):
+        return ERROR_THROTTLED, f"Translation error: {str(e)}", e.retry_after
+    if isinstance(e, aiohttp.ClientResponseError):
+        retry_after = parse_retry_after((e.headers or {}).get("Retry-After"))
+        return classify_status(e.status), f"API request failed: {str(e)}", retry_after
+    if isinstance(e, (aiohttp.ClientError, asyncio.TimeoutError)):
+        return ERROR_TRANSIENT, f"API request failed: {str(e) or type(e).__name__}", None
+    return ERROR_CLIENT, f"Translation error: {str(e)}", None
+
+
+class AsyncTranslatorClient:
+    """
+    aiohttp-based Azure Translator client.
+    Use as an async context manager; the underlying ClientSession is bound
+    to the running event loop.
+    """
+
+    def __init__(
+        self,
+        key: Optional[str] = None,
+        region: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        pool_size: int = TRANSLATOR_POOL_SIZE,
+        connect_timeout: float = TRANSLATOR_CONNECT_TIMEOUT,
+        read_timeout: float = TRANSLATOR_READ_TIMEOUT,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for the async translator. Run: pip install aiohttp")
+        self.key = key or TRANSLATOR_KEY
+        self.region = region or TRANSLATOR_REGION
+        self.endpoint = (endpoint or TRANSLATOR_ENDPOINT).rstrip("/")
+        self.pool_size = pool_size
+        self.timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        # Shares the process-wide limiter with the sync client by default
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.session: Optional["aiohttp.ClientSession"] = None
+
+    @property
+    def has_credentials(self) -> bool:
+        """Whether both the subscription key and region are configured."""
+        return bool(self.key and self.region)
+
+    async def __aenter__(self) -> "AsyncTranslatorClient":
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.pool_size),
+            timeout=self.timeout,
+            headers={
+                "Ocp-Apim-Subscription-Key": self.key or "",
+                "Ocp-Apim-Subscription-Region": self.region or "",
+                "Content-Type": "application/json"
+            }
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.session.close()
+        self.session = None
+
+    async def translate_documents(
+        self,
+        texts: List[str],
+        target_languages: List[str],
+        source_language: Optional[str] = None,
+        max_wait: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Send one /translate request for the given documents.
+
+        Args:
+            max_wait: Longest rate-limiter wait in seconds (None = unbounded)
+
+        Returns:
+            Raw JSON result list from the service, one entry per document
+
+        Raises:
+            aiohttp.ClientError on transport or HTTP errors
+            RateLimitTimeout if the rate limiter would wait longer than max_wait
+        """
+        params = [("api-version", "3.0")] + [("to", lang) for lang in target_languages]
+        if source_language:
+            params.append(("from", source_language))
+
+        wait = self.rate_limiter.reserve(billed_characters(texts, target_languages), max_wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        async with self.session.post(
+            f"{self.endpoint}/translate",
+            params=params,
+            json=[{"text": text} for text in texts]
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+
+
+async def translate_many(
+    texts: List[str],
+    target_languages: List[str] = None,
+    source_language: Union[Optional[str], List[Optional[str]]] = None,
+    max_concurrency: int = TRANSLATOR_MAX_CONCURRENCY,
+    max_retries: int = 3,
+    retry_delay: float = 1.0,
+    use_cache: bool = True,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    max_delay: float = 30.0,
+    deadline: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Translate many texts concurrently. Texts are packed into multi-document
+    requests (as in translator.translate_batch) and up to max_concurrency
+    requests are kept in flight.
+
+    Args:
+        texts: Input texts to translate
+        target_languages: List of target language codes
+        source_language: Source language code for every text, or one per text
+        max_concurrency: Maximum number of Translator requests in flight
+        max_retries: Maximum number of attempts per request
+        retry_delay: Base backoff delay in seconds (full-jitter exponential)
+        use_cache: Set False to bypass the translation cache for this call
+        progress_callback: Optional callable(done_requests, total_requests)
+        max_delay: Upper bound for a single backoff sleep in seconds
+        deadline: Total time budget in seconds for retries across the job
+
+    Returns:
+        List of translation result dictionaries, in input order
+    """
+    if target_languages is None:
+        target_languages = DEFAULT_TARGET_LANGUAGES
+
+    async with AsyncTranslatorClient(pool_size=max_concurrency) as client:
+        if not client.has_credentials:
+            return [_missing_credentials_result(text) for text in texts]
+
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+
+        cache = get_translation_cache() if use_cache else None
+        loop = asyncio.get_running_loop()
+        # SQLite cache reads and writes block, so they run off the event loop
+        plan = await loop.run_in_executor(None, _plan_batch, texts, target_languages, source_language, cache)
+        results = plan["results"]
+        semaphore = asyncio.Semaphore(max_concurrency)
+        total = len(plan["packs"]) + len(plan["oversized"])
+        done = 0
+
+        def _report():
+            nonlocal done
+            done += 1
+            if progress_callback is not None:
+                progress_callback(done, total)
+
+        async def _run_pack(pack: List[int]):
+            pack_texts = [texts[idx] for idx in pack]
+            pack_source, pack_targets = plan["group_keys"][pack[0]]
+            response = None
+            error = error_kind = retry_after = None
+
+            async with semaphore:
+                for attempt in range(max_retries):
+                    try:
+                        response = await client.translate_documents(
+                            pack_texts, list(pack_targets), pack_source,
+                            max(0.0, deadline_at - time.monotonic()) if deadline_at is not None else None
+                        )
+                        error = None
+                        break
+                    except Exception as e:
+                        error_kind, error, retry_after = _classify_async_exception(e)
+
+                    delay = _retry_sleep(
+                        attempt, max_retries, error_kind, retry_delay, max_delay, retry_after, deadline_at
+                    )
+                    if delay is None:
+                        break
+                    await asyncio.sleep(delay)
+
+            entries = _apply_pack_response(
+                plan, texts, pack, response, target_languages, None,
+                error=error, error_kind=error_kind, retry_after=retry_after
+            )
+            if cache is not None and entries:
+                await loop.run_in_executor(None, cache.put_many, entries)
+            _report()
+
+        async def _run_oversized(idx: int):
+            # Too large to share a request; translate on its own in a worker thread
+            async with semaphore:
+                results[idx] = await asyncio.to_thread(
+                    translate_with_retry,
+                    texts[idx], target_languages, plan["sources"][idx],
+                    max_retries=max_retries, retry_delay=retry_delay, use_cache=use_cache,
+                    max_delay=max_delay,
+                    deadline=max(0.0, deadline_at - time.monotonic()) if deadline_at is not None else None
+                )
+            _report()
+
+        await asyncio.gather(
+            *(_run_pack(pack) for pack in plan["packs"]),
+            *(_run_oversized(idx) for idx in plan["oversized"])
+        )
+        return _finish_batch(plan)
+
+
+def translate_many_sync(
+    texts: List[str],
+    target_languages: List[str] = None,
+    source_language: Union[Optional[str], List[Optional[str]]] = None,
+    **kwargs
+) -> List[Dict[str, Any]]:
+    """
+    Blocking wrapper around translate_many() for scripts and Streamlit pages.
+    Falls back to translator.translate_batch when aiohttp is not installed.
+
+    Returns:
+        List of translation result dictionaries, in input order
+    """
+    if aiohttp is None:
+        print("⚠️ aiohttp not installed, falling back to sequential batch translation")
+        kwargs.pop("max_concurrency", None)
+        kwargs.pop("progress_callback", None)
+        return translate_batch(texts, target_languages, source_language, **kwargs)
+
+    coroutine = translate_many(texts, target_languages, source_language, **kwargs)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    # Called from inside a running event loop: run on a separate thread
+    outcome: Dict[str, Any] = {}
+
+    def _runner():
+        try:
+            outcome["results"] = asyncio.run(coroutine)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=_runner)
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["results"]
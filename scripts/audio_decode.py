@@ -0,0 +1,214 @@
+"""
+Compressed Audio Decode Stage
+Decodes MP3/M4A/OGG/... with pydub (ffmpeg) on a process pool, normalizes
+the PCM to 16 kHz mono in the worker, and hands the buffers back through
+shared memory and a bounded queue, so decoding uses every core while the
+transcription stage consumes the results
+"""
+
+import os
+import io
+import queue
+import itertools
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+from audio_preprocess import PcmNormalizer, TARGET_SAMPLE_RATE
+
+try:
+    from pydub import AudioSegment
+except ImportError:
+    AudioSegment = None
+
+# Extensions routed through the decode stage (WAV is streamed as-is)
+COMPRESSED_AUDIO_EXTENSIONS = (".mp3", ".m4a", ".ogg", ".oga", ".opus", ".flac", ".aac", ".webm", ".wma")
+# Decoder processes (default: one per core)
+DECODE_MAX_WORKERS = int(os.getenv("AUDIO_DECODE_WORKERS", "0")) or os.cpu_count() or 1
+# Decoded buffers waiting for the transcription stage
+DECODE_QUEUE_SIZE = int(os.getenv("AUDIO_DECODE_QUEUE_SIZE", "4"))
+
+_DONE = object()
+
+
+def is_compressed_audio(name: str) -> bool:
+    """Whether a file name has an extension handled by the decode stage."""
+    return os.path.splitext(name)[1].lower() in COMPRESSED_AUDIO_EXTENSIONS
+
+
+class DecodedAudio:
+    """
+    16 kHz 16-bit mono PCM decoded by a worker process, living in shared
+    memory. Call release() once the PCM is no longer needed.
+    """
+
+    def __init__(self, index: int, name: str, source: Any, language: str,
+                 shm_name: Optional[str] = None, size: int = 0, error: Optional[str] = None):
+        self.index = index
+        self.name = name
+        self.source = source
+        self.language = language
+        self.error = error
+        self.size = size
+        self.audio_format = {"sample_rate": TARGET_SAMPLE_RATE, "channels": 1, "bits_per_sample": 16}
+        self._shm = shared_memory.SharedMemory(name=shm_name) if shm_name else None
+        self._released = False
+
+    @property
+    def pcm(self) -> memoryview:
+        """The decoded samples (valid until release())."""
+        if self._shm is None:
+            return memoryview(b"")
+        return self._shm.buf[:self.size]
+
+    @property
+    def duration(self) -> float:
+        """Length of the decoded audio in seconds."""
+        return self.size / (TARGET_SAMPLE_RATE * 2)
+
+    def release(self):
+        """Free the shared memory block and make room for the next decoded file."""
+        if self._released:
+            return
+        self._released = True
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+
+
+def decode_to_shared_memory(source: Any, name: str) -> Tuple[Optional[str], int]:
+    """
+    Process-pool worker: decode one file and leave 16 kHz mono PCM in a new
+    shared memory block.
+
+    Args:
+        source: Path, or the compressed file contents as bytes
+        name: File name (its extension tells ffmpeg the container)
+
+    Returns:
+        (shared memory block name, PCM byte count); (None, 0) for empty audio
+    """
+    if AudioSegment is None:
+        raise RuntimeError("pydub is required to decode compressed audio (pip install pydub; needs ffmpeg)")
+    container = os.path.splitext(name)[1].lstrip(".").lower() or None
+    segment = AudioSegment.from_file(io.BytesIO(source) if isinstance(source, bytes) else source,
+                                     format=container)
+
+    normalizer = PcmNormalizer(segment.frame_rate, segment.channels, segment.sample_width * 8)
+    pcm = normalizer.process(segment.raw_data) + normalizer.flush()
+    del segment
+    if not pcm:
+        return None, 0
+
+    shm = shared_memory.SharedMemory(create=True, size=len(pcm))
+    shm.buf[:len(pcm)] = pcm
+    shm.close()  # the parent attaches by name and unlinks it after use
+    return shm.name, len(pcm)
+
+
+def iter_decoded_audio(
+    jobs: Iterable[Tuple[int, str, Any, str]],
+    max_workers: int = DECODE_MAX_WORKERS,
+    queue_size: int = DECODE_QUEUE_SIZE
+) -> Iterator[DecodedAudio]:
+    """
+    Decode compressed files on a process pool and yield them as they finish.
+
+    At most max_workers files are decoding and queue_size decoded buffers
+    are waiting at any time, so memory stays bounded however long the batch.
+
+    Args:
+        jobs: (index, name, path or bytes-like contents, language) tuples
+        max_workers: Decoder processes
+        queue_size: Decoded buffers allowed to wait for the consumer
+
+    Yields:
+        DecodedAudio per job in completion order; failed decodes have
+        error set and no PCM. Release each one when done with it.
+    """
+    decoded: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, queue_size))
+    stop = threading.Event()
+    # Workers must share this process's resource tracker, or a worker exiting
+    # would unlink the blocks it created before they are consumed
+    resource_tracker.ensure_running()
+    executor = ProcessPoolExecutor(max_workers=max(1, max_workers))
+
+    def put(item) -> bool:
+        # Blocks while the queue is full (backpressure), but gives up once the consumer is gone
+        while not stop.is_set():
+            try:
+                decoded.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def collect(future, job) -> DecodedAudio:
+        index, name, source, language = job
+        try:
+            shm_name, size = future.result()
+        except Exception as e:
+            return DecodedAudio(index, name, source, language, error=f"Decoding failed: {str(e)}")
+        return DecodedAudio(index, name, source, language, shm_name, size)
+
+    def produce():
+        pending = {}
+        remaining = iter(jobs)
+        try:
+            for job in remaining:
+                if stop.is_set():
+                    return
+                while len(pending) >= max(1, max_workers):
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        item = collect(future, pending.pop(future))
+                        if not put(item):
+                            item.release()
+                            return
+                # Memoryviews (e.g. uploads) cannot be pickled to the worker
+                payload = job[2] if isinstance(job[2], str) else bytes(job[2])
+                try:
+                    future = executor.submit(decode_to_shared_memory, payload, job[1])
+                except Exception as e:
+                    # The pool takes no more work (e.g. BrokenProcessPool after a worker
+                    # crash): every job must still be reported, or the consumer waits forever
+                    for index, name, source, language in itertools.chain([job], remaining):
+                        if not put(DecodedAudio(index, name, source, language,
+                                                error=f"Decoding failed: {str(e)}")):
+                            return
+                    break
+                pending[future] = job
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = collect(future, pending.pop(future))
+                    if not put(item):
+                        item.release()
+                        return
+        finally:
+            for future, job in pending.items():
+                if not future.cancel() and future.exception() is None:
+                    collect(future, job).release()  # finished after the consumer left
+            put(_DONE)
+
+    producer = threading.Thread(target=produce, daemon=True, name="audio-decode")
+    producer.start()
+    try:
+        while True:
+            item = decoded.get()
+            if item is _DONE:
+                break
+            yield item
+    finally:
+        stop.set()
+        while True:  # free buffers the consumer never took
+            try:
+                item = decoded.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _DONE:
+                item.release()
+        producer.join()
+        executor.shutdown(wait=True, cancel_futures=True)
+
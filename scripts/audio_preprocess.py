@@ -0,0 +1,206 @@
+"""
+Audio Normalization Stage
+Converts incoming PCM (any rate, channel count, 8/16/24/32-bit) to 16 kHz
+16-bit mono before it is sent to the recognizer. Runs chunk by chunk with
+a polyphase FIR resampler, so memory stays bounded for any file length.
+"""
+
+import os
+from math import gcd
+from typing import Dict, Iterable, Iterator, Tuple
+
+import numpy as np
+
+TARGET_SAMPLE_RATE = 16000
+# Set AUDIO_NORMALIZE=0 to send audio to the recognizer unchanged
+AUDIO_NORMALIZE = os.getenv("AUDIO_NORMALIZE", "1").lower() not in ("0", "false", "no")
+# Filter taps per polyphase branch: higher is sharper and slower
+RESAMPLER_TAPS_PER_PHASE = int(os.getenv("AUDIO_RESAMPLER_TAPS", "32"))
+
+
+def design_lowpass(up: int, down: int, taps_per_phase: int = RESAMPLER_TAPS_PER_PHASE,
+                   beta: float = 8.0) -> np.ndarray:
+    """
+    Kaiser-windowed sinc anti-aliasing filter for resampling by up/down.
+
+    Returns:
+        Filter of length taps_per_phase * up, scaled by up to keep unity gain.
+        The designed part has odd length (zero-padded at the end) so its
+        center falls on a whole sample at (length - 1) // 2.
+    """
+    length = taps_per_phase * up
+    designed = length - 1 if length % 2 == 0 else length
+    cutoff = 0.5 / max(up, down)  # cycles per sample at the upsampled rate
+    n = np.arange(designed) - (designed - 1) / 2
+    taps = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(designed, beta)
+    taps = np.concatenate([taps * (up / taps.sum()), np.zeros(length - designed)])
+    return taps.astype(np.float32)
+
+
+class PolyphaseResampler:
+    """
+    Streaming rational resampler (out_rate / in_rate = up / down).
+    Only the outputs actually needed are computed: each one is a dot
+    product between one polyphase branch and the latest input samples.
+    """
+
+    def __init__(self, in_rate: int, out_rate: int, taps_per_phase: int = RESAMPLER_TAPS_PER_PHASE):
+        divisor = gcd(in_rate, out_rate)
+        self.up = out_rate // divisor
+        self.down = in_rate // divisor
+        taps = design_lowpass(self.up, self.down, taps_per_phase)
+        self.taps_per_phase = taps_per_phase
+        # branches[p, j] = taps[p + j * up]; reversed so windows read oldest -> newest
+        self.branches = taps.reshape(taps_per_phase, self.up).T[:, ::-1].copy()
+        # Center the filter so output is not delayed relative to input
+        self.delay = (len(taps) - 1) // 2 if len(taps) % 2 else (len(taps) - 2) // 2
+        self.history = np.zeros(taps_per_phase - 1, dtype=np.float32)
+        self.consumed = 0     # input samples seen so far
+        self.produced = 0     # output samples emitted so far
+
+    def _emit(self, samples: np.ndarray, limit: int) -> np.ndarray:
+        """Produce outputs whose filter window ends within the buffered input (capped at limit)."""
+        buffer = np.concatenate([self.history, samples])
+        start = self.consumed - len(self.history)  # input index of buffer[0]
+        self.consumed += len(samples)
+
+        # Output n sits at upsampled position n * down + delay and needs
+        # input up to index (n * down + delay) // up
+        available = (self.consumed * self.up - 1 - self.delay) // self.down + 1
+        count = max(0, min(available, limit) - self.produced)
+        out = np.empty(0, dtype=np.float32)
+        if count:
+            positions = (self.produced + np.arange(count)) * self.down + self.delay
+            bases = positions // self.up
+            phases = positions % self.up
+            windows = np.lib.stride_tricks.sliding_window_view(buffer, self.taps_per_phase)
+            rows = bases - start - (self.taps_per_phase - 1)
+            out = np.einsum("ij,ij->i", windows[rows], self.branches[phases])
+            self.produced += count
+
+        keep = self.taps_per_phase - 1
+        self.history = buffer[-keep:] if keep else buffer[:0]
+        return out
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Resample one chunk of float32 mono samples."""
+        return self._emit(samples.astype(np.float32, copy=False), limit=np.iinfo(np.int64).max)
+
+    def flush(self) -> np.ndarray:
+        """Emit the remaining outputs at the end of the stream."""
+        total = -(-self.consumed * self.up // self.down)  # ceil(consumed * up / down)
+        padding = np.zeros(self.taps_per_phase + self.delay // self.up + 1, dtype=np.float32)
+        consumed = self.consumed
+        out = self._emit(padding, limit=total)
+        self.consumed = consumed
+        return out
+
+
+def _decode(frames: memoryview, bits_per_sample: int, channels: int) -> np.ndarray:
+    """Interleaved PCM bytes -> float32 mono in [-1, 1)."""
+    if bits_per_sample == 8:
+        samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif bits_per_sample == 16:
+        samples = np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768
+    elif bits_per_sample == 24:
+        raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        values = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        samples = (values - ((values & 0x800000) << 1)).astype(np.float32) / 8388608
+    elif bits_per_sample == 32:
+        samples = np.frombuffer(frames, dtype="<i4").astype(np.float32) / 2147483648
+    else:
+        raise ValueError(f"Unsupported PCM sample width: {bits_per_sample} bits")
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    return samples
+
+
+def _encode(samples: np.ndarray) -> bytes:
+    """float32 [-1, 1) -> 16-bit little-endian PCM bytes."""
+    return np.clip(np.round(samples * 32768), -32768, 32767).astype("<i2").tobytes()
+
+
+class PcmNormalizer:
+    """
+    Chunk-by-chunk converter from arbitrary PCM to 16 kHz 16-bit mono.
+    Chunks may split frames; the remainder is carried to the next call.
+    """
+
+    def __init__(self, sample_rate: int, channels: int, bits_per_sample: int,
+                 target_rate: int = TARGET_SAMPLE_RATE):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.bits_per_sample = bits_per_sample
+        self.target_rate = target_rate
+        self.frame_bytes = channels * bits_per_sample // 8
+        self.resampler = PolyphaseResampler(sample_rate, target_rate) if sample_rate != target_rate else None
+        self._remainder = b""
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    @property
+    def needs_conversion(self) -> bool:
+        """False when the input already is 16 kHz 16-bit mono."""
+        return (self.sample_rate, self.channels, self.bits_per_sample) != (self.target_rate, 1, 16)
+
+    def process(self, chunk) -> bytes:
+        """Convert one chunk of raw PCM bytes."""
+        self.bytes_in += len(chunk)
+        if not self.needs_conversion:
+            self.bytes_out += len(chunk)
+            return bytes(chunk)
+        if self._remainder:
+            chunk = self._remainder + bytes(chunk)
+        whole = len(chunk) - len(chunk) % self.frame_bytes
+        self._remainder = bytes(chunk[whole:])
+        samples = _decode(memoryview(chunk)[:whole], self.bits_per_sample, self.channels)
+        if self.resampler is not None:
+            samples = self.resampler.process(samples)
+        out = _encode(samples)
+        self.bytes_out += len(out)
+        return out
+
+    def flush(self) -> bytes:
+        """Emit whatever the resampler still holds at end of stream."""
+        if self.resampler is None:
+            return b""
+        out = _encode(self.resampler.flush())
+        self.bytes_out += len(out)
+        return out
+
+
+def normalize_pcm_chunks(header: Dict[str, int], chunks: Iterable) -> Tuple[Dict[str, int], Iterator[bytes]]:
+    """
+    Wrap a PCM chunk iterator (see audio_utils.iter_pcm_chunks) so it
+    yields 16 kHz 16-bit mono. Input already in that format passes through.
+
+    Returns:
+        (header describing the output, chunk iterator)
+    """
+    normalizer = PcmNormalizer(header["sample_rate"], header["channels"], header["bits_per_sample"])
+    if not AUDIO_NORMALIZE or not normalizer.needs_conversion:
+        return header, iter(chunks)
+
+    def _converted() -> Iterator[bytes]:
+        for chunk in chunks:
+            out = normalizer.process(chunk)
+            if out:
+                yield out
+        tail = normalizer.flush()
+        if tail:
+            yield tail
+
+    data_size = 0
+    if header["data_size"]:
+        frames = header["data_size"] // normalizer.frame_bytes
+        data_size = -(-frames * TARGET_SAMPLE_RATE // header["sample_rate"]) * 2
+    out_header = dict(header, sample_rate=TARGET_SAMPLE_RATE, channels=1, bits_per_sample=16,
+                      data_size=data_size)
+    return out_header, _converted()
+
+
+def needs_normalization(header: Dict[str, int]) -> bool:
+    """Whether audio described by a parse_wav_header() result would be converted."""
+    return AUDIO_NORMALIZE and (
+        header["sample_rate"], header["channels"], header["bits_per_sample"]
+    ) != (TARGET_SAMPLE_RATE, 1, 16)
@@ -0,0 +1,197 @@
+"""
+Audio Utilities
+WAV header parsing and PCM chunking over bytes-like and file-like inputs
+without copying the audio payload, and progressive WAV writing for audio
+that arrives in chunks
+"""
+
+import struct
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple, Union
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# Headers larger than this are rejected (guards against reading a whole non-WAV stream)
+MAX_HEADER_BYTES = 1024 * 1024
+# RIFF and data chunk size written while the final length is still unknown
+WAV_UNKNOWN_SIZE = 0xFFFFFFFF
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class WavFormatError(ValueError):
+    """Raised when input is not a PCM RIFF/WAVE stream."""
+
+
+def parse_wav_header(data: BytesLike) -> Dict[str, int]:
+    """
+    Parse a RIFF/WAVE header using memoryview slicing (no copies).
+
+    Args:
+        data: The start of the WAV file; must include the "data" chunk header
+
+    Returns:
+        Dictionary with sample_rate, channels, bits_per_sample, data_offset
+        (byte offset of the PCM payload) and data_size (0 if unknown)
+
+    Raises:
+        WavFormatError: Not a RIFF/WAVE file, not PCM, or header incomplete
+    """
+    view = memoryview(data).cast("B")
+    if len(view) < 12 or view[0:4] != b"RIFF" or view[8:12] != b"WAVE":
+        raise WavFormatError("Not a RIFF/WAVE file")
+
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(view):
+        chunk_id = view[offset:offset + 4]
+        (chunk_size,) = struct.unpack_from("<I", view, offset + 4)
+        body = offset + 8
+        if chunk_id == b"fmt ":
+            if body + 16 > len(view):
+                break
+            format_tag, channels, sample_rate, _, _, bits = struct.unpack_from("<HHIIHH", view, body)
+            if format_tag == WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40 and body + 26 <= len(view):
+                (format_tag,) = struct.unpack_from("<H", view, body + 24)  # SubFormat GUID prefix
+            if format_tag != WAVE_FORMAT_PCM:
+                raise WavFormatError(f"Unsupported WAV encoding (format tag {format_tag:#06x}); PCM required")
+            fmt = {"sample_rate": sample_rate, "channels": channels, "bits_per_sample": bits}
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise WavFormatError("WAV data chunk before fmt chunk")
+            # Streaming writers leave 0 or 0xFFFFFFFF when the length is unknown
+            data_size = 0 if chunk_size in (0, WAV_UNKNOWN_SIZE) else chunk_size
+            return dict(fmt, data_offset=body, data_size=data_size)
+        offset = body + chunk_size + (chunk_size & 1)  # chunks are word aligned
+    raise WavFormatError("Incomplete WAV header")
+
+
+def iter_pcm_chunks(
+    source: Union[BytesLike, BinaryIO],
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Tuple[Dict[str, int], Iterator[memoryview]]:
+    """
+    Split a WAV into its format and an iterator of PCM payload chunks.
+
+    Bytes-like input is sliced in place. File-like input is read with
+    readinto() into a reused buffer, so each yielded memoryview is only
+    valid until the next one is requested.
+
+    Args:
+        source: WAV bytes/bytearray/memoryview, or a binary file-like object
+        chunk_size: PCM bytes per chunk
+
+    Returns:
+        (header dictionary from parse_wav_header, chunk iterator)
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source).cast("B")
+        header = parse_wav_header(view)
+        end = len(view)
+        if header["data_size"]:
+            end = min(end, header["data_offset"] + header["data_size"])
+
+        def _slices() -> Iterator[memoryview]:
+            for start in range(header["data_offset"], end, chunk_size):
+                yield view[start:min(start + chunk_size, end)]
+
+        return header, _slices()
+
+    # File-like: grow a prefix buffer until the header parses
+    prefix = bytearray()
+    while True:
+        block = source.read(4096)
+        if block:
+            prefix += block
+        try:
+            header = parse_wav_header(prefix)
+            break
+        except WavFormatError as e:
+            if not block or len(prefix) > MAX_HEADER_BYTES or str(e) != "Incomplete WAV header":
+                raise
+
+    def _reads() -> Iterator[memoryview]:
+        remaining = header["data_size"] or None
+        leftover = memoryview(prefix)[header["data_offset"]:]
+        if remaining is not None:
+            leftover = leftover[:remaining]
+            remaining -= len(leftover)
+        if len(leftover):
+            yield leftover
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        while remaining is None or remaining > 0:
+            wanted = chunk_size if remaining is None else min(chunk_size, remaining)
+            if hasattr(source, "readinto"):
+                n = source.readinto(view[:wanted])
+            else:
+                block = source.read(wanted)
+                n = len(block)
+                view[:n] = block
+            if not n:
+                break
+            if remaining is not None:
+                remaining -= n
+            yield view[:n]
+
+    return header, _reads()
+
+
+def read_wav_header(path: str) -> Dict[str, int]:
+    """parse_wav_header() for a file on disk, reading only as much as the header needs."""
+    with open(path, "rb") as f:
+        header, _ = iter_pcm_chunks(f)
+    return header
+
+
+def build_wav_header(data_size: Optional[int], sample_rate: int = 16000, channels: int = 1,
+                     bits_per_sample: int = 16) -> bytes:
+    """
+    44-byte canonical PCM RIFF/WAVE header for a payload of data_size bytes
+    (None = length not known yet: both sizes are WAV_UNKNOWN_SIZE).
+    """
+    block_align = channels * bits_per_sample // 8
+    riff_size = WAV_UNKNOWN_SIZE if data_size is None else 36 + data_size
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", riff_size, b"WAVE",
+        b"fmt ", 16, WAVE_FORMAT_PCM, channels, sample_rate, sample_rate * block_align, block_align, bits_per_sample,
+        b"data", WAV_UNKNOWN_SIZE if data_size is None else data_size
+    )
+
+
+class ProgressiveWavWriter:
+    """
+    Writes a WAV file chunk by chunk as audio arrives, so it can be played
+    while still growing. The header carries unknown (0xFFFFFFFF) sizes,
+    which players read as "until end of file", until close() patches in
+    the real sizes.
+    """
+
+    def __init__(self, path: str, sample_rate: int = 16000, channels: int = 1, bits_per_sample: int = 16):
+        self.path = path
+        self.format = (sample_rate, channels, bits_per_sample)
+        self.data_size = 0
+        self._file: BinaryIO = open(path, "wb")
+        self._file.write(build_wav_header(None, *self.format))
+        self._file.flush()
+
+    def write(self, chunk: BytesLike):
+        """Append PCM and flush it to disk."""
+        self._file.write(chunk)
+        self._file.flush()
+        self.data_size += len(chunk)
+
+    def close(self):
+        """Patch the header with the final sizes and close the file."""
+        if self._file.closed:
+            return
+        self._file.seek(0)
+        self._file.write(build_wav_header(self.data_size, *self.format))
+        self._file.close()
+
+    def __enter__(self) -> "ProgressiveWavWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
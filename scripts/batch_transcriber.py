@@ -0,0 +1,283 @@
+"""
+Parallel Batch Transcription Engine
+Runs several file recognitions at once on a bounded worker pool, yields
+results as they finish and returns them in deterministic filename order
+"""
+
+import os
+import time
+import queue
+import hashlib
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from audio_decode import DecodedAudio, is_compressed_audio, iter_decoded_audio
+from speech_resources import STT_SESSION_LIMIT, get_session_slots
+from stt_cache import get_stt_cache, hash_audio_file
+from transcribe_files import TRANSCRIBE_TIMEOUT, transcribe_bytes, transcribe_file_result, transcribe_pcm
+
+# Recognitions run concurrently per batch
+STT_MAX_WORKERS = int(os.getenv("AZURE_SPEECH_MAX_WORKERS", "8"))
+
+# A job is a path, (path, language), or (name, WAV bytes, language) for in-memory audio.
+# Compressed formats (by extension: MP3, M4A, OGG, ...) are decoded on a process pool first.
+Job = Union[str, Tuple[str, str], Tuple[str, Union[bytes, memoryview], str]]
+
+
+def _normalize_jobs(jobs: Sequence[Job], language: str) -> List[Tuple[str, Any, str]]:
+    """Turn every job into (name, path or WAV bytes, language)."""
+    normalized = []
+    for job in jobs:
+        if isinstance(job, str):
+            normalized.append((job, job, language))
+        elif len(job) == 2:
+            normalized.append((job[0], job[0], job[1] or language))
+        else:
+            normalized.append((job[0], job[1], job[2] or language))
+    return normalized
+
+
+def _transcribe_job(index: int, name: str, source: Any, language: str, continuous: bool,
+                    timeout: Optional[float], use_cache: bool, split: bool = False) -> Dict:
+    queued_at = time.perf_counter()
+    # Split jobs take one session slot per piece instead; holding one here as
+    # well could leave every slot held by a file waiting on its own pieces
+    with nullcontext() if split else get_session_slots():
+        started_at = time.perf_counter()
+        if isinstance(source, str):
+            outcome = transcribe_file_result(
+                source, language, continuous=continuous, timeout=timeout, use_cache=use_cache, split=split
+            )
+        else:
+            # In-memory audio is always transcribed continuously (or split)
+            outcome = transcribe_bytes(source, language, timeout=timeout, use_cache=use_cache, name=name,
+                                       split=split)
+    finished_at = time.perf_counter()
+    return _job_result(index, name, source, language, outcome, started_at - queued_at, finished_at - started_at)
+
+
+def _job_result(index: int, name: str, source: Any, language: str, outcome: Dict,
+                wait_seconds: float = 0.0, elapsed_seconds: float = 0.0) -> Dict:
+    """Batch result dictionary for one job from a transcribe_file_result()-style outcome."""
+    return {
+        "index": index,
+        "filename": os.path.basename(name),
+        "path": source if isinstance(source, str) else None,
+        "language": language,
+        "transcript": outcome["transcript"],
+        "status": outcome["status"],
+        "success": outcome["status"] in ("ok", "partial"),
+        "error": outcome["error"],
+        "segments": outcome["segments"],
+        "cached": outcome["cached"],
+        "audio_sha256": outcome["audio_sha256"],
+        "wait_seconds": round(wait_seconds, 3),
+        "elapsed_seconds": round(elapsed_seconds, 3),
+    }
+
+
+def _error_outcome(error: str, audio_sha256: Optional[str] = None) -> Dict:
+    return {"transcript": "", "status": "error", "error": error, "segments": [],
+            "cached": False, "audio_sha256": audio_sha256}
+
+
+def _transcribe_decoded_job(decoded: DecodedAudio, timeout: Optional[float],
+                            audio_sha256: Optional[str], decoded_slots: threading.BoundedSemaphore) -> Dict:
+    queued_at = time.perf_counter()
+    try:
+        with get_session_slots():
+            started_at = time.perf_counter()
+            if decoded.error:
+                outcome = _error_outcome(decoded.error, audio_sha256)
+            else:
+                outcome = transcribe_pcm(decoded.pcm, decoded.audio_format, decoded.language, timeout=timeout,
+                                         name=decoded.name, audio_sha256=audio_sha256)
+    finally:
+        decoded.release()
+        decoded_slots.release()
+    finished_at = time.perf_counter()
+    return _job_result(decoded.index, decoded.name, decoded.source, decoded.language, outcome,
+                       started_at - queued_at, finished_at - started_at)
+
+
+def _feed_decoded_jobs(jobs: List[Tuple[int, str, Any, str]], submit: Callable, results: "queue.Queue",
+                       stop: threading.Event, max_buffers: int, timeout: Optional[float], use_cache: bool):
+    """
+    Decode-stage driver (runs on its own thread): answers cached files
+    directly, decodes the rest on the process pool and submits each decoded
+    buffer for transcription. At most max_buffers decoded files are being
+    transcribed at once; the decoder's bounded queue holds back the rest.
+    """
+    cache = get_stt_cache() if use_cache else None
+    decoded_slots = threading.BoundedSemaphore(max_buffers)
+    hashes: Dict[int, Optional[str]] = {}
+    reported = set()
+
+    def report(index: int, name: str, source: Any, language: str, outcome: Dict):
+        reported.add(index)
+        results.put(_job_result(index, name, source, language, outcome))
+
+    def to_decode() -> Iterator[Tuple[int, str, Any, str]]:
+        # Runs on the decoder's producer thread: files already in the STT cache are never decoded
+        for index, name, source, language in jobs:
+            if stop.is_set():
+                return
+            audio_sha256 = None
+            if cache is not None:
+                try:
+                    audio_sha256 = (hash_audio_file(source) if isinstance(source, str)
+                                    else hashlib.sha256(source).hexdigest())
+                except OSError as e:
+                    report(index, name, source, language, _error_outcome(f"Error: {str(e)}"))
+                    continue
+                cached = cache.get(audio_sha256, language, "continuous")
+                if cached is not None:
+                    report(index, name, source, language, dict(cached, cached=True, audio_sha256=audio_sha256))
+                    continue
+            hashes[index] = audio_sha256
+            yield index, name, source, language
+
+    decoded_items = iter_decoded_audio(to_decode())
+    try:
+        for decoded in decoded_items:
+            while not decoded_slots.acquire(timeout=0.1):
+                if stop.is_set():
+                    break
+            if stop.is_set():
+                decoded.release()
+                return
+            reported.add(decoded.index)
+            submit(
+                (decoded.index, decoded.name, decoded.source, decoded.language),
+                _transcribe_decoded_job, decoded, timeout, hashes.get(decoded.index), decoded_slots,
+                on_cancel=lambda decoded=decoded: (decoded.release(), decoded_slots.release())
+            )
+        if not stop.is_set():
+            # The decoder stopped early (e.g. its producer thread failed): fail what it never returned
+            for index, name, source, language in jobs:
+                if index not in reported:
+                    report(index, name, source, language, _error_outcome("Error: decoding stopped unexpectedly"))
+    except Exception as e:
+        # Every job must produce a result, or the consumer would wait forever
+        for index, name, source, language in jobs:
+            if index not in reported:
+                report(index, name, source, language, _error_outcome(f"Error: {str(e)}"))
+    finally:
+        decoded_items.close()
+
+
+def iter_transcriptions(
+    jobs: Sequence[Job],
+    language: str = "en-US",
+    max_workers: int = STT_MAX_WORKERS,
+    continuous: bool = True,
+    timeout: Optional[float] = TRANSCRIBE_TIMEOUT,
+    use_cache: bool = True,
+    split: bool = False
+) -> Iterator[Dict]:
+    """
+    Transcribe files concurrently and yield each result as soon as it is done.
+
+    Args:
+        jobs: File paths, (path, language) pairs or (name, audio bytes, language)
+            triples; MP3/M4A/OGG/... are decoded on a process pool first
+            (see audio_decode) and always transcribed continuously
+        language: Recognition language for jobs that do not name one
+        max_workers: Recognitions in flight (capped by STT_SESSION_LIMIT)
+        continuous: Transcribe whole files (False = first utterance only)
+        timeout: Seconds allowed per file
+        use_cache: Set False to re-transcribe files already in the STT cache
+        split: Cut each file at silences and transcribe its pieces in parallel too
+
+    Yields:
+        Result dictionaries in completion order, with index (position in
+        jobs), filename, transcript, status, error, cached and per-file timing
+    """
+    jobs = _normalize_jobs(jobs, language)
+    if not jobs:
+        return
+    workers = max(1, min(max_workers, STT_SESSION_LIMIT, len(jobs)))
+    compressed = [(index, *job) for index, job in enumerate(jobs) if is_compressed_audio(job[0])]
+
+    # Finished futures and ready-made results (cache hits, decode failures) arrive here
+    results: "queue.Queue[Any]" = queue.Queue()
+    stop = threading.Event()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stt") as executor:
+        futures = {}
+
+        def submit(job, fn, *args, on_cancel=None):
+            future = executor.submit(fn, *args)
+            futures[future] = job
+            if on_cancel is not None:
+                future.add_done_callback(lambda f: on_cancel() if f.cancelled() else None)
+            future.add_done_callback(results.put)
+
+        for index, (name, source, job_language) in enumerate(jobs):
+            if not is_compressed_audio(name):
+                submit((index, name, source, job_language), _transcribe_job,
+                       index, name, source, job_language, continuous, timeout, use_cache, split)
+
+        decoder = None
+        if compressed:
+            # Compressed audio is always transcribed continuously, without splitting
+            decoder = threading.Thread(
+                target=_feed_decoded_jobs, name="stt-decode", daemon=True,
+                args=(compressed, submit, results, stop, workers, timeout, use_cache)
+            )
+            decoder.start()
+
+        try:
+            for _ in range(len(jobs)):
+                item = results.get()
+                if isinstance(item, dict):
+                    yield item
+                    continue
+                try:
+                    yield item.result()
+                except Exception as e:
+                    index, name, source, job_language = futures[item]
+                    yield _job_result(index, name, source, job_language, _error_outcome(f"Error: {str(e)}"))
+        finally:
+            # Consumer stopped early: drop jobs that have not started yet
+            stop.set()
+            if decoder is not None:
+                decoder.join()
+            for future in list(futures):
+                future.cancel()
+
+
+def transcribe_batch(
+    jobs: Sequence[Job],
+    language: str = "en-US",
+    max_workers: int = STT_MAX_WORKERS,
+    continuous: bool = True,
+    timeout: Optional[float] = TRANSCRIBE_TIMEOUT,
+    use_cache: bool = True,
+    progress_callback: Optional[Callable[[int, int, Dict], None]] = None,
+    split: bool = False
+) -> List[Dict]:
+    """
+    Transcribe files concurrently and collect the results.
+
+    Args:
+        jobs: File paths, (path, language) pairs or (name, WAV bytes, language) triples
+        language: Recognition language for jobs that do not name one
+        max_workers: Recognitions in flight (capped by STT_SESSION_LIMIT)
+        continuous: Transcribe whole files (False = first utterance only)
+        timeout: Seconds allowed per file
+        use_cache: Set False to re-transcribe files already in the STT cache
+        progress_callback: Optional callable(done, total, result) per finished file
+        split: Cut each file at silences and transcribe its pieces in parallel too
+
+    Returns:
+        Result dictionaries sorted by filename (then input position)
+    """
+    results = []
+    for result in iter_transcriptions(jobs, language, max_workers, continuous, timeout, use_cache, split):
+        results.append(result)
+        if progress_callback is not None:
+            progress_callback(len(results), len(jobs), result)
+    return sorted(results, key=lambda r: (r["filename"], r["index"]))
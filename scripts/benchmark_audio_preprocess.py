@@ -0,0 +1,81 @@
+"""
+Audio Normalization Benchmark
+Measures how many bytes the 16 kHz mono normalization stage saves and how
+long it takes per minute of audio, on synthetic speech-band signals.
+
+    python benchmark_audio_preprocess.py --seconds 120
+"""
+
+import sys
+import time
+import argparse
+
+import numpy as np
+
+from audio_preprocess import PcmNormalizer, TARGET_SAMPLE_RATE
+from audio_utils import DEFAULT_CHUNK_SIZE
+
+# (label, sample rate, channels, bits per sample)
+FORMATS = [
+    ("48 kHz stereo 16-bit", 48000, 2, 16),
+    ("44.1 kHz stereo 16-bit", 44100, 2, 16),
+    ("48 kHz mono 24-bit", 48000, 1, 24),
+    ("22.05 kHz mono 16-bit", 22050, 1, 16),
+    ("16 kHz mono 16-bit", 16000, 1, 16),
+]
+
+
+def synth_pcm(seconds: float, sample_rate: int, channels: int, bits: int) -> bytes:
+    """Speech-like test signal: a few harmonics with noise, as interleaved PCM."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    signal = sum(0.2 / k * np.sin(2 * np.pi * 180 * k * t) for k in range(1, 8))
+    signal = signal + 0.02 * rng.standard_normal(len(t))
+    frames = np.repeat(signal[:, None], channels, axis=1).ravel()
+    if bits == 16:
+        return (frames * 32767).astype("<i2").tobytes()
+    if bits == 24:
+        values = (frames * 8388607).astype("<i4")
+        return values.view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+    raise ValueError(bits)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark 16 kHz mono audio normalization")
+    parser.add_argument("--seconds", type=float, default=60.0, help="Audio length per format")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="PCM bytes per chunk")
+    args = parser.parse_args()
+
+    print("⏱️  AUDIO NORMALIZATION BENCHMARK")
+    print("=" * 78)
+    print(f"🎚️ Target: {TARGET_SAMPLE_RATE} Hz mono 16-bit  |  {args.seconds:g}s per format  |  "
+          f"{args.chunk_size // 1024} KB chunks\n")
+    print(f"{'Input format':<24} {'In (MB)':>9} {'Out (MB)':>9} {'Saved':>7} {'ms / audio min':>15} {'x realtime':>11}")
+
+    total_in = total_out = 0
+    for label, rate, channels, bits in FORMATS:
+        pcm = synth_pcm(args.seconds, rate, channels, bits)
+        normalizer = PcmNormalizer(rate, channels, bits)
+        view = memoryview(pcm)
+
+        start = time.perf_counter()
+        out_bytes = 0
+        for offset in range(0, len(view), args.chunk_size):
+            out_bytes += len(normalizer.process(view[offset:offset + args.chunk_size]))
+        out_bytes += len(normalizer.flush())
+        elapsed = time.perf_counter() - start
+
+        total_in += len(pcm)
+        total_out += out_bytes
+        saved = 1 - out_bytes / len(pcm)
+        per_minute_ms = elapsed / (args.seconds / 60) * 1000
+        print(f"{label:<24} {len(pcm) / 1e6:9.2f} {out_bytes / 1e6:9.2f} {saved:7.0%} "
+              f"{per_minute_ms:15.1f} {args.seconds / elapsed if elapsed else float('inf'):11.0f}")
+
+    print(f"\n📦 Uploaded bytes: {total_in / 1e6:.1f} MB → {total_out / 1e6:.1f} MB "
+          f"({1 - total_out / total_in:.0%} saved)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
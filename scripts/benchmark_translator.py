@@ -0,0 +1,70 @@
+"""
+Translator Benchmark
+Measures the translation paths against the local mock Translator server,
+so performance changes can be compared without Azure keys.
+
+    python benchmark_translator.py --rows 500 --latency lognormal:80,0.4
+"""
+
+import os
+import sys
+import time
+import argparse
+
+from mock_translator_server import start_mock_server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark translator.py against the mock server")
+    parser.add_argument("--rows", type=int, default=200, help="Number of transcripts to translate")
+    parser.add_argument("--languages", default="hi,te,es,fr,de", help="Comma-separated target languages")
+    parser.add_argument("--latency", default="lognormal:60,0.4", help="Mock server latency spec")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of 429 responses")
+    parser.add_argument("--sequential-rows", type=int, default=50,
+                        help="Rows to time through the one-request-per-row path")
+    args = parser.parse_args()
+
+    server = start_mock_server(latency=args.latency, throttle_rate=args.throttle_rate, retry_after=0.2)
+
+    # Configure before importing translator: it reads endpoint/credentials from env
+    os.environ["AZURE_TRANSLATOR_ENDPOINT"] = server.url
+    os.environ["AZURE_TRANSLATOR_KEY"] = "mock"
+    os.environ["AZURE_TRANSLATOR_REGION"] = "mock"
+    os.environ["TRANSLATION_CACHE_ENABLED"] = "0"
+    os.environ["AZURE_TRANSLATOR_CHARS_PER_SECOND"] = "0"
+
+    from translator import translate_with_retry, translate_batch
+    from async_translator import translate_many_sync
+
+    languages = args.languages.split(",")
+    texts = [f"Transcript number {i}: the quick brown fox jumps over the lazy dog." for i in range(args.rows)]
+
+    print("⏱️  TRANSLATOR BENCHMARK (mock server)")
+    print("=" * 60)
+    print(f"🌐 Endpoint: {server.url}  latency={args.latency}  429 rate={args.throttle_rate:.0%}")
+    print(f"📝 Rows: {args.rows}  Targets: {', '.join(languages)}\n")
+
+    def _report(name, rows, elapsed, results):
+        ok = sum(1 for r in results if r["success"])
+        print(f"{name:<28} {elapsed:7.2f}s  {rows / elapsed:8.1f} rows/s  ({ok}/{rows} ok)")
+
+    sequential = texts[:args.sequential_rows]
+    start = time.perf_counter()
+    results = [translate_with_retry(text, languages, "en") for text in sequential]
+    _report("translate_with_retry (seq)", len(sequential), time.perf_counter() - start, results)
+
+    start = time.perf_counter()
+    results = translate_batch(texts, languages, "en")
+    _report("translate_batch", len(texts), time.perf_counter() - start, results)
+
+    start = time.perf_counter()
+    results = translate_many_sync(texts, languages, "en")
+    _report("translate_many (async)", len(texts), time.perf_counter() - start, results)
+
+    print(f"\n📊 Server stats: {server.snapshot_stats()}")
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
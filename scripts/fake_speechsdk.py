@@ -0,0 +1,688 @@
+"""
+Fake Azure Speech SDK Backend
+Offline stand-in for the subset of azure.cognitiveservices.speech used by
+this project. Select it with SPEECH_BACKEND=fake (see speech_backend.py).
+
+- Recognition reads the transcript from a sidecar text file next to the
+  WAV (<name>.wav.txt or <name>.txt) and reports sentence offsets spread
+  over the WAV's real duration. Audio pushed through PushAudioInputStream
+  is matched (original or 16 kHz mono normalized PCM) against the WAVs in
+  FAKE_SPEECH_SAMPLES_DIR (default: speech_samples/) and uses their
+  sidecars; a pushed slice of a sample (e.g. a VAD-split piece) is located
+  by sample offset and gets the sentences that fall inside it, with
+  offsets relative to the slice.
+  With word-level timestamps requested, results carry a detailed JSON
+  payload (result.json) whose word timings are spread over the sentence.
+- Synthesis returns deterministic 16 kHz 16-bit mono PCM (RIFF WAV, or raw
+  PCM with the Raw16Khz16BitMonoPcm output format) derived from the text,
+  and writes it to AudioOutputConfig(filename=...) if given. Audio is
+  produced in 100 ms chunks (synthesizing events); start_speaking_text_async()
+  returns once the first chunk is ready and AudioDataStream reads the rest
+  as it is produced.
+
+Latency is configurable with FAKE_SPEECH_LATENCY_MS (per call, plus the
+same again for connection setup on first use unless Connection.open()
+warmed it), FAKE_SPEECH_REALTIME_FACTOR (continuous recognition pacing;
+0 = instant) and FAKE_TTS_REALTIME_FACTOR (synthesis time per second of
+audio produced; 0 = instant).
+"""
+
+import os
+import io
+import re
+import json
+import math
+import time
+import wave
+import uuid
+import hashlib
+import ctypes
+import queue
+import threading
+from array import array
+from enum import Enum
+from types import SimpleNamespace
+from typing import Callable, List, Optional
+
+FAKE_SPEECH_LATENCY_MS = float(os.getenv("FAKE_SPEECH_LATENCY_MS", "50"))
+FAKE_SPEECH_REALTIME_FACTOR = float(os.getenv("FAKE_SPEECH_REALTIME_FACTOR", "0"))
+FAKE_TTS_MS_PER_CHAR = float(os.getenv("FAKE_TTS_MS_PER_CHAR", "60"))
+FAKE_TTS_REALTIME_FACTOR = float(os.getenv("FAKE_TTS_REALTIME_FACTOR", "0"))
+FAKE_TTS_CHUNK_MS = 100
+# Relative paths are taken from the repository root, like the default
+FAKE_SPEECH_SAMPLES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    os.getenv("FAKE_SPEECH_SAMPLES_DIR", "speech_samples")
+)
+
+SAMPLE_RATE = 16000
+TICKS_PER_SECOND = 10_000_000  # SDK offsets/durations are in 100 ns ticks
+
+
+class ResultReason(Enum):
+    NoMatch = 0
+    Canceled = 1
+    RecognizingSpeech = 2
+    RecognizedSpeech = 3
+    SynthesizingAudio = 8
+    SynthesizingAudioCompleted = 9
+    SynthesizingAudioStarted = 11
+
+
+class CancellationReason(Enum):
+    Error = 1
+    EndOfStream = 2
+
+
+class CancellationErrorCode(Enum):
+    NoError = 0
+    ServiceError = 6
+
+
+class StreamStatus(Enum):
+    NoData = 0
+    PartialData = 1
+    AllData = 2
+    Canceled = 3
+
+
+class PropertyId(Enum):
+    SpeechServiceConnection_InitialSilenceTimeoutMs = 3200
+    SpeechServiceConnection_EndSilenceTimeoutMs = 3201
+    Speech_SegmentationSilenceTimeoutMs = 9002
+    SpeechServiceResponse_JsonResult = 5000
+    SpeechServiceResponse_RequestWordLevelTimestamps = 11004
+    SpeechServiceResponse_OutputFormatOption = 11006
+
+
+class SpeechSynthesisOutputFormat(Enum):
+    Riff16Khz16BitMonoPcm = 2
+    Raw16Khz16BitMonoPcm = 5
+    Riff24Khz16BitMonoPcm = 8
+
+
+def _simulate_latency():
+    if FAKE_SPEECH_LATENCY_MS > 0:
+        time.sleep(FAKE_SPEECH_LATENCY_MS / 1000)
+
+
+def _ensure_connected(owner):
+    """First use of a recognizer/synthesizer pays an extra connection setup latency."""
+    if not getattr(owner, "_connected", False):
+        _simulate_latency()
+        owner._connected = True
+
+
+class ResultFuture:
+    """Mimics the SDK's ResultFuture: get() blocks until the result is ready."""
+
+    def __init__(self, fn: Callable):
+        self._result = None
+        self._error: Optional[BaseException] = None
+        self._done = threading.Event()
+
+        def _run():
+            try:
+                self._result = fn()
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._done.set()
+
+        threading.Thread(target=_run, daemon=True).start()
+
+    def get(self):
+        self._done.wait()
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+class EventSignal:
+    def __init__(self):
+        self._callbacks: List[Callable] = []
+
+    def connect(self, callback: Callable):
+        self._callbacks.append(callback)
+
+    def disconnect_all(self):
+        self._callbacks = []
+
+    def fire(self, evt):
+        for callback in list(self._callbacks):
+            callback(evt)
+
+
+class SpeechConfig:
+    def __init__(self, subscription: Optional[str] = None, region: Optional[str] = None,
+                 endpoint: Optional[str] = None, host: Optional[str] = None, **kwargs):
+        self.subscription_key = subscription
+        self.region = region
+        self.endpoint = endpoint
+        self.speech_recognition_language = "en-US"
+        self.speech_synthesis_voice_name = "en-US-JennyNeural"
+        self.speech_synthesis_language = None
+        self.output_format = None
+        self._properties = {}
+
+    def set_property(self, property_id, value: str):
+        self._properties[property_id] = value
+
+    def set_property_by_name(self, name, value: str):
+        self._properties[name] = value
+
+    def get_property(self, property_id) -> str:
+        return self._properties.get(property_id, "")
+
+    def request_word_level_timestamps(self):
+        self._properties[PropertyId.SpeechServiceResponse_RequestWordLevelTimestamps] = "true"
+
+    def set_speech_synthesis_output_format(self, output_format):
+        self._properties["SpeechSynthesisOutputFormat"] = output_format
+
+
+class AudioStreamFormat:
+    def __init__(self, samples_per_second: int = SAMPLE_RATE, bits_per_sample: int = 16,
+                 channels: int = 1, wave_stream_format=None):
+        self.samples_per_second = samples_per_second
+        self.bits_per_sample = bits_per_sample
+        self.channels = channels
+
+
+class PushAudioInputStream:
+    """Buffers written audio; close() marks the end of the stream."""
+
+    def __init__(self, stream_format: Optional[AudioStreamFormat] = None):
+        self.stream_format = stream_format or AudioStreamFormat()
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+
+    def write(self, buffer):
+        with self._lock:
+            self._buffer += buffer
+
+    def close(self):
+        self._closed.set()
+
+    def read_all(self) -> bytes:
+        """Block until the writer closes the stream, then return everything written."""
+        self._closed.wait()
+        with self._lock:
+            return bytes(self._buffer)
+
+
+class AudioConfig:
+    def __init__(self, use_default_microphone: bool = False, filename: Optional[str] = None,
+                 stream=None, device_name: Optional[str] = None):
+        self.use_default_microphone = use_default_microphone
+        self.filename = filename
+        self.stream = stream
+        self.device_name = device_name
+
+
+class AudioOutputConfig:
+    def __init__(self, use_default_speaker: bool = False, filename: Optional[str] = None,
+                 stream=None, device_name: Optional[str] = None):
+        self.use_default_speaker = use_default_speaker
+        self.filename = filename
+        self.stream = stream
+        self.device_name = device_name
+
+
+audio = SimpleNamespace(
+    AudioConfig=AudioConfig,
+    AudioOutputConfig=AudioOutputConfig,
+    AudioStreamFormat=AudioStreamFormat,
+    PushAudioInputStream=PushAudioInputStream,
+)
+
+
+class CancellationDetails:
+    def __init__(self, result):
+        self.reason = getattr(result, "cancellation_reason", CancellationReason.Error)
+        self.error_details = getattr(result, "error_details", "")
+        self.code = CancellationErrorCode.NoError if self.reason == CancellationReason.EndOfStream \
+            else CancellationErrorCode.ServiceError
+
+
+class SpeechRecognitionResult:
+    def __init__(self, reason: ResultReason, text: str = "", offset: int = 0, duration: int = 0,
+                 word_timestamps: bool = False):
+        self.result_id = uuid.uuid4().hex
+        self.reason = reason
+        self.text = text
+        self.offset = offset
+        self.duration = duration
+        self.cancellation_reason = CancellationReason.EndOfStream
+        self.error_details = ""
+        self.json = json.dumps(_detailed_json(text, offset, duration, word_timestamps))
+        self.properties = {PropertyId.SpeechServiceResponse_JsonResult: self.json}
+
+    @property
+    def cancellation_details(self) -> CancellationDetails:
+        return CancellationDetails(self)
+
+
+def _detailed_json(text: str, offset: int, duration: int, word_timestamps: bool) -> dict:
+    """Service-style result JSON; lexical words get timings proportional to their length."""
+    payload = {"DisplayText": text, "Offset": offset, "Duration": duration}
+    if not word_timestamps or not text:
+        return payload
+    tokens = text.split()
+    total_chars = sum(len(token) for token in tokens) or 1
+    words, position = [], offset
+    for token in tokens:
+        length = int(duration * len(token) / total_chars)
+        words.append({"Word": re.sub(r"[^\w'-]", "", token).lower(), "Offset": position, "Duration": length})
+        position += length
+    payload["NBest"] = [{"Confidence": 0.9, "Display": text, "Lexical": " ".join(w["Word"] for w in words),
+                         "Words": words}]
+    return payload
+
+
+class SpeechRecognitionEventArgs:
+    def __init__(self, result: SpeechRecognitionResult):
+        self.result = result
+        self.session_id = ""
+
+
+class SpeechRecognitionCanceledEventArgs(SpeechRecognitionEventArgs):
+    def __init__(self, result: SpeechRecognitionResult, reason: CancellationReason, error_details: str = ""):
+        super().__init__(result)
+        self.reason = reason
+        self.error_details = error_details
+        self.cancellation_details = CancellationDetails(result)
+
+
+class SessionEventArgs:
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+
+
+def _sidecar_text(filename: str) -> Optional[str]:
+    """Transcript for a WAV file from <name>.wav.txt or <name>.txt."""
+    for candidate in (filename + ".txt", os.path.splitext(filename)[0] + ".txt"):
+        if os.path.exists(candidate):
+            with open(candidate, "r", encoding="utf-8") as f:
+                return f.read().strip()
+    return None
+
+
+def _wav_duration(filename: str) -> float:
+    try:
+        with wave.open(filename, "rb") as wav:
+            return wav.getnframes() / float(wav.getframerate())
+    except (wave.Error, OSError, EOFError):
+        return 0.0
+
+
+_pcm_index: dict = {}
+_pcm_index_lock = threading.Lock()
+# Bytes from the middle of a pushed slice searched for in the sample PCM
+_SLICE_PROBE_BYTES = 16000
+
+
+def _pcm_variants(filename: str) -> tuple:
+    """A sample WAV's PCM payload as-is and after 16 kHz mono normalization, with byte rates."""
+    try:
+        with wave.open(filename, "rb") as wav:
+            params = wav.getparams()
+            pcm = wav.readframes(params.nframes)
+    except (wave.Error, OSError, EOFError):
+        return ()
+    frame_bytes = params.nchannels * params.sampwidth
+    variants = [(pcm, params.framerate * frame_bytes, frame_bytes)]
+    try:
+        from audio_preprocess import PcmNormalizer
+        normalizer = PcmNormalizer(params.framerate, params.nchannels, params.sampwidth * 8)
+        if normalizer.needs_conversion:
+            variants.append((normalizer.process(pcm) + normalizer.flush(), SAMPLE_RATE * 2, 2))
+    except ImportError:
+        pass
+    return tuple((data, hashlib.sha256(data).hexdigest(), rate, align) for data, rate, align in variants)
+
+
+def _locate_in_variant(pcm: bytes, digest: str, variant: tuple) -> Optional[float]:
+    """Start of pcm within one sample variant in seconds, or None."""
+    data, variant_digest, bytes_per_second, align = variant
+    if digest == variant_digest:
+        return 0.0
+    if len(pcm) > len(data) or len(pcm) < align:
+        return None
+    # Probe from the middle: slice edges differ after resampling (filter warm-up and flush)
+    probe_at = max(0, (len(pcm) - _SLICE_PROBE_BYTES) // 2) // align * align
+    probe = pcm[probe_at:probe_at + _SLICE_PROBE_BYTES]
+    found = data.find(probe)
+    while found != -1:
+        start = found - probe_at
+        if found % align == 0 and start >= 0 and start + len(pcm) <= len(data) + bytes_per_second // 10:
+            return start / bytes_per_second
+        found = data.find(probe, found + 1)
+    return None
+
+
+def _locate_pcm(pcm: bytes) -> Optional[tuple]:
+    """
+    Find the sample WAV that pcm equals or is a slice of.
+
+    Returns:
+        (sidecar text, sample duration in seconds, slice start in seconds) or None
+    """
+    digest = hashlib.sha256(pcm).hexdigest()
+    if not os.path.isdir(FAKE_SPEECH_SAMPLES_DIR):
+        return None
+    with _pcm_index_lock:
+        for name in sorted(os.listdir(FAKE_SPEECH_SAMPLES_DIR)):
+            path = os.path.join(FAKE_SPEECH_SAMPLES_DIR, name)
+            if not name.lower().endswith(".wav"):
+                continue
+            key = (path, os.path.getmtime(path))
+            if key not in _pcm_index:
+                _pcm_index[key] = _pcm_variants(path)
+            for variant in _pcm_index[key]:
+                start = _locate_in_variant(pcm, digest, variant)
+                if start is not None:
+                    text = _sidecar_text(path)
+                    return (text, _wav_duration(path), start) if text else None
+    return None
+
+
+def _segments(text: str, total_seconds: float) -> List[tuple]:
+    """Split text into sentences with (text, offset_ticks, duration_ticks) spread over the audio."""
+    sentences = [s.strip() for s in re.split(r"(?<=[.!?।。])\s+", text) if s.strip()]
+    total_chars = sum(len(s) for s in sentences) or 1
+    if total_seconds <= 0:
+        total_seconds = total_chars * 0.06
+    segments = []
+    offset = 0.0
+    for sentence in sentences:
+        duration = total_seconds * len(sentence) / total_chars
+        segments.append((sentence, int(offset * TICKS_PER_SECOND), int(duration * TICKS_PER_SECOND)))
+        offset += duration
+    return segments
+
+
+class SpeechRecognizer:
+    def __init__(self, speech_config: SpeechConfig, audio_config: Optional[AudioConfig] = None,
+                 language: Optional[str] = None, **kwargs):
+        self.speech_config = speech_config
+        self.audio_config = audio_config
+        self.recognizing = EventSignal()
+        self.recognized = EventSignal()
+        self.canceled = EventSignal()
+        self.session_started = EventSignal()
+        self.session_stopped = EventSignal()
+        self.speech_start_detected = EventSignal()
+        self.speech_end_detected = EventSignal()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._session_id = uuid.uuid4().hex
+
+    @property
+    def _word_timestamps(self) -> bool:
+        value = self.speech_config.get_property(PropertyId.SpeechServiceResponse_RequestWordLevelTimestamps)
+        return str(value).lower() == "true"
+
+    def _load_segments(self) -> List[tuple]:
+        stream = getattr(self.audio_config, "stream", None)
+        if isinstance(stream, PushAudioInputStream):
+            pcm = stream.read_all()
+            fmt = stream.stream_format
+            located = _locate_pcm(pcm)
+            if located is None:
+                return []
+            text, total_seconds, start = located
+            bytes_per_second = fmt.samples_per_second * fmt.channels * fmt.bits_per_sample // 8
+            end = start + len(pcm) / bytes_per_second
+            # Sentences whose midpoint lies in the slice, so consecutive slices share none
+            start_ticks, end_ticks = int(start * TICKS_PER_SECOND), int(end * TICKS_PER_SECOND)
+            return [
+                (sentence, offset - start_ticks, duration)
+                for sentence, offset, duration in _segments(text, total_seconds)
+                if start_ticks <= offset + duration // 2 < end_ticks or (start == 0 and end >= total_seconds)
+            ]
+        filename = getattr(self.audio_config, "filename", None)
+        if not filename:
+            return []  # microphone: nothing to recognize offline
+        text = _sidecar_text(filename)
+        if not text:
+            return []
+        return _segments(text, _wav_duration(filename))
+
+    def recognize_once_async(self) -> ResultFuture:
+        def _run():
+            _ensure_connected(self)
+            _simulate_latency()
+            segments = self._load_segments()
+            if not segments:
+                return SpeechRecognitionResult(ResultReason.NoMatch)
+            text, offset, duration = segments[0]
+            return SpeechRecognitionResult(ResultReason.RecognizedSpeech, text, offset, duration,
+                                           self._word_timestamps)
+        return ResultFuture(_run)
+
+    def recognize_once(self) -> SpeechRecognitionResult:
+        return self.recognize_once_async().get()
+
+    def _continuous(self):
+        self.session_started.fire(SessionEventArgs(self._session_id))
+        _ensure_connected(self)
+        _simulate_latency()
+        segments = self._load_segments()
+        config = self.audio_config
+        is_finite = bool(getattr(config, "filename", None) or getattr(config, "stream", None))
+        for text, offset, duration in segments:
+            if self._stop.is_set():
+                break
+            if FAKE_SPEECH_REALTIME_FACTOR > 0:
+                self._stop.wait(duration / TICKS_PER_SECOND * FAKE_SPEECH_REALTIME_FACTOR)
+            self.recognizing.fire(SpeechRecognitionEventArgs(
+                SpeechRecognitionResult(ResultReason.RecognizingSpeech, text, offset, duration)))
+            self.recognized.fire(SpeechRecognitionEventArgs(
+                SpeechRecognitionResult(ResultReason.RecognizedSpeech, text, offset, duration,
+                                        self._word_timestamps)))
+        if is_finite and not self._stop.is_set():
+            # Files and closed streams end with an EndOfStream cancellation, as with the real SDK
+            result = SpeechRecognitionResult(ResultReason.Canceled)
+            self.canceled.fire(SpeechRecognitionCanceledEventArgs(result, CancellationReason.EndOfStream))
+        else:
+            self._stop.wait()
+        self.session_stopped.fire(SessionEventArgs(self._session_id))
+
+    def start_continuous_recognition_async(self) -> ResultFuture:
+        def _start():
+            self._stop.clear()
+            self._worker = threading.Thread(target=self._continuous, daemon=True)
+            self._worker.start()
+        return ResultFuture(_start)
+
+    def start_continuous_recognition(self):
+        self.start_continuous_recognition_async().get()
+
+    def stop_continuous_recognition_async(self) -> ResultFuture:
+        def _stop():
+            self._stop.set()
+            if self._worker is not None and self._worker is not threading.current_thread():
+                self._worker.join(timeout=5)
+        return ResultFuture(_stop)
+
+    def stop_continuous_recognition(self):
+        self.stop_continuous_recognition_async().get()
+
+
+def synthesize_pcm(text: str, voice: str) -> bytes:
+    """Deterministic 16 kHz 16-bit mono PCM for text/voice: a tone whose pitch hashes the input."""
+    digest = hashlib.sha256(f"{voice}|{text}".encode("utf-8")).digest()
+    frequency = 200 + digest[0] * 2
+    n_samples = int(SAMPLE_RATE * max(0.2, len(text) * FAKE_TTS_MS_PER_CHAR / 1000))
+    step = 2 * math.pi * frequency / SAMPLE_RATE
+    return array("h", (int(8000 * math.sin(step * i)) for i in range(n_samples))).tobytes()
+
+
+def wav_bytes(pcm: bytes, sample_rate: int = SAMPLE_RATE) -> bytes:
+    """Wrap raw 16-bit mono PCM in a RIFF WAV header."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm)
+    return buffer.getvalue()
+
+
+class Connection:
+    """Mimics speechsdk.Connection: open() pays the connection latency up front."""
+
+    def __init__(self, owner):
+        self._owner = owner
+        self.connected = EventSignal()
+        self.disconnected = EventSignal()
+
+    @classmethod
+    def from_recognizer(cls, recognizer) -> "Connection":
+        return cls(recognizer)
+
+    @classmethod
+    def from_speech_synthesizer(cls, synthesizer) -> "Connection":
+        return cls(synthesizer)
+
+    def open(self, for_continuous_recognition: bool = False):
+        if not getattr(self._owner, "_connected", False):
+            _ensure_connected(self._owner)
+            self.connected.fire(SessionEventArgs(""))
+
+    def close(self):
+        if getattr(self._owner, "_connected", False):
+            self._owner._connected = False
+            self.disconnected.fire(SessionEventArgs(""))
+
+
+class SpeechSynthesisResult:
+    def __init__(self, reason: ResultReason, audio_data: bytes = b"", error_details: str = ""):
+        self.result_id = uuid.uuid4().hex
+        self.reason = reason
+        self.audio_data = audio_data
+        self.audio_duration = None
+        self.cancellation_reason = CancellationReason.Error
+        self.error_details = error_details
+
+    @property
+    def cancellation_details(self) -> CancellationDetails:
+        return CancellationDetails(self)
+
+
+class SpeechSynthesisEventArgs:
+    def __init__(self, result: SpeechSynthesisResult):
+        self.result = result
+
+
+class AudioDataStream:
+    """Pull-style reader over the audio of a result from start_speaking_text_async()."""
+
+    def __init__(self, result: SpeechSynthesisResult):
+        self._chunks = getattr(result, "_chunks", None)
+        self._pending = b""
+        self._done = self._chunks is None
+        if self._chunks is None and result.reason == ResultReason.SynthesizingAudioCompleted:
+            self._pending = result.audio_data
+        self.status = StreamStatus.Canceled if result.reason == ResultReason.Canceled else StreamStatus.PartialData
+        self.cancellation_details = CancellationDetails(result) if result.reason == ResultReason.Canceled else None
+
+    def read_data(self, audio_buffer: bytes) -> int:
+        """Block until audio is available, copy up to len(audio_buffer) bytes into it; 0 at the end."""
+        while not self._pending and not self._done:
+            chunk = self._chunks.get()
+            if chunk is None:
+                self._done = True
+            else:
+                self._pending = chunk
+        if not self._pending:
+            if self.status != StreamStatus.Canceled:
+                self.status = StreamStatus.AllData
+            return 0
+        size = min(len(audio_buffer), len(self._pending))
+        if isinstance(audio_buffer, bytes):
+            # Like the SDK, fill the caller's (immutable) bytes object in place
+            ctypes.memmove(ctypes.c_char_p(audio_buffer), self._pending, size)
+        else:
+            audio_buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+class SpeechSynthesizer:
+    def __init__(self, speech_config: SpeechConfig, audio_config: Optional[AudioOutputConfig] = None, **kwargs):
+        self.speech_config = speech_config
+        self.audio_config = audio_config
+        self.synthesis_started = EventSignal()
+        self.synthesizing = EventSignal()
+        self.synthesis_completed = EventSignal()
+        self.synthesis_canceled = EventSignal()
+
+    def _audio(self, text: str) -> bytes:
+        pcm = synthesize_pcm(text, self.speech_config.speech_synthesis_voice_name)
+        output_format = self.speech_config.get_property("SpeechSynthesisOutputFormat")
+        return pcm if output_format == SpeechSynthesisOutputFormat.Raw16Khz16BitMonoPcm else wav_bytes(pcm)
+
+    def _produce(self, text: str, on_chunk: Callable[[bytes], None]) -> SpeechSynthesisResult:
+        """Synthesize in 100 ms chunks (paced by FAKE_TTS_REALTIME_FACTOR), firing synthesizing per chunk."""
+        data = self._audio(text)
+        chunk_bytes = SAMPLE_RATE * 2 * FAKE_TTS_CHUNK_MS // 1000
+        for start in range(0, len(data), chunk_bytes):
+            if FAKE_TTS_REALTIME_FACTOR > 0:
+                time.sleep(FAKE_TTS_CHUNK_MS / 1000 * FAKE_TTS_REALTIME_FACTOR)
+            chunk = data[start:start + chunk_bytes]
+            self.synthesizing.fire(SpeechSynthesisEventArgs(
+                SpeechSynthesisResult(ResultReason.SynthesizingAudio, chunk)))
+            on_chunk(chunk)
+        filename = getattr(self.audio_config, "filename", None)
+        if filename:
+            with open(filename, "wb") as f:
+                f.write(data)
+        result = SpeechSynthesisResult(ResultReason.SynthesizingAudioCompleted, data)
+        self.synthesis_completed.fire(SpeechSynthesisEventArgs(result))
+        return result
+
+    def _start(self, text: str) -> Optional[SpeechSynthesisResult]:
+        """Connection and request latency; returns a Canceled result for empty text."""
+        _ensure_connected(self)
+        _simulate_latency()
+        if not text or not text.strip():
+            result = SpeechSynthesisResult(ResultReason.Canceled, error_details="Empty text")
+            self.synthesis_canceled.fire(SpeechSynthesisEventArgs(result))
+            return result
+        self.synthesis_started.fire(SpeechSynthesisEventArgs(
+            SpeechSynthesisResult(ResultReason.SynthesizingAudioStarted)))
+        return None
+
+    def speak_text_async(self, text: str) -> ResultFuture:
+        def _run():
+            return self._start(text) or self._produce(text, lambda chunk: None)
+        return ResultFuture(_run)
+
+    def start_speaking_text_async(self, text: str) -> ResultFuture:
+        """Resolves once the first audio chunk is ready; read the rest with AudioDataStream."""
+        def _run():
+            canceled = self._start(text)
+            if canceled is not None:
+                return canceled
+            chunks: "queue.Queue[Optional[bytes]]" = queue.Queue()
+            first_chunk = threading.Event()
+
+            def produce():
+                try:
+                    self._produce(text, lambda chunk: (chunks.put(chunk), first_chunk.set()))
+                finally:
+                    chunks.put(None)
+                    first_chunk.set()
+
+            threading.Thread(target=produce, daemon=True).start()
+            first_chunk.wait()
+            result = SpeechSynthesisResult(ResultReason.SynthesizingAudioStarted)
+            result._chunks = chunks
+            return result
+        return ResultFuture(_run)
+
+    def speak_text(self, text: str) -> SpeechSynthesisResult:
+        return self.speak_text_async(text).get()
@@ -10,7 +10,7 @@ import sys
 import signal
 from pathlib import Path
 from dotenv import load_dotenv
-import azure.cognitiveservices.speech as speechsdk
+from speech_backend import speechsdk
 
 load_dotenv()
 
@@ -0,0 +1,228 @@
+"""
+Mock Azure Translator Server
+Local stand-in for the Translator v3 /translate endpoint for offline
+benchmarking and load testing. Point the app at it with:
+    AZURE_TRANSLATOR_ENDPOINT=http://127.0.0.1:8600
+    AZURE_TRANSLATOR_KEY=mock
+    AZURE_TRANSLATOR_REGION=mock
+"""
+
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Tuple, Callable
+from urllib.parse import urlparse, parse_qs
+
+DEFAULT_PORT = 8600
+MAX_DOCUMENTS = 100
+MAX_CHARS = 10000
+
+
+def parse_latency(spec: str) -> Callable[[], float]:
+    """
+    Build a latency sampler (seconds) from a spec string:
+        fixed:50            always 50 ms
+        uniform:20,80       uniform between 20 and 80 ms
+        normal:50,10        mean 50 ms, std-dev 10 ms (clipped at 0)
+        lognormal:50,0.5    median 50 ms, sigma 0.5
+    """
+    kind, _, args = spec.partition(":")
+    values = [float(v) for v in args.split(",") if v.strip()]
+    if kind == "fixed":
+        return lambda: values[0] / 1000
+    if kind == "uniform":
+        return lambda: random.uniform(values[0], values[1]) / 1000
+    if kind == "normal":
+        return lambda: max(0.0, random.gauss(values[0], values[1])) / 1000
+    if kind == "lognormal":
+        mu = math.log(values[0])
+        return lambda: random.lognormvariate(mu, values[1]) / 1000
+    raise ValueError(f"Unknown latency spec: {spec}")
+
+
+class MockTranslatorHandler(BaseHTTPRequestHandler):
+    """Implements POST /translate?api-version=3.0 and GET /stats."""
+
+    server_version = "MockTranslator/1.0"
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real service
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status: int, payload: Any, headers: Dict[str, str] = None):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: int, code: int, message: str, headers: Dict[str, str] = None):
+        self._send_json(status, {"error": {"code": code, "message": message}}, headers)
+
+    def do_GET(self):
+        if urlparse(self.path).path == "/stats":
+            self._send_json(200, self.server.snapshot_stats())
+        else:
+            self._send_error(404, 404000, "Not found")
+
+    def do_POST(self):
+        server = self.server
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length)
+
+        if url.path != "/translate":
+            return self._send_error(404, 404000, "Not found")
+        if query.get("api-version") != ["3.0"]:
+            return self._send_error(400, 400021, "The API version parameter is missing or invalid.")
+        if not self.headers.get("Ocp-Apim-Subscription-Key"):
+            return self._send_error(401, 401000, "Missing subscription key.")
+
+        targets = query.get("to", [])
+        if not targets:
+            return self._send_error(400, 400036, "The target language is not valid.")
+
+        try:
+            documents = json.loads(raw or b"[]")
+            texts = [doc["text"] for doc in documents]
+        except (ValueError, KeyError, TypeError):
+            return self._send_error(400, 400074, "The body of the request is not valid JSON.")
+
+        if len(texts) > server.max_documents:
+            return self._send_error(400, 400077, "The maximum request size has been exceeded.")
+        chars = sum(len(text) for text in texts)
+        if chars > server.max_chars:
+            return self._send_error(400, 400050, "The input text is too long.")
+
+        time.sleep(server.latency())
+
+        if random.random() < server.throttle_rate:
+            server.record(throttled=True)
+            return self._send_error(
+                429, 429001, "The server rejected the request because the client has exceeded request limits.",
+                headers={"Retry-After": str(server.retry_after)}
+            )
+        if random.random() < server.error_rate:
+            server.record(failed=True)
+            return self._send_error(500, 500000, "An unexpected error occurred.")
+
+        source = query.get("from", [None])[0]
+        results = []
+        for text in texts:
+            item: Dict[str, Any] = {
+                "translations": [{"text": f"[{lang}] {text}", "to": lang} for lang in targets]
+            }
+            if source is None:
+                item["detectedLanguage"] = {"language": server.detected_language, "score": 1.0}
+            results.append(item)
+
+        server.record(chars=chars * len(targets), documents=len(texts))
+        self._send_json(200, results)
+
+
+class MockTranslatorServer(ThreadingHTTPServer):
+    """Threaded HTTP server carrying the mock's configuration and counters."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        latency: str = "lognormal:60,0.4",
+        throttle_rate: float = 0.0,
+        error_rate: float = 0.0,
+        retry_after: float = 1.0,
+        max_documents: int = MAX_DOCUMENTS,
+        max_chars: int = MAX_CHARS,
+        detected_language: str = "en",
+        verbose: bool = False
+    ):
+        super().__init__(address, MockTranslatorHandler)
+        self.latency = parse_latency(latency)
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.max_documents = max_documents
+        self.max_chars = max_chars
+        self.detected_language = detected_language
+        self.verbose = verbose
+        self._stats_lock = threading.Lock()
+        self.stats = {"requests": 0, "documents": 0, "billed_chars": 0, "throttled": 0, "failed": 0}
+
+    def record(self, chars: int = 0, documents: int = 0, throttled: bool = False, failed: bool = False):
+        with self._stats_lock:
+            self.stats["requests"] += 1
+            self.stats["documents"] += documents
+            self.stats["billed_chars"] += chars
+            self.stats["throttled"] += int(throttled)
+            self.stats["failed"] += int(failed)
+
+    def snapshot_stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return dict(self.stats)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_mock_server(host: str = "127.0.0.1", port: int = 0, **options) -> MockTranslatorServer:
+    """
+    Start a mock server on a background thread (port 0 = pick a free port).
+
+    Returns:
+        The running server; use server.url as AZURE_TRANSLATOR_ENDPOINT and
+        server.shutdown() to stop it
+    """
+    server = MockTranslatorServer((host, port), **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock Azure Translator v3 server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency", default="lognormal:60,0.4",
+                        help="fixed:MS | uniform:LO,HI | normal:MEAN,STD | lognormal:MEDIAN,SIGMA")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--max-chars", type=int, default=MAX_CHARS)
+    parser.add_argument("--max-documents", type=int, default=MAX_DOCUMENTS)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    server = MockTranslatorServer(
+        (args.host, args.port),
+        latency=args.latency,
+        throttle_rate=args.throttle_rate,
+        error_rate=args.error_rate,
+        retry_after=args.retry_after,
+        max_documents=args.max_documents,
+        max_chars=args.max_chars,
+        verbose=args.verbose
+    )
+    print(f"🧪 Mock Translator listening on {server.url} (latency {args.latency}, "
+          f"429 rate {args.throttle_rate:.0%})")
+    print(f"   AZURE_TRANSLATOR_ENDPOINT={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n📊 {server.snapshot_stats()}")
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
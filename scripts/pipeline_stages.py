@@ -0,0 +1,160 @@
+"""
+Pipeline Stage Helpers
+Bounded queues with overflow policies between the stages of the real-time
+speech-to-speech pipeline, sentinel-based shutdown and in-order release of
+results from worker pools
+"""
+
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+# Put one per worker on a stage's queue: each worker exits when it takes one,
+# after everything queued before it has been handled
+STOP = object()
+
+# What StageQueue.put() does when the queue is full
+OVERFLOW_BLOCK = "block"              # wait for room (backpressure on the producer)
+OVERFLOW_DROP_OLDEST = "drop_oldest"  # discard the oldest queued item
+OVERFLOW_COALESCE = "coalesce"        # merge the new item into the newest queued one
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_COALESCE)
+
+
+class StageQueue:
+    """
+    Bounded FIFO between two pipeline stages. When full, put() blocks,
+    drops the oldest item or coalesces, depending on the policy. STOP
+    sentinels are always accepted and never dropped or merged.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int,
+        policy: str = OVERFLOW_BLOCK,
+        merge: Optional[Callable[[Any, Any], Any]] = None,
+        on_drop: Optional[Callable[[Any], None]] = None
+    ):
+        """
+        Args:
+            name: Stage name used in stats
+            maxsize: Items held before the overflow policy applies
+            policy: One of OVERFLOW_POLICIES
+            merge: merge(queued, new) -> item replacing queued (required for coalesce)
+            on_drop: Called with every item discarded by drop_oldest
+        """
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {policy}")
+        if policy == OVERFLOW_COALESCE and merge is None:
+            raise ValueError("The coalesce policy needs a merge function")
+        self.name = name
+        self.maxsize = max(1, maxsize)
+        self.policy = policy
+        self._merge = merge
+        self._on_drop = on_drop
+        self._items = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._counts = {"put": 0, "taken": 0, "dropped": 0, "coalesced": 0, "blocked": 0}
+        self._max_depth = 0
+
+    def _depth_locked(self) -> int:
+        return sum(1 for item in self._items if item is not STOP)
+
+    def put(self, item: Any):
+        """Add an item, applying the overflow policy if the queue is full."""
+        dropped = None
+        with self._lock:
+            self._counts["put"] += 1
+            if self._depth_locked() >= self.maxsize:
+                if self.policy == OVERFLOW_BLOCK:
+                    self._counts["blocked"] += 1
+                    while self._depth_locked() >= self.maxsize:
+                        self._not_full.wait()
+                elif self.policy == OVERFLOW_DROP_OLDEST:
+                    for position, queued in enumerate(self._items):
+                        if queued is not STOP:
+                            del self._items[position]
+                            dropped = queued
+                            self._counts["dropped"] += 1
+                            break
+                else:
+                    newest = max(i for i, queued in enumerate(self._items) if queued is not STOP)
+                    self._items[newest] = self._merge(self._items[newest], item)
+                    self._counts["coalesced"] += 1
+                    return
+            self._items.append(item)
+            self._max_depth = max(self._max_depth, self._depth_locked())
+            self._not_empty.notify()
+        if dropped is not None and self._on_drop is not None:
+            self._on_drop(dropped)
+
+    def put_stop(self):
+        """Queue a STOP sentinel (ignores the size limit)."""
+        with self._lock:
+            self._items.append(STOP)
+            self._not_empty.notify()
+
+    def get(self) -> Any:
+        """Block until an item (or STOP) is available and take it."""
+        with self._lock:
+            while not self._items:
+                self._not_empty.wait()
+            item = self._items.popleft()
+            if item is not STOP:
+                self._counts["taken"] += 1
+                self._not_full.notify()
+            return item
+
+    def qsize(self) -> int:
+        """Items waiting (sentinels not counted)."""
+        with self._lock:
+            return self._depth_locked()
+
+    def stats(self) -> Dict[str, Any]:
+        """Current depth, capacity, policy and counters."""
+        with self._lock:
+            return dict(self._counts, name=self.name, depth=self._depth_locked(), maxsize=self.maxsize,
+                        policy=self.policy, max_depth=self._max_depth)
+
+
+class ReorderBuffer:
+    """
+    Releases results in sequence-number order although workers finish
+    them out of order. Items are emitted under a lock, so emit() calls
+    never interleave and must stay quick (queue puts, log appends).
+    """
+
+    def __init__(self, emit: Callable[[Any], None], first_seq: int = 0):
+        """
+        Args:
+            emit: Called with each item once every earlier sequence number has been emitted
+            first_seq: Sequence number of the first item
+        """
+        self._emit = emit
+        self._next_seq = first_seq
+        self._pending: Dict[int, Any] = {}
+        self._lock = threading.Lock()
+        self.max_waiting = 0
+
+    def push(self, seq: int, item: Any):
+        """
+        Hand in the result for seq. Pass item=None for a sequence number
+        that produced nothing (e.g. a failed translation) so later ones
+        are not held back; None is skipped rather than emitted.
+        """
+        with self._lock:
+            self._pending[seq] = item
+            self.max_waiting = max(self.max_waiting, len(self._pending) - 1)
+            while self._next_seq in self._pending:
+                ready = self._pending.pop(self._next_seq)
+                self._next_seq += 1
+                if ready is not None:
+                    self._emit(ready)
+
+    @property
+    def waiting(self) -> int:
+        """Results held back until an earlier sequence number finishes."""
+        with self._lock:
+            return len(self._pending)
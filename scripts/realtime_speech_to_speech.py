@@ -7,14 +7,16 @@ import os
 import time
 import threading
 import uuid
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List, Optional
-from queue import Queue
 from dotenv import load_dotenv
-import azure.cognitiveservices.speech as speechsdk
+from speech_backend import speechsdk
 
-from translator import translate_with_retry
+from speech_resources import TTS_CONCURRENCY, TTS_STREAM_FORMAT, get_speech_resources
+from pipeline_stages import STOP, ReorderBuffer, StageQueue
+from translator import translate_with_retry, get_translator_client
+from translation_log import get_log_writer
 from language_config import (
     DEFAULT_TARGET_LANGUAGES, SUPPORTED_LANGUAGES,
     SPEECH_LANGUAGES, TTS_VOICES, get_speech_language_code, get_tts_voice
@@ -40,6 +42,21 @@ TARGET_LANGUAGES = DEFAULT_TARGET_LANGUAGES  # 15+ target languages
 SOURCE_LANGUAGE = "en-US"  # Source language for STT
 CHUNK_DURATION = 3.0  # Process chunks every 3 seconds
 SILENCE_TIMEOUT = 2.0  # Stop after 2 seconds of silence
+TRANSLATION_DEADLINE = 5.0  # Max seconds spent translating (incl. retries) per utterance
+# Utterances translated concurrently; results are still emitted in spoken order
+TRANSLATION_WORKERS = int(os.getenv("REALTIME_TRANSLATION_WORKERS", "4"))
+# Transcripts waiting for translation, and what happens when that queue is full
+# (block | drop_oldest | coalesce - merges the utterance into the newest queued one)
+TRANSLATION_QUEUE_SIZE = int(os.getenv("REALTIME_TRANSLATION_QUEUE_SIZE", "16"))
+TRANSLATION_OVERFLOW = os.getenv("REALTIME_TRANSLATION_OVERFLOW", "coalesce")
+# Translations synthesized concurrently, and the queue in front of them
+TTS_WORKERS = int(os.getenv("REALTIME_TTS_WORKERS", "2"))
+TTS_QUEUE_SIZE = int(os.getenv("REALTIME_TTS_QUEUE_SIZE", "8"))
+TTS_OVERFLOW = os.getenv("REALTIME_TTS_OVERFLOW", "block")
+# Seconds between queue depth reports while running (0 disables them)
+STAGE_STATUS_INTERVAL = float(os.getenv("REALTIME_STATUS_INTERVAL", "5"))
+# Seconds each stage gets to drain its queue on shutdown
+STAGE_DRAIN_TIMEOUT = 5.0
 
 
 class RealtimeSpeechToSpeech:
@@ -48,8 +65,23 @@ class RealtimeSpeechToSpeech:
     Handles: STT → Translation → TTS
     """
     
-    def __init__(self, target_languages: List[str] = None, source_language: str = "en-US"):
-        """Initialize the pipeline."""
+    def __init__(self, target_languages: List[str] = None, source_language: str = "en-US",
+                 translation_workers: int = TRANSLATION_WORKERS, tts_workers: int = TTS_WORKERS,
+                 translation_overflow: str = TRANSLATION_OVERFLOW, tts_overflow: str = TTS_OVERFLOW,
+                 tts_concurrency: int = TTS_CONCURRENCY, tts_voices: Optional[Dict[str, str]] = None):
+        """
+        Initialize the pipeline.
+        
+        Args:
+            target_languages: Languages to translate and synthesize
+            source_language: Language spoken into the microphone
+            translation_workers: Utterances translated concurrently
+            tts_workers: Translations synthesized concurrently
+            translation_overflow: Policy when the transcript queue is full
+            tts_overflow: Policy when the TTS queue is full
+            tts_concurrency: Languages synthesized at once, across all TTS workers
+            tts_voices: Voice overrides per language (default: language_config voice)
+        """
         if not SPEECH_KEY or not SPEECH_REGION:
             raise ValueError("Missing Azure Speech credentials. Check .env file.")
         if not TRANSLATOR_KEY or not TRANSLATOR_REGION:
@@ -57,6 +89,9 @@ class RealtimeSpeechToSpeech:
         
         self.target_languages = target_languages or TARGET_LANGUAGES
         self.source_language = source_language
+        self.translation_workers = max(1, translation_workers)
+        self.tts_workers = max(1, tts_workers)
+        self.tts_concurrency = max(1, tts_concurrency)
         
         # Create output directories
         os.makedirs(OUTPUT_DIR, exist_ok=True)
@@ -64,45 +99,71 @@ class RealtimeSpeechToSpeech:
         os.makedirs(TRANSCRIPTS_OUTPUT_DIR, exist_ok=True)
         os.makedirs(TRANSLATIONS_OUTPUT_DIR, exist_ok=True)
         
+        # Append-only JSONL logs (rotated daily) instead of one JSON file per record
+        self.transcript_log = get_log_writer(TRANSCRIPTS_OUTPUT_DIR, prefix="transcripts")
+        self.translation_log = get_log_writer(TRANSLATIONS_OUTPUT_DIR, prefix="translations")
+        self.tts_log = get_log_writer(AUDIO_OUTPUT_DIR, prefix="tts")
+        
         # State management
-        self.transcript_queue = Queue()  # Queue for final transcripts
-        self.translation_queue = Queue()  # Queue for translations
         self.transcript_id_counter = 0
         self.transcript_map = {}  # Maps transcript_id -> transcript_data
         self.translation_map = {}  # Maps transcript_id -> translation_data
+        self.tts_map = {}  # Maps transcript_id -> {lang: synthesis result}
+        # Workers finish out of order; translations are released by transcript sequence number
+        self.translation_reorder = ReorderBuffer(self._emit_translation)
+        # Bounded queues between the stages: STT -> translation -> TTS
+        self.transcript_queue = StageQueue(
+            "translation", TRANSLATION_QUEUE_SIZE, translation_overflow,
+            merge=self._coalesce_transcripts, on_drop=self._drop_transcript
+        )
+        self.translation_queue = StageQueue(
+            "tts", TTS_QUEUE_SIZE, tts_overflow,
+            merge=self._coalesce_translations, on_drop=self._drop_translation
+        )
         
         # Timing metrics
         self.stt_timings = []
         self.translation_timings = []
-        self.tts_timings = []
+        self.tts_timings = []  # per language
+        self.tts_first_audio_timings = {}  # lang -> seconds to the first audio byte
+        self.tts_fanout_timings = []  # (all languages of an utterance, sum of their latencies)
         
         # Control flags
         self.is_running = False
         self.stop_event = threading.Event()
         
         # Initialize Azure services
+        self.translator_client = get_translator_client()  # pooled keep-alive session
+        self.speech_resources = get_speech_resources()  # shared configs and synthesizers
         self._init_speech_config()
-        self._init_tts_config()
+        self._init_tts_config(tts_voices)
+        # Per-language synthesis jobs from every TTS worker share this capped pool
+        self.tts_executor = ThreadPoolExecutor(
+            max_workers=self.tts_concurrency,
+            thread_name_prefix="tts-lang"
+        )
     
     def _init_speech_config(self):
         """Initialize Azure Speech-to-Text configuration."""
-        self.speech_config = speechsdk.SpeechConfig(
-            subscription=SPEECH_KEY,
-            region=SPEECH_REGION
-        )
-        self.speech_config.speech_recognition_language = self.source_language
-        self.speech_config.set_property_by_name(
-            speechsdk.PropertyId.Speech_SegmentationSilenceTimeoutMs, "2000"
+        self.stt_properties = {speechsdk.PropertyId.Speech_SegmentationSilenceTimeoutMs: "2000"}
+        self.speech_config = self.speech_resources.get_config(
+            language=self.source_language,
+            properties=self.stt_properties
         )
     
-    def _init_tts_config(self):
+    def _init_tts_config(self, overrides: Optional[Dict[str, str]] = None):
         """Initialize Azure Text-to-Speech configuration."""
-        self.tts_config = speechsdk.SpeechConfig(
-            subscription=SPEECH_KEY,
-            region=SPEECH_REGION
+        # Neural voice per target language; each voice has its own shared config
+        self.tts_voices = {lang: get_tts_voice(lang) for lang in self.target_languages}
+        self.tts_voices.update(overrides or {})
+    
+    def _warm_tts(self):
+        """Create and pre-connect pooled synthesizers for every target voice before the first translation."""
+        # Each TTS worker may be speaking a different utterance in the same voice
+        created = self.speech_resources.synthesizers.prewarm(
+            self.tts_voices.values(), per_voice=self.tts_workers, output_format=TTS_STREAM_FORMAT
         )
-        # Use neural voices for better quality
-        self.tts_config.speech_synthesis_voice_name = "en-US-JennyNeural"
+        print(f"🔥 [TTS] Warmed {created} synthesizers for {len(set(self.tts_voices.values()))} voices")
     
     def _stt_recognized_callback(self, evt):
         """Callback for STT recognition events."""
@@ -114,6 +175,7 @@ class RealtimeSpeechToSpeech:
                 
                 transcript_data = {
                     "id": transcript_id,
+                    "seq": self.transcript_id_counter - 1,
                     "text": text,
                     "timestamp": datetime.now().isoformat(),
                     "stt_time": time.time()
@@ -122,13 +184,8 @@ class RealtimeSpeechToSpeech:
                 self.transcript_map[transcript_id] = transcript_data
                 self.transcript_queue.put(transcript_data)
                 
-                # Save transcript to file
-                transcript_file = os.path.join(
-                    TRANSCRIPTS_OUTPUT_DIR,
-                    f"{transcript_id}.json"
-                )
-                with open(transcript_file, 'w', encoding='utf-8') as f:
-                    json.dump(transcript_data, f, ensure_ascii=False, indent=2)
+                # Append transcript to the session log
+                self.transcript_log.append(transcript_data, record_id=transcript_id)
                 
                 print(f"\n🎯 [STT] {transcript_id}: {text}")
         
@@ -149,21 +206,66 @@ class RealtimeSpeechToSpeech:
             print(f"   Error details: {evt.result.error_details}")
         self.stop_event.set()
     
+    def _coalesce_transcripts(self, queued: Dict, new: Dict) -> Dict:
+        """Merge an utterance into the newest queued one when the translation queue is full."""
+        merged = dict(queued)
+        merged["text"] = f"{queued['text']} {new['text']}"
+        merged["merged_seqs"] = queued.get("merged_seqs", []) + [new["seq"]]
+        print(f"⏩ [Translation] Queue full, merged {new['id']} into {queued['id']}")
+        return merged
+    
+    def _drop_transcript(self, transcript_data: Dict):
+        """Release the sequence numbers of an utterance dropped from a full translation queue."""
+        print(f"⏩ [Translation] Queue full, dropped {transcript_data['id']}")
+        for seq in [transcript_data["seq"]] + transcript_data.get("merged_seqs", []):
+            self.translation_reorder.push(seq, None)
+    
+    def _coalesce_translations(self, queued: Dict, new: Dict) -> Dict:
+        """Merge a translation into the newest queued one when the TTS queue is full."""
+        merged = dict(queued)
+        translations = dict(queued["translations"])
+        for lang, text in new["translations"].items():
+            translations[lang] = f"{translations[lang]} {text}" if translations.get(lang) else text
+        merged["translations"] = translations
+        print(f"⏩ [TTS] Queue full, merged {new['transcript_id']} into {queued['transcript_id']}")
+        return merged
+    
+    def _drop_translation(self, translation_data: Dict):
+        """Note a translation dropped from a full TTS queue (its text is still logged)."""
+        print(f"⏩ [TTS] Queue full, skipped audio for {translation_data['transcript_id']}")
+    
     def _process_translations(self):
-        """Background thread to process translations."""
-        while not self.stop_event.is_set():
+        """Translation worker: blocks on the transcript queue until it takes a STOP sentinel."""
+        while True:
+            transcript_data = self.transcript_queue.get()
+            if transcript_data is STOP:
+                break
+            translation_data = None
             try:
-                if not self.transcript_queue.empty():
-                    transcript_data = self.transcript_queue.get(timeout=1)
-                    self._translate_transcript(transcript_data)
-                else:
-                    time.sleep(0.1)
+                translation_data = self._translate_transcript(transcript_data)
             except Exception as e:
                 print(f"❌ [Translation Thread] Error: {e}")
-                time.sleep(0.5)
+            finally:
+                # Always hand in the sequence numbers, or later utterances would wait forever
+                self.translation_reorder.push(transcript_data["seq"], translation_data)
+                for seq in transcript_data.get("merged_seqs", []):
+                    self.translation_reorder.push(seq, None)
     
-    def _translate_transcript(self, transcript_data: Dict):
-        """Translate a transcript and queue for TTS."""
+    def _emit_translation(self, translation_data: Dict):
+        """Record a finished translation and queue it for TTS; called in transcript order."""
+        transcript_id = translation_data["transcript_id"]
+        self.translation_map[transcript_id] = translation_data
+        self.translation_queue.put(translation_data)
+        
+        # Append translation to the session log
+        self.translation_log.append(translation_data, record_id=transcript_id)
+        
+        print(f"✅ [Translation] Completed in {translation_data['translation_time']:.2f}s")
+        for lang, trans_text in translation_data["translations"].items():
+            print(f"   {lang}: {trans_text[:60]}...")
+    
+    def _translate_transcript(self, transcript_data: Dict) -> Optional[Dict]:
+        """Translate a transcript; returns the translation record, or None on failure."""
         transcript_id = transcript_data["id"]
         text = transcript_data["text"]
         
@@ -174,97 +276,135 @@ class RealtimeSpeechToSpeech:
         result = translate_with_retry(
             text,
             target_languages=self.target_languages,
-            source_language=self.source_language.split("-")[0] if "-" in self.source_language else self.source_language
+            source_language=self.source_language.split("-")[0] if "-" in self.source_language else self.source_language,
+            client=self.translator_client,
+            deadline=TRANSLATION_DEADLINE
         )
         
         translation_time = time.time() - translation_start
         self.translation_timings.append(translation_time)
         
         if result["success"]:
-            translation_data = {
+            return {
                 "transcript_id": transcript_id,
+                "seq": transcript_data["seq"],
                 "original_text": text,
                 "translations": result["translations"],
                 "source_language": result["source_language"],
                 "timestamp": result["timestamp"],
                 "translation_time": translation_time
             }
-            
-            self.translation_map[transcript_id] = translation_data
-            self.translation_queue.put(translation_data)
-            
-            # Save translation JSON
-            translation_file = os.path.join(
-                TRANSLATIONS_OUTPUT_DIR,
-                f"translation_{transcript_id}.json"
-            )
-            with open(translation_file, 'w', encoding='utf-8') as f:
-                json.dump(translation_data, f, ensure_ascii=False, indent=2)
-            
-            print(f"✅ [Translation] Completed in {translation_time:.2f}s")
-            for lang, trans_text in result["translations"].items():
-                print(f"   {lang}: {trans_text[:60]}...")
-            
-            # Generate TTS for each translation
-            self._generate_tts(translation_data)
-        else:
-            print(f"❌ [Translation] Failed: {result.get('error', 'Unknown error')}")
+        print(f"❌ [Translation] Failed: {result.get('error', 'Unknown error')}")
+        return None
     
-    def _generate_tts(self, translation_data: Dict):
-        """Generate TTS audio for translated text."""
+    def _synthesize_language(self, transcript_id: str, lang: str, text: str, voice_name: str) -> Dict:
+        """Stream synthesis of one language of an utterance to disk (runs on the TTS pool)."""
+        print(f"🔊 [TTS] Generating audio for {lang}: {text[:40]}...")
+        audio_file = os.path.join(AUDIO_OUTPUT_DIR, f"tts_{transcript_id}_{lang}.wav")
+        
+        # Chunks are written as they arrive, so the file is playable before synthesis ends
+        outcome = self.speech_resources.synthesize_streaming(voice_name, text, output_path=audio_file)
+        record = {
+            "language": lang,
+            "voice": voice_name,
+            "status": outcome["status"],
+            "audio_file": audio_file if outcome["status"] == "success" else None,
+            "first_audio_time": outcome["first_audio_time"],
+            "tts_time": outcome["total_time"],
+            "error": outcome["error"]
+        }
+        if outcome["status"] != "success" and os.path.exists(audio_file):
+            os.remove(audio_file)
+        
+        self.tts_timings.append(record["tts_time"])
+        if record["first_audio_time"] is not None:
+            self.tts_first_audio_timings.setdefault(lang, []).append(record["first_audio_time"])
+        return record
+    
+    def _generate_tts(self, translation_data: Dict) -> Dict[str, Dict]:
+        """
+        Generate TTS audio for every translation of an utterance concurrently.
+        
+        Returns:
+            Dictionary mapping language -> synthesis result
+        """
         transcript_id = translation_data["transcript_id"]
+        fanout_start = time.time()
         
-        for lang, translated_text in translation_data["translations"].items():
-            if not translated_text.strip():
-                continue
-            
-            tts_start = time.time()
-            # Use language config for voice mapping
-            voice_name = get_tts_voice(lang)
-            
-            print(f"🔊 [TTS] Generating audio for {lang}: {translated_text[:40]}...")
-            
+        futures = {
+            self.tts_executor.submit(
+                self._synthesize_language, transcript_id, lang, translated_text,
+                self.tts_voices.get(lang) or get_tts_voice(lang)
+            ): lang
+            for lang, translated_text in translation_data["translations"].items()
+            if translated_text.strip()
+        }
+        
+        results = {}
+        for future in as_completed(futures):
+            record = future.result()
+            lang = record["language"]
+            results[lang] = record
+            if record["status"] == "success":
+                print(f"✅ [TTS] Saved {lang} audio: {os.path.basename(record['audio_file'])} "
+                      f"(first audio {record['first_audio_time']:.2f}s, done {record['tts_time']:.2f}s)")
+            else:
+                print(f"❌ [TTS] {lang}: {record['error']}")
+        
+        if not results:
+            return results
+        fanout_time = time.time() - fanout_start
+        latency_sum = sum(record["tts_time"] for record in results.values())
+        self.tts_fanout_timings.append((fanout_time, latency_sum))
+        succeeded = sum(1 for record in results.values() if record["status"] == "success")
+        print(f"🔊 [TTS] {transcript_id}: {succeeded}/{len(results)} languages in {fanout_time:.2f}s "
+              f"(sequential would be {latency_sum:.2f}s)")
+        
+        self.tts_map[transcript_id] = results
+        self.tts_log.append({
+            "transcript_id": transcript_id,
+            "timestamp": datetime.now().isoformat(),
+            "fanout_time": fanout_time,
+            "languages": results
+        }, record_id=transcript_id)
+        return results
+    
+    def _process_tts(self):
+        """TTS worker: fans queued translations out to the TTS pool until it takes a STOP sentinel."""
+        while True:
+            translation_data = self.translation_queue.get()
+            if translation_data is STOP:
+                break
             try:
-                # Update TTS config for this language
-                self.tts_config.speech_synthesis_voice_name = voice_name
-                
-                # Prepare audio file path
-                audio_file = os.path.join(
-                    AUDIO_OUTPUT_DIR,
-                    f"tts_{transcript_id}_{lang}.wav"
-                )
-                
-                # Create audio output config to save directly to file
-                audio_config = speechsdk.audio.AudioOutputConfig(filename=audio_file)
-                
-                # Create synthesizer with file output
-                synthesizer = speechsdk.SpeechSynthesizer(
-                    speech_config=self.tts_config,
-                    audio_config=audio_config
-                )
-                
-                # Synthesize speech directly to file
-                result = synthesizer.speak_text_async(translated_text).get()
-                
-                tts_time = time.time() - tts_start
-                self.tts_timings.append(tts_time)
-                
-                if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-                    print(f"✅ [TTS] Saved {lang} audio: {os.path.basename(audio_file)} ({tts_time:.2f}s)")
-                elif result.reason == speechsdk.ResultReason.Canceled:
-                    cancellation = speechsdk.CancellationDetails(result)
-                    print(f"❌ [TTS] {lang} canceled: {cancellation.reason}")
-                    if cancellation.reason == speechsdk.CancellationReason.Error:
-                        print(f"   Error: {cancellation.error_details}")
-                else:
-                    print(f"⚠️ [TTS] {lang} audio generation issue: {result.reason}")
-            
+                self._generate_tts(translation_data)
             except Exception as e:
-                print(f"❌ [TTS] {lang} error: {e}")
+                print(f"❌ [TTS Thread] Error: {e}")
     
-    def _process_tts(self):
-        """Background thread to process TTS (already handled in _generate_tts)."""
-        pass  # TTS is handled synchronously in _translate_transcript for simplicity
+    def stage_stats(self) -> Dict[str, Dict]:
+        """Queue depth, capacity, overflow policy, workers and counters per stage."""
+        return {
+            "translation": dict(self.transcript_queue.stats(), workers=self.translation_workers,
+                                reorder_waiting=self.translation_reorder.waiting),
+            "tts": dict(self.translation_queue.stats(), workers=self.tts_workers)
+        }
+    
+    def _print_stage_status(self):
+        """Print one line with the depth of every stage queue."""
+        parts = []
+        for name, stats in self.stage_stats().items():
+            part = f"{name} {stats['depth']}/{stats['maxsize']}"
+            if stats["dropped"] or stats["coalesced"]:
+                part += f" (dropped {stats['dropped']}, merged {stats['coalesced']})"
+            parts.append(part)
+        print(f"📊 [Queues] {' | '.join(parts)}")
+    
+    def _stop_stage(self, stage_queue: StageQueue, threads: List[threading.Thread]):
+        """Let a stage finish what is queued, then stop its workers with one sentinel each."""
+        for _ in threads:
+            stage_queue.put_stop()
+        deadline = time.monotonic() + STAGE_DRAIN_TIMEOUT
+        for thread in threads:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
     
     def start(self):
         """Start the real-time Speech-to-Speech pipeline."""
@@ -272,15 +412,20 @@ class RealtimeSpeechToSpeech:
         print("=" * 60)
         print(f"🌍 Source Language: {self.source_language}")
         print(f"🌍 Target Languages: {', '.join(self.target_languages)}")
+        print(f"⚙️  Translation: {self.translation_workers} workers, {self.transcript_queue.policy} when full | "
+              f"TTS: {self.tts_workers} workers, {self.translation_queue.policy} when full, "
+              f"{self.tts_concurrency} languages at once")
         print("=" * 60)
         print("\n💬 Speak into your microphone...")
         print("⏹️  Press Ctrl+C to stop\n")
         
         # Create speech recognizer
         audio_config = speechsdk.audio.AudioConfig(use_default_microphone=True)
-        speech_recognizer = speechsdk.SpeechRecognizer(
-            speech_config=self.speech_config,
-            audio_config=audio_config
+        speech_recognizer = self.speech_resources.create_recognizer(
+            audio_config,
+            language=self.source_language,
+            properties=self.stt_properties,
+            continuous=True
         )
         
         # Set up callbacks
@@ -288,9 +433,19 @@ class RealtimeSpeechToSpeech:
         speech_recognizer.recognizing.connect(self._stt_recognizing_callback)
         speech_recognizer.canceled.connect(self._stt_canceled_callback)
         
+        self._warm_tts()
+        
         # Start background threads
-        translation_thread = threading.Thread(target=self._process_translations, daemon=True)
-        translation_thread.start()
+        translation_threads = [
+            threading.Thread(target=self._process_translations, name=f"translate-{i}", daemon=True)
+            for i in range(self.translation_workers)
+        ]
+        tts_threads = [
+            threading.Thread(target=self._process_tts, name=f"tts-{i}", daemon=True)
+            for i in range(self.tts_workers)
+        ]
+        for thread in translation_threads + tts_threads:
+            thread.start()
         
         self.is_running = True
         
@@ -299,9 +454,10 @@ class RealtimeSpeechToSpeech:
             speech_recognizer.start_continuous_recognition_async().get()
             print("🔴 Recording started...\n")
             
-            # Keep running until stopped
-            while not self.stop_event.is_set():
-                time.sleep(0.1)
+            # Keep running until stopped (Ctrl+C or a canceled session), reporting queue depths
+            interval = STAGE_STATUS_INTERVAL if STAGE_STATUS_INTERVAL > 0 else None
+            while not self.stop_event.wait(interval):
+                self._print_stage_status()
         
         except KeyboardInterrupt:
             print("\n⏹️  Stopping pipeline...")
@@ -311,8 +467,13 @@ class RealtimeSpeechToSpeech:
             self.is_running = False
             self.stop_event.set()
             
-            # Wait for threads to finish
-            translation_thread.join(timeout=5)
+            # Drain stage by stage: translations first, so their output still reaches TTS
+            self._stop_stage(self.transcript_queue, translation_threads)
+            self._stop_stage(self.translation_queue, tts_threads)
+            self.tts_executor.shutdown(wait=True)
+            self.transcript_log.flush(fsync=True)
+            self.translation_log.flush(fsync=True)
+            self.tts_log.flush(fsync=True)
             
             # Print summary
             self._print_summary()
@@ -337,6 +498,27 @@ class RealtimeSpeechToSpeech:
             avg_tts = sum(self.tts_timings) / len(self.tts_timings)
             print(f"⏱️  Avg TTS time: {avg_tts:.2f}s")
         
+        if self.tts_first_audio_timings:
+            all_first = [t for timings in self.tts_first_audio_timings.values() for t in timings]
+            print(f"⏱️  Avg time to first audio: {sum(all_first) / len(all_first):.2f}s")
+            for lang, timings in sorted(self.tts_first_audio_timings.items()):
+                print(f"   {lang}: {sum(timings) / len(timings):.2f}s avg, {max(timings):.2f}s max")
+        
+        if self.tts_fanout_timings:
+            avg_fanout = sum(wall for wall, _ in self.tts_fanout_timings) / len(self.tts_fanout_timings)
+            avg_sum = sum(total for _, total in self.tts_fanout_timings) / len(self.tts_fanout_timings)
+            print(f"⏱️  Avg time to all audio: {avg_fanout:.2f}s (sum of language latencies {avg_sum:.2f}s)")
+        
+        for name, stats in self.stage_stats().items():
+            print(f"📦 {name.capitalize()} queue: max depth {stats['max_depth']}/{stats['maxsize']}, "
+                  f"{stats['policy']}, dropped {stats['dropped']}, merged {stats['coalesced']}, "
+                  f"producer waited {stats['blocked']}x")
+        
+        pool_stats = self.speech_resources.synthesizers.stats()
+        print(f"🔥 Synthesizer pool: {pool_stats['hit_rate']:.0%} hit rate "
+              f"({pool_stats['hits']} hits, {pool_stats['misses']} misses, {pool_stats['rebuilt']} rebuilt, "
+              f"{pool_stats['evicted']} evicted)")
+        
         print(f"\n💾 Output saved to: {OUTPUT_DIR}")
         print("=" * 60)
 
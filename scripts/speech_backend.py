@@ -0,0 +1,20 @@
+"""
+Speech Backend Selection
+Exposes `speechsdk`: the real Azure Speech SDK, or the offline fake
+(fake_speechsdk.py) when SPEECH_BACKEND=fake, so callers run unchanged
+against either.
+"""
+
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+SPEECH_BACKEND = os.getenv("SPEECH_BACKEND", "azure").lower()
+
+if SPEECH_BACKEND == "fake":
+    import fake_speechsdk as speechsdk
+elif SPEECH_BACKEND == "azure":
+    import azure.cognitiveservices.speech as speechsdk
+else:
+    raise ValueError(f"Unknown SPEECH_BACKEND: {SPEECH_BACKEND} (expected 'azure' or 'fake')")
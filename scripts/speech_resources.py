@@ -0,0 +1,497 @@
+"""
+Shared Speech Resources
+Process-wide factory for Azure Speech objects: SpeechConfig instances are
+cached per (region, language, voice, output format), in-memory synthesizers
+are kept warm in a pool per voice and connections are pre-opened to skip
+the handshake on the first request
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from dotenv import load_dotenv
+from speech_backend import speechsdk
+
+from audio_utils import ProgressiveWavWriter, build_wav_header
+
+load_dotenv()
+SPEECH_KEY = os.getenv("AZURE_SPEECH_KEY")
+SPEECH_REGION = os.getenv("AZURE_REGION")
+
+# Pre-open service connections when recognizers/synthesizers are created
+SPEECH_WARM_CONNECTIONS = os.getenv("AZURE_SPEECH_WARM_CONNECTIONS", "1") == "1"
+# Concurrent recognition sessions allowed by the Speech resource (S0 default: 100)
+STT_SESSION_LIMIT = int(os.getenv("AZURE_SPEECH_SESSION_LIMIT", "100"))
+# Synthesis requests run side by side when fanning one text out to many languages
+TTS_CONCURRENCY = int(os.getenv("AZURE_TTS_CONCURRENCY", "8"))
+# Pooled synthesizers unused for this many seconds are closed
+TTS_POOL_IDLE_TIMEOUT = float(os.getenv("AZURE_TTS_POOL_IDLE_TIMEOUT", "300"))
+# Idle synthesizers kept per voice (extra ones created under load are closed on release)
+TTS_POOL_MAX_IDLE = int(os.getenv("AZURE_TTS_POOL_MAX_IDLE", "4"))
+# Streaming synthesis: headerless PCM read in chunks of this many bytes (100 ms)
+TTS_STREAM_FORMAT = speechsdk.SpeechSynthesisOutputFormat.Raw16Khz16BitMonoPcm
+TTS_STREAM_SAMPLE_RATE = 16000
+TTS_STREAM_CHUNK_BYTES = 3200
+
+
+class _PooledSynthesizer:
+    """A pooled synthesizer with its service connection and bookkeeping."""
+
+    def __init__(self, key: Tuple, synthesizer, connection):
+        self.key = key
+        self.synthesizer = synthesizer
+        self.connection = connection
+        self.last_used = time.monotonic()
+        self.uses = 0
+        self.disconnected = False
+
+    def close(self):
+        try:
+            self.connection.close()
+        except Exception:
+            pass
+
+
+class SynthesizerPool:
+    """
+    Long-lived in-memory synthesizers per (voice, output format).
+
+    A synthesizer is leased by one caller at a time and returned warm for
+    the next one. Before reuse, a synthesizer whose connection dropped is
+    reconnected or rebuilt. Synthesizers that failed are discarded, and
+    ones idle longer than idle_timeout are closed.
+    """
+
+    def __init__(self, factory: "SpeechResourceFactory", idle_timeout: float = TTS_POOL_IDLE_TIMEOUT,
+                 max_idle: int = TTS_POOL_MAX_IDLE):
+        self.factory = factory
+        self.idle_timeout = idle_timeout
+        self.max_idle = max(1, max_idle)
+        self._idle: Dict[Tuple, List[_PooledSynthesizer]] = {}
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._counts = {
+            "hits": 0,
+            "misses": 0,
+            "created": 0,
+            "reconnected": 0,
+            "rebuilt": 0,
+            "discarded": 0,
+            "evicted": 0,
+        }
+
+    def _create(self, key: Tuple) -> _PooledSynthesizer:
+        voice, output_format = key
+        config = self.factory.get_config(voice=voice, output_format=output_format)
+        synthesizer = speechsdk.SpeechSynthesizer(speech_config=config, audio_config=None)
+        entry = _PooledSynthesizer(key, synthesizer, speechsdk.Connection.from_speech_synthesizer(synthesizer))
+        entry.connection.disconnected.connect(lambda evt: setattr(entry, "disconnected", True))
+        with self._lock:
+            self._counts["created"] += 1
+        if self.factory.warm_connections:
+            try:
+                entry.connection.open(False)
+                self.factory._count("connections_opened")
+            except Exception as e:
+                self.factory._count("connection_errors")
+                print(f"⚠️ [Speech] Could not pre-open connection for {voice}: {e}")
+        return entry
+
+    def _check_health(self, entry: _PooledSynthesizer) -> bool:
+        """Reopen a dropped connection; False if the synthesizer has to be rebuilt."""
+        if not entry.disconnected:
+            return True
+        try:
+            entry.connection.open(False)
+        except Exception:
+            return False
+        entry.disconnected = False
+        with self._lock:
+            self._counts["reconnected"] += 1
+        return True
+
+    def acquire(self, voice: str, output_format: Any = None) -> _PooledSynthesizer:
+        """Take a warm synthesizer for voice out of the pool, creating one if none is idle."""
+        self.evict_idle()
+        key = (voice, output_format)
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                entry = idle.pop() if idle else None  # most recently used is the warmest
+            if entry is None:
+                break
+            if self._check_health(entry):
+                with self._lock:
+                    self._counts["hits"] += 1
+                    self._in_use += 1
+                entry.uses += 1
+                return entry
+            entry.close()
+            with self._lock:
+                self._counts["rebuilt"] += 1
+
+        entry = self._create(key)
+        with self._lock:
+            self._counts["misses"] += 1
+            self._in_use += 1
+        entry.uses += 1
+        return entry
+
+    def release(self, entry: _PooledSynthesizer, healthy: bool = True):
+        """Return a leased synthesizer; unhealthy ones are closed instead of reused."""
+        entry.last_used = time.monotonic()
+        with self._lock:
+            self._in_use -= 1
+            idle = self._idle.setdefault(entry.key, [])
+            keep = healthy and len(idle) < self.max_idle
+            if keep:
+                idle.append(entry)
+            elif not healthy:
+                self._counts["discarded"] += 1
+        if not keep:
+            entry.close()
+
+    @contextmanager
+    def lease(self, voice: str, output_format: Any = None) -> Iterator[Any]:
+        """Context manager yielding a pooled synthesizer; it is discarded if the block raises."""
+        entry = self.acquire(voice, output_format)
+        healthy = False
+        try:
+            yield entry.synthesizer
+            healthy = True
+        finally:
+            self.release(entry, healthy)
+
+    def prewarm(self, voices: Iterable[str], per_voice: int = 1, output_format: Any = None) -> int:
+        """
+        Create and connect synthesizers ahead of the first request.
+
+        Args:
+            voices: Voice names to warm
+            per_voice: Idle synthesizers to have ready for each voice
+            output_format: speechsdk.SpeechSynthesisOutputFormat member
+
+        Returns:
+            Number of synthesizers created
+        """
+        per_voice = min(max(1, per_voice), self.max_idle)
+        missing = []
+        with self._lock:
+            for voice in dict.fromkeys(voices):
+                key = (voice, output_format)
+                missing += [key] * max(0, per_voice - len(self._idle.get(key, [])))
+        if not missing:
+            return 0
+        with ThreadPoolExecutor(max_workers=min(TTS_CONCURRENCY, len(missing)) or 1) as executor:
+            created = list(executor.map(self._create, missing))
+        with self._lock:
+            for entry in created:
+                self._idle.setdefault(entry.key, []).append(entry)
+        return len(created)
+
+    def evict_idle(self) -> int:
+        """Close synthesizers idle longer than idle_timeout; returns how many."""
+        cutoff = time.monotonic() - self.idle_timeout
+        evicted = []
+        with self._lock:
+            for key, idle in list(self._idle.items()):
+                evicted += [entry for entry in idle if entry.last_used < cutoff]
+                idle[:] = [entry for entry in idle if entry.last_used >= cutoff]
+                if not idle:
+                    del self._idle[key]
+            self._counts["evicted"] += len(evicted)
+        for entry in evicted:
+            entry.close()
+        return len(evicted)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit rate, lifecycle counters and current pool size."""
+        with self._lock:
+            leases = self._counts["hits"] + self._counts["misses"]
+            return dict(
+                self._counts,
+                hit_rate=self._counts["hits"] / leases if leases else 0.0,
+                idle=sum(len(idle) for idle in self._idle.values()),
+                in_use=self._in_use,
+                voices=len(self._idle)
+            )
+
+
+class SpeechResourceFactory:
+    """
+    Hands out shared Speech SDK objects.
+
+    SpeechConfig objects are shared between callers and must be treated as
+    read-only; ask for a differently keyed config instead of mutating one.
+    Synthesizers without an audio config return audio in memory and can be
+    reused call after call, but not concurrently, so they are leased from
+    a per-voice SynthesizerPool. Recognizers are bound to their audio
+    input and are created fresh from the cached config.
+    """
+
+    def __init__(self, key: Optional[str] = None, region: Optional[str] = None,
+                 warm_connections: bool = SPEECH_WARM_CONNECTIONS):
+        self.key = key or SPEECH_KEY
+        self.region = region or SPEECH_REGION
+        self.warm_connections = warm_connections
+        self._configs: Dict[Tuple, Any] = {}
+        self._lock = threading.Lock()
+        self._counts = {
+            "configs_created": 0,
+            "config_hits": 0,
+            "recognizers_created": 0,
+            "connections_opened": 0,
+            "connection_errors": 0,
+        }
+        self.synthesizers = SynthesizerPool(self)
+
+    @property
+    def has_credentials(self) -> bool:
+        """Whether both the subscription key and region are configured."""
+        return bool(self.key and self.region)
+
+    def _count(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counts[name] += amount
+
+    def get_config(
+        self,
+        language: Optional[str] = None,
+        voice: Optional[str] = None,
+        output_format: Any = None,
+        properties: Optional[Dict[Any, str]] = None
+    ):
+        """
+        Return the shared SpeechConfig for these settings.
+
+        Args:
+            language: Recognition language (e.g. "en-US")
+            voice: Synthesis voice name (e.g. "hi-IN-SwaraNeural")
+            output_format: speechsdk.SpeechSynthesisOutputFormat member
+            properties: Extra PropertyId -> value settings
+
+        Returns:
+            A cached speechsdk.SpeechConfig (do not mutate)
+        """
+        key = (
+            self.region, language, voice, output_format,
+            tuple(sorted((str(k), v) for k, v in (properties or {}).items()))
+        )
+        with self._lock:
+            config = self._configs.get(key)
+            if config is not None:
+                self._counts["config_hits"] += 1
+                return config
+
+            config = speechsdk.SpeechConfig(subscription=self.key, region=self.region)
+            if language:
+                config.speech_recognition_language = language
+            if voice:
+                config.speech_synthesis_voice_name = voice
+            if output_format is not None:
+                config.set_speech_synthesis_output_format(output_format)
+            for property_id, value in (properties or {}).items():
+                config.set_property(property_id, value)
+            self._configs[key] = config
+            self._counts["configs_created"] += 1
+            return config
+
+    def _warm(self, owner, connection_source, for_continuous: bool = False):
+        """
+        Open the service connection ahead of the first request. The
+        connection is kept on its owner, so it is released with it.
+        """
+        try:
+            connection = connection_source()
+            connection.open(for_continuous)
+        except Exception as e:
+            self._count("connection_errors")
+            print(f"⚠️ [Speech] Could not pre-open connection: {e}")
+            return
+        self._count("connections_opened")
+        owner._warm_connection = connection
+
+    def create_recognizer(
+        self,
+        audio_config,
+        language: str = "en-US",
+        properties: Optional[Dict[Any, str]] = None,
+        continuous: bool = False,
+        warm: Optional[bool] = None
+    ):
+        """
+        Create a SpeechRecognizer for audio_config from the shared config.
+
+        Args:
+            audio_config: speechsdk.audio.AudioConfig for the input
+            language: Recognition language
+            properties: Extra PropertyId -> value settings
+            continuous: Whether the connection will be used for continuous recognition
+            warm: Pre-open the connection (defaults to the factory setting)
+        """
+        config = self.get_config(language=language, properties=properties)
+        recognizer = speechsdk.SpeechRecognizer(speech_config=config, audio_config=audio_config)
+        self._count("recognizers_created")
+        if self.warm_connections if warm is None else warm:
+            self._warm(recognizer, lambda: speechsdk.Connection.from_recognizer(recognizer), continuous)
+        return recognizer
+
+    def synthesizer(self, voice: str, output_format: Any = None):
+        """
+        Lease a warm in-memory synthesizer for a voice from the pool.
+        Results carry the audio in result.audio_data.
+
+        Usage:
+            with resources.synthesizer(voice) as synthesizer:
+                result = synthesizer.speak_text_async(text).get()
+        """
+        return self.synthesizers.lease(voice, output_format)
+
+    def speak_text(self, voice: str, text: str, output_format: Any = None):
+        """
+        Synthesize text on a pooled synthesizer and return the SDK result.
+        A synthesizer whose request was canceled with an error is rebuilt
+        rather than reused.
+        """
+        entry = self.synthesizers.acquire(voice, output_format)
+        healthy = False
+        try:
+            result = entry.synthesizer.speak_text_async(text).get()
+            healthy = not (
+                result.reason == speechsdk.ResultReason.Canceled
+                and speechsdk.CancellationDetails(result).reason == speechsdk.CancellationReason.Error
+            )
+            return result
+        finally:
+            self.synthesizers.release(entry, healthy)
+
+    def stream_text(self, voice: str, text: str, chunk_size: int = TTS_STREAM_CHUNK_BYTES) -> Iterator[bytes]:
+        """
+        Synthesize text on a pooled synthesizer and yield the audio as the
+        service produces it, instead of waiting for the complete result.
+
+        Args:
+            voice: Synthesis voice name
+            text: Text to speak
+            chunk_size: Largest chunk yielded, in bytes
+
+        Yields:
+            Raw 16 kHz 16-bit mono PCM chunks (no WAV header)
+
+        Raises:
+            RuntimeError: Synthesis was canceled
+        """
+        entry = self.synthesizers.acquire(voice, TTS_STREAM_FORMAT)
+        healthy = False
+        try:
+            result = entry.synthesizer.start_speaking_text_async(text).get()
+            if result.reason == speechsdk.ResultReason.Canceled:
+                cancellation = speechsdk.CancellationDetails(result)
+                healthy = cancellation.reason != speechsdk.CancellationReason.Error
+                raise RuntimeError(f"TTS canceled: {cancellation.reason} ({cancellation.error_details})")
+
+            stream = speechsdk.AudioDataStream(result)
+            buffer = bytes(chunk_size)
+            while True:
+                filled = stream.read_data(buffer)
+                if filled == 0:
+                    break
+                yield buffer[:filled]
+            if stream.status == speechsdk.StreamStatus.Canceled:
+                details = stream.cancellation_details
+                raise RuntimeError(f"TTS canceled: {details.reason} ({details.error_details})")
+            # A consumer that stops early leaves the synthesizer mid-request, so it is not reused
+            healthy = True
+        finally:
+            self.synthesizers.release(entry, healthy)
+
+    def synthesize_streaming(
+        self,
+        voice: str,
+        text: str,
+        output_path: Optional[str] = None,
+        on_chunk: Optional[Callable[[bytes], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Stream synthesis of text, timing the first audio byte. With a sink
+        (output_path or on_chunk) chunks are handed on as they arrive and
+        not kept in memory.
+
+        Args:
+            voice: Synthesis voice name
+            text: Text to speak
+            output_path: WAV file written progressively as chunks arrive
+            on_chunk: Called with each raw PCM chunk as it arrives (e.g. playback)
+
+        Returns:
+            Dictionary with status, audio (complete WAV bytes; empty when a
+            sink was given), audio_file, first_audio_time (seconds to the
+            first byte), total_time, bytes and error
+        """
+        start = time.perf_counter()
+        outcome = {"status": "error", "audio": b"", "audio_file": output_path, "first_audio_time": None,
+                   "total_time": None, "bytes": 0, "error": None}
+        # Only buffered when there is nowhere else for the audio to go
+        pcm = bytearray() if output_path is None and on_chunk is None else None
+        writer = ProgressiveWavWriter(output_path, TTS_STREAM_SAMPLE_RATE) if output_path else None
+        try:
+            for chunk in self.stream_text(voice, text):
+                if outcome["first_audio_time"] is None:
+                    outcome["first_audio_time"] = time.perf_counter() - start
+                outcome["bytes"] += len(chunk)
+                if pcm is not None:
+                    pcm += chunk
+                if writer is not None:
+                    writer.write(chunk)
+                if on_chunk is not None:
+                    on_chunk(chunk)
+            outcome["status"] = "success"
+        except Exception as e:
+            outcome["error"] = str(e)
+        finally:
+            if writer is not None:
+                writer.close()
+        outcome["total_time"] = time.perf_counter() - start
+        if pcm is not None:
+            outcome["audio"] = build_wav_header(len(pcm), TTS_STREAM_SAMPLE_RATE) + bytes(pcm)
+        return outcome
+
+    def stats(self) -> Dict[str, Any]:
+        """Creation and reuse counters for monitoring (synthesizer pool under "synthesizer_pool")."""
+        with self._lock:
+            counts = dict(self._counts, configs_cached=len(self._configs))
+        counts["synthesizer_pool"] = self.synthesizers.stats()
+        return counts
+
+
+_speech_resources: Optional[SpeechResourceFactory] = None
+_speech_resources_lock = threading.Lock()
+
+
+def get_speech_resources() -> SpeechResourceFactory:
+    """Return the process-wide speech resource factory, creating it on first use."""
+    global _speech_resources
+    with _speech_resources_lock:
+        if _speech_resources is None:
+            _speech_resources = SpeechResourceFactory()
+        return _speech_resources
+
+
+_session_slots: Optional[threading.BoundedSemaphore] = None
+_session_slots_lock = threading.Lock()
+
+
+def get_session_slots() -> threading.BoundedSemaphore:
+    """
+    Return the process-wide semaphore guarding concurrent recognition
+    sessions, so parallel batches together stay under STT_SESSION_LIMIT.
+    """
+    global _session_slots
+    with _session_slots_lock:
+        if _session_slots is None:
+            _session_slots = threading.BoundedSemaphore(STT_SESSION_LIMIT)
+        return _session_slots
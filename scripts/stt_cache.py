@@ -0,0 +1,173 @@
+"""
+Speech-to-Text Result Cache
+Persistent SQLite cache of transcription results keyed by a streaming
+SHA-256 of the audio bytes plus language and recognition settings, so the
+same audio is never sent to the service twice
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+
+STT_CACHE_ENABLED = os.getenv("STT_CACHE_ENABLED", "1").lower() not in ("0", "false", "no")
+# Eviction starts once stored transcripts exceed this many bytes
+STT_CACHE_MAX_BYTES = int(os.getenv("STT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+STT_CACHE_PATH = os.getenv(
+    "STT_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "stt_cache.sqlite3")
+)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_audio_file(file_path: str, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """SHA-256 hex digest of a file, read in chunks so large media never sits in memory."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SttCache:
+    """
+    SQLite-backed transcription cache with size-bounded LRU eviction.
+    Only complete results ("ok" and "no_speech") are stored. Safe to share
+    across threads.
+    """
+
+    def __init__(self, db_path: str = STT_CACHE_PATH, max_bytes: int = STT_CACHE_MAX_BYTES):
+        """
+        Args:
+            db_path: SQLite file holding the cache
+            max_bytes: Total stored result size before least recently used entries are evicted
+        """
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS transcripts ("
+            " audio_sha256 TEXT NOT NULL, language TEXT NOT NULL, settings TEXT NOT NULL,"
+            " result TEXT NOT NULL, size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL, last_used_at REAL NOT NULL,"
+            " PRIMARY KEY (audio_sha256, language, settings))"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS transcripts_lru ON transcripts (last_used_at)")
+        self._db.commit()
+
+    def get(self, audio_sha256: str, language: str, settings: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result.
+
+        Returns:
+            The stored transcribe_file_result() dictionary, or None on a miss
+        """
+        key = (audio_sha256, language, settings)
+        with self._lock:
+            try:
+                row = self._db.execute(
+                    "SELECT result FROM transcripts WHERE audio_sha256 = ? AND language = ? AND settings = ?",
+                    key
+                ).fetchone()
+                if row is not None:
+                    self._db.execute(
+                        "UPDATE transcripts SET last_used_at = ?"
+                        " WHERE audio_sha256 = ? AND language = ? AND settings = ?",
+                        (time.time(),) + key
+                    )
+                    self._db.commit()
+            except sqlite3.Error as e:
+                print(f"⚠️ STT cache read failed: {e}")
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return json.loads(row[0])
+
+    def put(self, audio_sha256: str, language: str, settings: str, result: Dict[str, Any]):
+        """Store a result, then evict least recently used entries beyond max_bytes."""
+        payload = json.dumps(result, ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO transcripts VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (audio_sha256, language, settings, payload, len(payload.encode("utf-8")), now, now)
+                )
+                self.stores += 1
+                self._evict_locked()
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"⚠️ STT cache write failed: {e}")
+
+    def _evict_locked(self):
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM transcripts").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._db.execute(
+            "SELECT rowid, size FROM transcripts ORDER BY last_used_at ASC"
+        ).fetchall()
+        doomed = []
+        for rowid, size in rows:
+            if total <= self.max_bytes:
+                break
+            doomed.append((rowid,))
+            total -= size
+        self._db.executemany("DELETE FROM transcripts WHERE rowid = ?", doomed)
+        self.evictions += len(doomed)
+
+    def clear(self):
+        """Drop every cached result."""
+        with self._lock:
+            self._db.execute("DELETE FROM transcripts")
+            self._db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters and current size."""
+        with self._lock:
+            entries, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM transcripts"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes
+        }
+
+
+_stt_cache: Optional[SttCache] = None
+_stt_cache_lock = threading.Lock()
+
+
+def get_stt_cache() -> Optional[SttCache]:
+    """Return the process-wide SttCache (None if disabled via env or SQLite is unavailable)."""
+    global _stt_cache
+    if not STT_CACHE_ENABLED:
+        return None
+    with _stt_cache_lock:
+        if _stt_cache is None:
+            try:
+                _stt_cache = SttCache()
+            except (sqlite3.Error, OSError) as e:
+                print(f"⚠️ STT cache unavailable ({e}), transcribing without it")
+                return None
+        return _stt_cache
@@ -9,6 +9,7 @@ import json
 from datetime import datetime
 from dotenv import load_dotenv
 from translator import translate_with_retry, save_translation
+from async_translator import translate_many_sync
 
 try:
     from language_config import DEFAULT_TARGET_LANGUAGES
@@ -61,7 +62,8 @@ def translate_transcripts_from_csv(
         print("❌ No transcripts found in CSV file.")
         return
     
-    # Translate each transcript
+    # Collect translatable transcripts
+    pending = []
     for idx, row in enumerate(rows, 1):
         transcript = row.get("transcript", "").strip()
         filename = row.get("filename", f"transcript_{idx}")
@@ -71,23 +73,28 @@ def translate_transcripts_from_csv(
             print(f"⏭️  Skipping {filename}: {transcript}")
             continue
         
-        print(f"\n[{idx}/{len(rows)}] Translating: {filename}")
+        pending.append((idx, filename, source_lang, transcript))
+    
+    # Translate in packed multi-document requests, many in flight at once
+    # Convert language code format (en-US -> en)
+    print(f"\n📦 Translating {len(pending)} transcripts in concurrent batched requests...")
+    results = translate_many_sync(
+        [transcript for _, _, _, transcript in pending],
+        target_languages=target_languages,
+        source_language=[
+            source_lang.split("-")[0] if "-" in source_lang else source_lang
+            for _, _, source_lang, _ in pending
+        ]
+    )
+    
+    for (idx, filename, source_lang, transcript), result in zip(pending, results):
+        print(f"\n[{idx}/{len(rows)}] Translated: {filename}")
         print(f"   Original: {transcript[:80]}...")
         
-        # Convert language code format (en-US -> en)
-        source_lang_code = source_lang.split("-")[0] if "-" in source_lang else source_lang
-        
-        # Translate
-        result = translate_with_retry(
-            transcript,
-            target_languages=target_languages,
-            source_language=source_lang_code
-        )
-        
         if result["success"]:
-            # Save individual translation JSON
-            translation_file = save_translation(result, transcript_id=f"{filename}_{idx}")
-            print(f"   ✅ Saved: {os.path.basename(translation_file)}")
+            # Append the record to the daily JSONL translation log
+            translation_log = save_translation(result, transcript_id=f"{filename}_{idx}")
+            print(f"   ✅ Appended to translation log: {translation_log}")
             
             # Prepare CSV row
             csv_row = {
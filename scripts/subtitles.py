@@ -0,0 +1,371 @@
+"""
+Subtitle Output (SRT / WebVTT)
+Turns recognized segments with word-level timestamps into length- and
+duration-bounded cues and writes them as they arrive, together with
+translated tracks built by batch-translating the cue texts.
+
+    python subtitles.py --format srt vtt --translate hi te
+"""
+
+import os
+import sys
+import textwrap
+from contextlib import ExitStack
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from translator import translate_batch
+
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+OUTPUT_DIR = os.path.join(BASE_DIR, "subtitles")
+
+SUBTITLE_FORMATS = ("srt", "vtt")
+SUBTITLE_MAX_LINE_CHARS = int(os.getenv("SUBTITLE_MAX_LINE_CHARS", "42"))
+SUBTITLE_MAX_LINES = int(os.getenv("SUBTITLE_MAX_LINES", "2"))
+SUBTITLE_MAX_CUE_SECONDS = float(os.getenv("SUBTITLE_MAX_CUE_SECONDS", "7"))
+# A sentence end only closes a cue that has been on screen at least this long
+SUBTITLE_MIN_CUE_SECONDS = 1.0
+# Cues per translate_batch() call; translated tracks trail the original by at most this many
+SUBTITLE_TRANSLATE_BATCH = int(os.getenv("SUBTITLE_TRANSLATE_BATCH", "50"))
+
+_SENTENCE_ENDINGS = (".", "!", "?", "।", "。", "！", "？")
+
+
+def _segment_words(segment: Dict) -> List[Dict]:
+    """Word timings of a segment; without them, spread its words over the segment by length."""
+    if segment.get("words"):
+        return segment["words"]
+    tokens = segment["text"].split()
+    total_chars = sum(len(token) for token in tokens) or 1
+    words, position = [], segment["offset"]
+    for token in tokens:
+        duration = segment["duration"] * len(token) / total_chars
+        words.append({"word": token, "offset": position, "duration": duration})
+        position += duration
+    return words
+
+
+def iter_cues(
+    segments: Iterable[Dict],
+    max_line_chars: int = SUBTITLE_MAX_LINE_CHARS,
+    max_lines: int = SUBTITLE_MAX_LINES,
+    max_seconds: float = SUBTITLE_MAX_CUE_SECONDS
+) -> Iterator[Dict]:
+    """
+    Group recognized words into subtitle cues, one segment at a time.
+
+    A cue closes when the next word would overflow max_lines lines of
+    max_line_chars or stretch it past max_seconds, at a sentence end, and
+    at every segment end (segments end at pauses in the speech).
+
+    Args:
+        segments: Segments as yielded by transcribe_files.iter_segments(),
+            ideally with words=True
+        max_line_chars: Characters per subtitle line
+        max_lines: Lines per cue
+        max_seconds: Longest time a cue stays on screen
+
+    Yields:
+        {"index": 1-based cue number, "start": seconds, "end": seconds, "text": str}
+    """
+    max_chars = max_line_chars * max_lines
+    index = 0
+    for segment in segments:
+        words: List[Dict] = []
+        chars = 0
+        for word in _segment_words(segment):
+            end = word["offset"] + word["duration"]
+            if words and (chars + 1 + len(word["word"]) > max_chars or end - words[0]["offset"] > max_seconds):
+                index += 1
+                yield _make_cue(index, words)
+                words, chars = [], 0
+            chars += len(word["word"]) + (1 if words else 0)
+            words.append(word)
+            if (word["word"].endswith(_SENTENCE_ENDINGS)
+                    and end - words[0]["offset"] >= SUBTITLE_MIN_CUE_SECONDS):
+                index += 1
+                yield _make_cue(index, words)
+                words, chars = [], 0
+        if words:
+            index += 1
+            yield _make_cue(index, words)
+
+
+def _make_cue(index: int, words: List[Dict]) -> Dict:
+    last = words[-1]
+    return {
+        "index": index,
+        "start": words[0]["offset"],
+        "end": max(last["offset"] + last["duration"], words[0]["offset"] + 0.001),
+        "text": " ".join(word["word"] for word in words),
+    }
+
+
+def wrap_cue_text(text: str, max_line_chars: int = SUBTITLE_MAX_LINE_CHARS,
+                  max_lines: int = SUBTITLE_MAX_LINES) -> str:
+    """Break cue text into at most max_lines lines (the last one absorbs any overflow)."""
+    lines = textwrap.wrap(text, max_line_chars) or [""]
+    if len(lines) > max_lines:
+        lines = lines[:max_lines - 1] + [" ".join(lines[max_lines - 1:])]
+    return "\n".join(lines)
+
+
+def format_timestamp(seconds: float, subtitle_format: str = "srt") -> str:
+    """HH:MM:SS,mmm for SRT or HH:MM:SS.mmm for WebVTT."""
+    millis = max(0, int(round(seconds * 1000)))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    separator = "," if subtitle_format == "srt" else "."
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
+
+def format_cue(cue: Dict, subtitle_format: str = "srt", text: Optional[str] = None) -> str:
+    """
+    Render one cue block (including the blank line that ends it).
+
+    Args:
+        cue: Cue from iter_cues()
+        subtitle_format: "srt" or "vtt"
+        text: Replacement text, e.g. a translation (default: the cue's own text)
+    """
+    timing = (f"{format_timestamp(cue['start'], subtitle_format)} --> "
+              f"{format_timestamp(cue['end'], subtitle_format)}")
+    body = wrap_cue_text(cue["text"] if text is None else text)
+    if subtitle_format == "srt":
+        return f"{cue['index']}\n{timing}\n{body}\n\n"
+    return f"{timing}\n{body}\n\n"
+
+
+class SubtitleWriter:
+    """Appends cues to an SRT or WebVTT file and flushes each one, so the file grows as cues arrive."""
+
+    def __init__(self, path: str, subtitle_format: Optional[str] = None):
+        """
+        Args:
+            path: Output file
+            subtitle_format: "srt" or "vtt" (default: from the file extension)
+        """
+        self.path = path
+        self.format = subtitle_format or os.path.splitext(path)[1].lstrip(".").lower()
+        if self.format not in SUBTITLE_FORMATS:
+            raise ValueError(f"Unsupported subtitle format: {self.format}")
+        self.cues_written = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file = open(path, "w", encoding="utf-8")
+        if self.format == "vtt":
+            self._file.write("WEBVTT\n\n")
+
+    def write(self, cue: Dict, text: Optional[str] = None):
+        """Write one cue, optionally with replacement text."""
+        self._file.write(format_cue(cue, self.format, text))
+        self._file.flush()
+        self.cues_written += 1
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self) -> "SubtitleWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def iter_translated_cues(
+    cues: Iterable[Dict],
+    target_languages: Sequence[str],
+    source_language: Optional[str] = None,
+    batch_size: int = SUBTITLE_TRANSLATE_BATCH
+) -> Iterator[Tuple[Dict, Dict[str, Optional[str]]]]:
+    """
+    Translate cue texts in batches of batch_size while cues keep streaming in.
+
+    Args:
+        cues: Cues from iter_cues()
+        target_languages: Translator language codes (e.g. ["hi", "te"])
+        source_language: Source language code (auto-detect if None)
+        batch_size: Cues per translate_batch() call
+
+    Yields:
+        (cue, {language: translated text, or None if that cue failed})
+    """
+    batch: List[Dict] = []
+    for cue in chain(cues, [None]):
+        if cue is not None:
+            batch.append(cue)
+            if len(batch) < batch_size:
+                continue
+        if not batch:
+            break
+        results = translate_batch([c["text"] for c in batch], list(target_languages), source_language)
+        for batch_cue, result in zip(batch, results):
+            translations = (result.get("translations") or {}) if result.get("success") else {}
+            yield batch_cue, {language: translations.get(language) for language in target_languages}
+        batch = []
+
+
+def subtitle_paths(output_base: str, formats: Sequence[str] = ("srt",),
+                   target_languages: Sequence[str] = ()) -> Dict[Optional[str], Dict[str, str]]:
+    """Output files by track (None = original language) and format, e.g. talk.srt and talk.hi.srt."""
+    paths: Dict[Optional[str], Dict[str, str]] = {None: {fmt: f"{output_base}.{fmt}" for fmt in formats}}
+    for language in target_languages:
+        paths[language] = {fmt: f"{output_base}.{language}.{fmt}" for fmt in formats}
+    return paths
+
+
+def write_subtitles(
+    segments: Iterable[Dict],
+    output_base: str,
+    formats: Sequence[str] = ("srt",),
+    target_languages: Sequence[str] = (),
+    source_language: Optional[str] = None
+) -> Dict:
+    """
+    Stream segments into subtitle files: the original track plus one
+    translated track per target language, in every requested format.
+    Only the current translation batch of cues is held in memory.
+
+    Args:
+        segments: Segment iterator (e.g. iter_segments(..., words=True))
+        output_base: Path without extension; see subtitle_paths()
+        formats: Any of "srt", "vtt"
+        target_languages: Translator language codes for translated tracks
+        source_language: Source language code for translation (auto-detect if None)
+
+    Returns:
+        Dictionary with cues written, untranslated (cue, language) pairs
+        (those keep the original text in the translated track) and the
+        file paths
+    """
+    paths = subtitle_paths(output_base, formats, target_languages)
+    count = untranslated = 0
+
+    def written_cues(writers: List[SubtitleWriter]) -> Iterator[Dict]:
+        # The original track is written as each cue closes, before its translation batch fills up
+        nonlocal count
+        for cue in iter_cues(segments):
+            count += 1
+            for writer in writers:
+                writer.write(cue)
+            yield cue
+
+    with ExitStack() as stack:
+        writers = {
+            language: [stack.enter_context(SubtitleWriter(path, fmt)) for fmt, path in by_format.items()]
+            for language, by_format in paths.items()
+        }
+        cues = written_cues(writers[None])
+        if target_languages:
+            tracks = iter_translated_cues(cues, target_languages, source_language)
+        else:
+            tracks = ((cue, {}) for cue in cues)
+        for cue, translations in tracks:
+            for language, text in translations.items():
+                if text is None:
+                    untranslated += 1
+                for writer in writers[language]:
+                    writer.write(cue, text if text is not None else cue["text"])
+    return {"cues": count, "untranslated": untranslated, "paths": paths}
+
+
+def transcribe_subtitles(
+    source: str,
+    output_base: str,
+    language: str = "en-US",
+    formats: Sequence[str] = ("srt",),
+    target_languages: Sequence[str] = (),
+    split: bool = False
+) -> Dict:
+    """
+    Transcribe a WAV file straight into subtitle files as segments are recognized.
+
+    Args:
+        source: Path to the WAV file
+        output_base: Path without extension for the subtitle files
+        language: Recognition language (e.g. "en-US")
+        formats: Any of "srt", "vtt"
+        target_languages: Translator language codes for translated tracks
+        split: Cut the file at silences and transcribe the pieces in parallel
+
+    Returns:
+        write_subtitles() dictionary plus status ("ok", "partial",
+        "no_speech" or "error") and error message. When recognition fails
+        midway, the files keep the cues recognized up to that point.
+    """
+    from transcribe_files import iter_segments, iter_split_pieces
+
+    failures = []
+
+    def recognized_segments() -> Iterator[Dict]:
+        # Stop cleanly on recognition errors so the cues so far are still written
+        try:
+            if split:
+                for piece in iter_split_pieces(source, language, words=True):
+                    if piece["error"]:
+                        failures.append(piece["error"])
+                    yield from piece["segments"]
+            else:
+                yield from iter_segments(source, language, words=True)
+        except Exception as e:
+            failures.append(f"Error: {str(e)}")
+
+    try:
+        result = write_subtitles(recognized_segments(), output_base, formats, target_languages,
+                                 source_language=language.split("-")[0])
+    except Exception as e:
+        return {"cues": 0, "untranslated": 0, "status": "error", "error": f"Error: {str(e)}",
+                "paths": subtitle_paths(output_base, formats, target_languages)}
+    if failures:
+        status = "partial" if result["cues"] else "error"
+    else:
+        status = "ok" if result["cues"] else "no_speech"
+    return dict(result, status=status, error=failures[0] if failures else None)
+
+
+def main():
+    import argparse
+    from transcribe_files import INPUT_DIR, get_language_info
+
+    parser = argparse.ArgumentParser(description="Write SRT/WebVTT subtitles for WAV files")
+    parser.add_argument("files", nargs="*", help="WAV files (default: all WAVs in speech_samples/)")
+    parser.add_argument("--format", nargs="+", choices=SUBTITLE_FORMATS, default=["srt"],
+                        help="Subtitle formats to write")
+    parser.add_argument("--translate", nargs="*", default=[], metavar="LANG",
+                        help="Also write translated tracks (Translator codes, e.g. hi te)")
+    parser.add_argument("--split", action="store_true",
+                        help="Cut long files at silences and transcribe the pieces in parallel")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR, help="Where to write the subtitle files")
+    args = parser.parse_args()
+
+    files = args.files
+    if not files and os.path.isdir(INPUT_DIR):
+        files = sorted(os.path.join(INPUT_DIR, f) for f in os.listdir(INPUT_DIR) if f.lower().endswith(".wav"))
+    if not files:
+        print("❌ No WAV files to subtitle")
+        return 1
+
+    print("🎬 SUBTITLES")
+    print("=" * 50)
+    failures = 0
+    for path in files:
+        name = os.path.splitext(os.path.basename(path))[0]
+        language = get_language_info(os.path.basename(path))[0]
+        result = transcribe_subtitles(path, os.path.join(args.output_dir, name), language,
+                                      args.format, args.translate, split=args.split)
+        if result["status"] == "error":
+            failures += 1
+            print(f"❌ {name}: {result['error']}")
+            continue
+        written = [p for by_format in result["paths"].values() for p in by_format.values()]
+        icon = "⚠️" if result["status"] == "partial" or result["untranslated"] else "✅"
+        if result["status"] == "partial":
+            print(f"   {result['error']}")
+        print(f"{icon} {name}: {result['cues']} cues → {', '.join(os.path.basename(p) for p in written)}")
+        if result["untranslated"]:
+            print(f"   {result['untranslated']} translated cues fell back to the original text")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
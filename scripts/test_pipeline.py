@@ -72,7 +72,7 @@ def test_stt():
     print("=" * 50)
     
     try:
-        import azure.cognitiveservices.speech as speechsdk
+        from speech_backend import speechsdk
         
         speech_key = os.getenv("AZURE_SPEECH_KEY")
         speech_region = os.getenv("AZURE_REGION")
@@ -100,7 +100,7 @@ def test_tts():
     print("=" * 50)
     
     try:
-        import azure.cognitiveservices.speech as speechsdk
+        from speech_backend import speechsdk
         
         speech_key = os.getenv("AZURE_SPEECH_KEY")
         speech_region = os.getenv("AZURE_REGION")
@@ -1,6 +1,17 @@
 import os
-import csv
-import azure.cognitiveservices.speech as speechsdk
+import json
+import time
+import queue
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional
+from speech_backend import speechsdk
+from speech_resources import STT_SESSION_LIMIT, get_session_slots, get_speech_resources
+from stt_cache import get_stt_cache, hash_audio_file
+from audio_utils import DEFAULT_CHUNK_SIZE, WavFormatError, iter_pcm_chunks, read_wav_header
+from audio_preprocess import needs_normalization, normalize_pcm_chunks
+from vad_splitter import SPLIT_MAX_SEGMENT_SECONDS, split_audio
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -12,24 +23,543 @@ INPUT_DIR = os.path.join(BASE_DIR, "speech_samples")
 OUTPUT_DIR = os.path.join(BASE_DIR, "transcripts")
 OUTPUT_CSV = os.path.join(OUTPUT_DIR, "transcripts.csv")
 
+# Upper bound in seconds for one continuous transcription run
+TRANSCRIBE_TIMEOUT = float(os.getenv("TRANSCRIBE_TIMEOUT", "1800"))
+TICKS_PER_SECOND = 10_000_000  # SDK offsets/durations are in 100 ns ticks
+# Pieces of one long recording transcribed concurrently in split mode
+SPLIT_MAX_WORKERS = int(os.getenv("SPLIT_MAX_WORKERS", "8"))
+# Detailed results with per-word offsets, requested for subtitle output
+WORD_TIMESTAMP_PROPERTIES = {
+    speechsdk.PropertyId.SpeechServiceResponse_RequestWordLevelTimestamps: "true",
+    speechsdk.PropertyId.SpeechServiceResponse_OutputFormatOption: "detailed",
+}
+
 print("🚀 FIXED AZURE SPEECH-TO-TEXT")
 print("=" * 50)
 
-def transcribe_file(file_path, language="en-US"):
+def iter_segments(file_path: str, language: str = "en-US",
+                  timeout: Optional[float] = TRANSCRIBE_TIMEOUT, words: bool = False) -> Iterator[Dict]:
+    """
+    Run continuous recognition over a whole audio file and yield each
+    recognized segment as soon as the service finalizes it.
+
+    Args:
+        file_path: Path to the WAV file
+        language: Recognition language (e.g. "en-US")
+        timeout: Seconds allowed for the whole file (None = no limit)
+        words: Request word-level timestamps (adds a "words" list per segment)
+
+    Yields:
+        {"offset": seconds, "duration": seconds, "text": str}, plus
+        "words": [{"word", "offset", "duration"}, ...] when requested
+
+    Raises:
+        RuntimeError: Missing credentials or recognition canceled with an error
+        TimeoutError: The file was not finished within timeout seconds
+    """
     if not SPEECH_KEY or not SERVICE_REGION:
-        return "[Missing Azure credentials]"
-    
+        raise RuntimeError("Missing Azure credentials")
+
     try:
-        speech_config = speechsdk.SpeechConfig(subscription=SPEECH_KEY, region=SERVICE_REGION)
-        speech_config.speech_recognition_language = language
-        audio_config = speechsdk.audio.AudioConfig(filename=file_path)
-        recognizer = speechsdk.SpeechRecognizer(speech_config, audio_config)
-        result = recognizer.recognize_once_async().get()
-        if result.reason == speechsdk.ResultReason.RecognizedSpeech:
-            return result.text
-        return "[No speech recognized]"
+        header = read_wav_header(file_path)
+    except WavFormatError:
+        header = None  # let the SDK decide what to do with it
+    if header is not None and needs_normalization(header):
+        # Convert to 16 kHz mono on the fly instead of uploading the original
+        return _iter_file_via_stream(file_path, language, timeout, words)
+
+    audio_config = speechsdk.audio.AudioConfig(filename=file_path)
+    recognizer = get_speech_resources().create_recognizer(
+        audio_config, language, properties=WORD_TIMESTAMP_PROPERTIES if words else None, continuous=True
+    )
+    return _iter_recognizer_segments(recognizer, timeout, words)
+
+
+def _iter_file_via_stream(file_path: str, language: str, timeout: Optional[float],
+                          words: bool = False) -> Iterator[Dict]:
+    with open(file_path, "rb") as f:
+        yield from iter_stream_segments(f, language, timeout=timeout, words=words)
+
+
+def iter_stream_segments(source, language: str = "en-US",
+                         timeout: Optional[float] = TRANSCRIBE_TIMEOUT,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE, words: bool = False) -> Iterator[Dict]:
+    """
+    Continuous recognition over in-memory or streamed WAV audio. The PCM
+    payload is normalized to 16 kHz mono and fed into a PushAudioInputStream
+    while recognition runs, so nothing is written to disk.
+
+    Args:
+        source: WAV bytes/bytearray/memoryview, or a binary file-like object
+        language: Recognition language (e.g. "en-US")
+        timeout: Seconds allowed for the whole stream (None = no limit)
+        chunk_size: PCM bytes per push
+        words: Request word-level timestamps (see iter_segments())
+
+    Yields:
+        {"offset": seconds, "duration": seconds, "text": str}
+
+    Raises:
+        WavFormatError: Input is not a PCM WAV
+        RuntimeError: Missing credentials or recognition canceled with an error
+        TimeoutError: The stream was not finished within timeout seconds
+    """
+    if not SPEECH_KEY or not SERVICE_REGION:
+        raise RuntimeError("Missing Azure credentials")
+    return _iter_pcm_stream(*iter_pcm_chunks(source, chunk_size), language, timeout, words)
+
+
+def iter_pcm_segments(pcm, audio_format: Dict[str, int], language: str = "en-US",
+                      timeout: Optional[float] = TRANSCRIBE_TIMEOUT,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE, words: bool = False) -> Iterator[Dict]:
+    """
+    Continuous recognition over raw PCM without a WAV header, e.g. one
+    slice of a memory-mapped recording. Same behaviour as iter_stream_segments().
+
+    Args:
+        pcm: Interleaved PCM samples (anything exposing the buffer protocol)
+        audio_format: Dictionary with sample_rate, channels and bits_per_sample
+        language: Recognition language (e.g. "en-US")
+        timeout: Seconds allowed for the whole slice (None = no limit)
+        chunk_size: PCM bytes per push
+        words: Request word-level timestamps (see iter_segments())
+    """
+    if not SPEECH_KEY or not SERVICE_REGION:
+        raise RuntimeError("Missing Azure credentials")
+    view = memoryview(pcm).cast("B")
+    header = dict(audio_format, data_offset=0, data_size=len(view))
+    chunks = (view[start:start + chunk_size] for start in range(0, len(view), chunk_size))
+    return _iter_pcm_stream(header, chunks, language, timeout, words)
+
+
+def _iter_pcm_stream(header: Dict[str, int], chunks, language: str,
+                     timeout: Optional[float], words: bool = False) -> Iterator[Dict]:
+    """Push PCM chunks described by header into a continuous recognizer."""
+    # Resampled/downmixed to 16 kHz 16-bit mono unless it already is
+    header, chunks = normalize_pcm_chunks(header, chunks)
+    stream_format = speechsdk.audio.AudioStreamFormat(
+        samples_per_second=header["sample_rate"],
+        bits_per_sample=header["bits_per_sample"],
+        channels=header["channels"]
+    )
+    push_stream = speechsdk.audio.PushAudioInputStream(stream_format=stream_format)
+    audio_config = speechsdk.audio.AudioConfig(stream=push_stream)
+    recognizer = get_speech_resources().create_recognizer(
+        audio_config, language, properties=WORD_TIMESTAMP_PROPERTIES if words else None, continuous=True
+    )
+
+    stop_feeding = threading.Event()
+    feed_errors = []
+
+    def feed():
+        try:
+            for chunk in chunks:
+                if stop_feeding.is_set():
+                    break
+                # File-like sources reuse one read buffer, so hand the SDK its own copy
+                push_stream.write(bytes(chunk))
+        except Exception as e:
+            feed_errors.append(e)
+        finally:
+            push_stream.close()  # end of stream
+
+    feeder = threading.Thread(target=feed, daemon=True)
+
+    def segments():
+        feeder.start()
+        try:
+            yield from _iter_recognizer_segments(recognizer, timeout, words)
+        finally:
+            stop_feeding.set()
+        if feed_errors:
+            raise RuntimeError(f"Reading audio failed: {feed_errors[0]}")
+
+    return segments()
+
+
+def _word_timings(result) -> List[Dict]:
+    """Per-word offsets from a detailed recognition result ([] if it has none)."""
+    try:
+        best = json.loads(result.json)["NBest"][0]
+    except (AttributeError, TypeError, ValueError, KeyError, IndexError):
+        return []
+    timings = best.get("Words") or []
+    # Timings are for lexical words ("twenty five" for "25"); when the display
+    # text lines up one to one, keep its casing and punctuation instead
+    display = result.text.split()
+    if len(display) != len(timings):
+        display = [timing["Word"] for timing in timings]
+    return [
+        {"word": word, "offset": timing["Offset"] / TICKS_PER_SECOND,
+         "duration": timing["Duration"] / TICKS_PER_SECOND}
+        for word, timing in zip(display, timings)
+    ]
+
+
+def _iter_recognizer_segments(recognizer, timeout: Optional[float], words: bool = False) -> Iterator[Dict]:
+    """Drive continuous recognition on recognizer and yield finalized segments."""
+    # Callbacks run on SDK threads; hand events to the generator through a queue
+    events: "queue.Queue[tuple]" = queue.Queue()
+
+    def on_recognized(evt):
+        result = evt.result
+        if result.reason == speechsdk.ResultReason.RecognizedSpeech and result.text:
+            segment = {
+                "offset": result.offset / TICKS_PER_SECOND,
+                "duration": result.duration / TICKS_PER_SECOND,
+                "text": result.text,
+            }
+            if words:
+                segment["words"] = _word_timings(result)
+            events.put(("segment", segment))
+
+    def on_canceled(evt):
+        details = evt.cancellation_details
+        if details.reason == speechsdk.CancellationReason.Error:
+            events.put(("error", details.error_details or "Recognition canceled"))
+        else:
+            events.put(("done", None))  # EndOfStream
+
+    recognizer.recognized.connect(on_recognized)
+    recognizer.canceled.connect(on_canceled)
+    recognizer.session_stopped.connect(lambda evt: events.put(("done", None)))
+
+    deadline_at = time.monotonic() + timeout if timeout is not None else None
+    recognizer.start_continuous_recognition_async().get()
+    try:
+        while True:
+            remaining = None if deadline_at is None else deadline_at - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise TimeoutError(f"Transcription timed out after {timeout:.0f}s")
+            try:
+                kind, payload = events.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            if kind == "segment":
+                yield payload
+            elif kind == "error":
+                raise RuntimeError(payload)
+            else:
+                break
+    finally:
+        # Also runs when the caller stops iterating early
+        recognizer.stop_continuous_recognition_async().get()
+        recognizer.recognized.disconnect_all()
+        recognizer.canceled.disconnect_all()
+        recognizer.session_stopped.disconnect_all()
+
+
+def _transcribe_once(file_path: str, language: str) -> str:
+    """Single-utterance recognition (first ~15-30 seconds of speech only)."""
+    audio_config = speechsdk.audio.AudioConfig(filename=file_path)
+    recognizer = get_speech_resources().create_recognizer(audio_config, language)
+    result = recognizer.recognize_once_async().get()
+    if result.reason == speechsdk.ResultReason.RecognizedSpeech:
+        return result.text
+    return "[No speech recognized]"
+
+
+def transcribe_file_result(file_path: str, language: str = "en-US", continuous: bool = True,
+                           timeout: Optional[float] = TRANSCRIBE_TIMEOUT, use_cache: bool = True,
+                           split: bool = False) -> Dict:
+    """
+    Transcribe an audio file and report how it went. Results are looked up
+    in (and stored to) the STT cache by audio content hash first.
+
+    Args:
+        file_path: Path to the WAV file
+        language: Recognition language (e.g. "en-US")
+        continuous: Transcribe the whole file (False = first utterance only)
+        timeout: Seconds allowed for continuous recognition (per piece when split)
+        use_cache: Set False to bypass the STT cache for this call
+        split: Cut the file at silences and transcribe the pieces in
+            parallel (see iter_split_pieces); implies continuous
+
+    Returns:
+        Dictionary with transcript, status ("ok", "partial", "no_speech" or
+        "error"), error message, the recognized segments, whether the
+        result came from the cache and the audio SHA-256 (None when the
+        cache is bypassed)
+    """
+    cache = get_stt_cache() if use_cache else None
+    audio_sha256 = None
+    settings = "split" if split else "continuous" if continuous else "once"
+    if cache is not None:
+        try:
+            audio_sha256 = hash_audio_file(file_path)
+        except OSError as e:
+            return {"transcript": "", "status": "error", "error": f"Error: {str(e)}",
+                    "segments": [], "cached": False, "audio_sha256": None}
+        cached = cache.get(audio_sha256, language, settings)
+        if cached is not None:
+            return dict(cached, cached=True, audio_sha256=audio_sha256)
+
+    result = _recognize_file(file_path, language, continuous, timeout, split)
+    # Partial and failed runs are retried next time rather than cached
+    if cache is not None and result["status"] in ("ok", "no_speech"):
+        cache.put(audio_sha256, language, settings, result)
+    return dict(result, cached=False, audio_sha256=audio_sha256)
+
+
+def _recognize_file(file_path: str, language: str, continuous: bool, timeout: Optional[float],
+                    split: bool = False) -> Dict:
+    """Run recognition for transcribe_file_result() (no caching)."""
+    result = {"transcript": "", "status": "ok", "error": None, "segments": []}
+    if not SPEECH_KEY or not SERVICE_REGION:
+        result.update(status="error", error="Missing Azure credentials")
+        return result
+
+    if split:
+        return _recognize_split(file_path, language, timeout, os.path.basename(file_path))
+
+    if not continuous:
+        try:
+            text = _transcribe_once(file_path, language)
+        except Exception as e:
+            result.update(status="error", error=f"Error: {str(e)}")
+            return result
+        if text.startswith("["):
+            result["status"] = "no_speech"
+        else:
+            result["transcript"] = text
+        return result
+
+    return _collect_segments(lambda: iter_segments(file_path, language, timeout=timeout),
+                             os.path.basename(file_path))
+
+
+def _collect_segments(make_segments, label: str) -> Dict:
+    """Run a segment generator to completion and build a transcribe_file_result() dictionary."""
+    result = {"transcript": "", "status": "ok", "error": None, "segments": []}
+    segments = result["segments"]
+    try:
+        for segment in make_segments():
+            segments.append(segment)
+    except TimeoutError as e:
+        result.update(status="partial" if segments else "error", error=f"Error: {str(e)}")
+        if segments:
+            print(f"⚠️ {label}: {e}, returning partial transcript")
+    except Exception as e:
+        result.update(status="error", error=f"Error: {str(e)}")
+
+    if result["status"] == "ok" and not segments:
+        result["status"] = "no_speech"
+    result["transcript"] = " ".join(segment["text"] for segment in segments)
+    return result
+
+
+def iter_split_pieces(source, language: str = "en-US", timeout: Optional[float] = TRANSCRIBE_TIMEOUT,
+                      max_workers: int = SPLIT_MAX_WORKERS,
+                      max_segment_seconds: float = SPLIT_MAX_SEGMENT_SECONDS,
+                      words: bool = False) -> Iterator[Dict]:
+    """
+    Cut a long recording at silences and transcribe the pieces concurrently,
+    one recognition session each. The WAV is scanned through a NumPy memmap
+    (see vad_splitter), and pieces are yielded in recording order as soon as
+    they and every piece before them are done.
+
+    Args:
+        source: Path to a WAV file or WAV bytes
+        language: Recognition language (e.g. "en-US")
+        timeout: Seconds allowed per piece
+        max_workers: Pieces in flight (capped by STT_SESSION_LIMIT)
+        max_segment_seconds: Upper bound for the length of one piece
+        words: Request word-level timestamps (see iter_segments())
+
+    Yields:
+        {"index", "total", "start", "end", "status", "error", "segments"} per
+        piece; start/end and segment offsets are seconds from the start of
+        the recording
+
+    Raises:
+        WavFormatError: Input is not a 8/16/32-bit PCM WAV
+    """
+    samples, header, pieces = split_audio(source, max_segment_seconds)
+    rate = header["sample_rate"]
+    audio_format = {key: header[key] for key in ("sample_rate", "channels", "bits_per_sample")}
+    label = os.path.basename(source) if isinstance(source, str) else "audio"
+
+    def run(index: int, start: int, end: int) -> Dict:
+        with get_session_slots():
+            result = _collect_segments(
+                lambda: iter_pcm_segments(samples[start:end], audio_format, language, timeout=timeout, words=words),
+                f"{label} [{index + 1}/{len(pieces)}]"
+            )
+        for segment in result["segments"]:
+            segment["offset"] += start / rate
+            for word in segment.get("words", ()):
+                word["offset"] += start / rate
+        return {"index": index, "total": len(pieces), "start": start / rate, "end": end / rate,
+                "status": result["status"], "error": result["error"], "segments": result["segments"]}
+
+    if not pieces:
+        return
+    workers = max(1, min(max_workers, STT_SESSION_LIMIT, len(pieces)))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stt-split")
+    futures = [executor.submit(run, index, start, end) for index, (start, end) in enumerate(pieces)]
+    try:
+        # Waiting on futures in submission order stitches the pieces back together
+        for future in futures:
+            yield future.result()
+    finally:
+        # Consumer stopped early: drop pieces that have not started yet
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _recognize_split(source, language: str, timeout: Optional[float], label: str) -> Dict:
+    """Split-mode recognition for transcribe_file_result()/transcribe_bytes() (no caching)."""
+    result = {"transcript": "", "status": "ok", "error": None, "segments": []}
+    try:
+        pieces = list(iter_split_pieces(source, language, timeout=timeout))
+    except WavFormatError as e:
+        # e.g. 24-bit PCM: no memmap view, so recognize it in one run instead
+        print(f"⚠️ {label}: {e}, transcribing without splitting")
+        return _collect_segments(
+            lambda: (iter_segments if isinstance(source, str) else iter_stream_segments)(
+                source, language, timeout=timeout),
+            label
+        )
     except Exception as e:
-        return f"[Error: {str(e)}]"
+        result.update(status="error", error=f"Error: {str(e)}")
+        return result
+
+    failed = [piece for piece in pieces if piece["status"] in ("partial", "error")]
+    for piece in pieces:
+        result["segments"].extend(piece["segments"])
+    if failed:
+        result.update(status="partial" if result["segments"] else "error", error=failed[0]["error"])
+        print(f"⚠️ {label}: {len(failed)} of {len(pieces)} pieces incomplete ({failed[0]['error']})")
+    elif not result["segments"]:
+        result["status"] = "no_speech"
+    result["transcript"] = " ".join(segment["text"] for segment in result["segments"])
+    return result
+
+
+def transcribe_bytes(data, language: str = "en-US", timeout: Optional[float] = TRANSCRIBE_TIMEOUT,
+                     use_cache: bool = True, name: str = "audio", split: bool = False) -> Dict:
+    """
+    Transcribe WAV audio held in memory (e.g. an upload) without a temp file.
+    Shares STT cache entries with transcribe_file_result() for identical audio.
+
+    Args:
+        data: WAV file contents as bytes, bytearray or memoryview
+        language: Recognition language (e.g. "en-US")
+        timeout: Seconds allowed for continuous recognition
+        use_cache: Set False to bypass the STT cache for this call
+        name: Label used in log messages
+        split: Cut the audio at silences and transcribe the pieces in parallel
+
+    Returns:
+        Same dictionary as transcribe_file_result()
+    """
+    cache = get_stt_cache() if use_cache else None
+    audio_sha256 = None
+    settings = "split" if split else "continuous"
+    if cache is not None:
+        audio_sha256 = hashlib.sha256(data).hexdigest()
+        cached = cache.get(audio_sha256, language, settings)
+        if cached is not None:
+            return dict(cached, cached=True, audio_sha256=audio_sha256)
+
+    if not SPEECH_KEY or not SERVICE_REGION:
+        result = {"transcript": "", "status": "error", "error": "Missing Azure credentials", "segments": []}
+    elif split:
+        result = _recognize_split(data, language, timeout, name)
+    else:
+        result = _collect_segments(lambda: iter_stream_segments(data, language, timeout=timeout), name)
+    if cache is not None and result["status"] in ("ok", "no_speech"):
+        cache.put(audio_sha256, language, settings, result)
+    return dict(result, cached=False, audio_sha256=audio_sha256)
+
+
+def transcribe_pcm(pcm, audio_format: Dict[str, int], language: str = "en-US",
+                   timeout: Optional[float] = TRANSCRIBE_TIMEOUT, name: str = "audio",
+                   audio_sha256: Optional[str] = None) -> Dict:
+    """
+    Transcribe raw PCM, e.g. compressed audio decoded by audio_decode.
+    The STT cache is not consulted (callers look results up before paying
+    for the decode), but a complete result is stored under audio_sha256.
+
+    Args:
+        pcm: Interleaved PCM samples (anything exposing the buffer protocol)
+        audio_format: Dictionary with sample_rate, channels and bits_per_sample
+        language: Recognition language (e.g. "en-US")
+        timeout: Seconds allowed for continuous recognition
+        name: Label used in log messages
+        audio_sha256: Cache key, normally the hash of the original file
+
+    Returns:
+        Same dictionary as transcribe_file_result()
+    """
+    if not SPEECH_KEY or not SERVICE_REGION:
+        result = {"transcript": "", "status": "error", "error": "Missing Azure credentials", "segments": []}
+    else:
+        result = _collect_segments(
+            lambda: iter_pcm_segments(pcm, audio_format, language, timeout=timeout), name
+        )
+    cache = get_stt_cache() if audio_sha256 else None
+    if cache is not None and result["status"] in ("ok", "no_speech"):
+        cache.put(audio_sha256, language, "continuous", result)
+    return dict(result, cached=False, audio_sha256=audio_sha256)
+
+
+def transcribe_stream(stream, language: str = "en-US", timeout: Optional[float] = TRANSCRIBE_TIMEOUT,
+                      use_cache: bool = True, name: str = "stream") -> Dict:
+    """
+    Transcribe WAV audio from a binary file-like object without a temp file.
+    In-memory buffers (anything with getbuffer(), such as BytesIO or a
+    Streamlit upload) go through transcribe_bytes() and the STT cache;
+    other streams are read once, chunk by chunk, and are not cached.
+
+    Args:
+        stream: Binary file-like object positioned at the start of the WAV
+        language: Recognition language (e.g. "en-US")
+        timeout: Seconds allowed for continuous recognition
+        use_cache: Set False to bypass the STT cache for this call
+        name: Label used in log messages
+
+    Returns:
+        Same dictionary as transcribe_file_result()
+    """
+    if hasattr(stream, "getbuffer"):
+        return transcribe_bytes(stream.getbuffer(), language, timeout=timeout, use_cache=use_cache, name=name)
+    if not SPEECH_KEY or not SERVICE_REGION:
+        result = {"transcript": "", "status": "error", "error": "Missing Azure credentials", "segments": []}
+    else:
+        result = _collect_segments(lambda: iter_stream_segments(stream, language, timeout=timeout), name)
+    return dict(result, cached=False, audio_sha256=None)
+
+
+def transcribe_file(file_path, language="en-US", continuous=True, timeout=TRANSCRIBE_TIMEOUT, use_cache=True,
+                    split=False):
+    """
+    Transcribe an audio file.
+
+    Args:
+        file_path: Path to the WAV file
+        language: Recognition language (e.g. "en-US")
+        continuous: Transcribe the whole file (False = first utterance only)
+        timeout: Seconds allowed for continuous recognition
+        use_cache: Set False to bypass the STT cache for this call
+        split: Cut long files at silences and transcribe the pieces in parallel
+
+    Returns:
+        The transcript, or a bracketed "[...]" message on failure. If the
+        timeout hits after some speech was recognized, the partial
+        transcript is returned.
+    """
+    return transcribe_text_for(transcribe_file_result(
+        file_path, language, continuous=continuous, timeout=timeout, use_cache=use_cache, split=split
+    ))
+
+
+def transcribe_text_for(result: Dict) -> str:
+    """Transcript string for a transcribe_file_result(), with "[...]" messages on failure."""
+    if result["status"] == "error":
+        return f"[{result['error']}]"
+    if result["status"] == "no_speech":
+        return "[No speech recognized]"
+    return result["transcript"]
 
 def get_language_info(filename):
     if filename.startswith('te_'): return "te-IN", "Telugu"
@@ -37,25 +567,65 @@ def get_language_info(filename):
     else: return "en-US", "English"
 
 def main():
+    import argparse
+    from audio_decode import is_compressed_audio
+    from batch_transcriber import STT_MAX_WORKERS, iter_transcriptions
+    from transcript_checkpoint import TranscriptCheckpoint, file_signature
+
+    parser = argparse.ArgumentParser(description="Transcribe all audio files in speech_samples/")
+    parser.add_argument("--workers", type=int, default=STT_MAX_WORKERS,
+                        help="Files transcribed concurrently")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-transcribe every file instead of reusing cached results")
+    parser.add_argument("--split", action="store_true",
+                        help="Cut long files at silences and transcribe the pieces in parallel")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--resume", dest="resume", action="store_true", default=True,
+                      help="Skip files already in transcripts.csv with the same size/mtime or hash (default)")
+    mode.add_argument("--force", dest="resume", action="store_false",
+                      help="Ignore the existing transcripts.csv and transcribe every file")
+    args = parser.parse_args()
+
     os.makedirs(INPUT_DIR, exist_ok=True)
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     
-    wav_files = [f for f in os.listdir(INPUT_DIR) if f.lower().endswith('.wav')]
+    # MP3/M4A/OGG/... go through the process-pool decode stage
+    wav_files = sorted(f for f in os.listdir(INPUT_DIR) if f.lower().endswith('.wav') or is_compressed_audio(f))
     if not wav_files:
-        print("❌ No WAV files found in speech_samples/")
+        print("❌ No audio files found in speech_samples/")
         return
     
-    with open(OUTPUT_CSV, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow(["filename", "language", "language_name", "transcript"])
-        for file in wav_files:
-            file_path = os.path.join(INPUT_DIR, file)
-            lang_code, lang_name = get_language_info(file)
-            transcript = transcribe_file(file_path, lang_code)
-            writer.writerow([file, lang_code, lang_name, transcript])
-            print(f"✅ {file} → {transcript}")
+    checkpoint = TranscriptCheckpoint(OUTPUT_CSV, resume=args.resume)
+    pending = [f for f in wav_files if not checkpoint.is_done(f, os.path.join(INPUT_DIR, f))]
+    if len(pending) < len(wav_files):
+        print(f"⏭️  {len(wav_files) - len(pending)} files already transcribed, {len(pending)} to go")
+    
+    jobs = [(os.path.join(INPUT_DIR, file), get_language_info(file)[0]) for file in pending]
+    started = time.perf_counter()
+    checkpoint.open()
+    try:
+        # Each row is appended and flushed as soon as its file finishes
+        for done, result in enumerate(iter_transcriptions(
+                jobs, max_workers=args.workers, use_cache=not args.no_cache, split=args.split), 1):
+            transcript = transcribe_text_for(result)
+            lang_code, lang_name = get_language_info(result["filename"])
+            checkpoint.append({
+                "filename": result["filename"],
+                "language": lang_code,
+                "language_name": lang_name,
+                "transcript": transcript,
+                "status": result["status"],
+                **file_signature(result["path"]),
+                "sha256": result["audio_sha256"] or hash_audio_file(result["path"]),
+            })
+            icon = "♻️" if result["cached"] else "✅" if result["success"] else "❌"
+            print(f"{icon} [{done}/{len(jobs)}] {result['filename']} ({result['elapsed_seconds']:.1f}s) → {transcript}")
+    finally:
+        # Rows in filename order regardless of completion order
+        checkpoint.close(order=wav_files)
     
-    print(f"\n💾 Saved all transcripts to {OUTPUT_CSV}")
+    print(f"\n⏱️ {len(jobs)} files in {time.perf_counter() - started:.1f}s with {args.workers} workers")
+    print(f"💾 Saved all transcripts to {OUTPUT_CSV}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,126 @@
+"""
+Transcript CSV Checkpoint
+Makes transcripts.csv double as a resume checkpoint: rows record each
+file's size, mtime and SHA-256, new rows are appended and flushed as
+files finish, and the file is compacted into filename order at the end
+"""
+
+import os
+import csv
+from typing import Dict, List, Optional
+
+from stt_cache import hash_audio_file
+
+CHECKPOINT_FIELDS = [
+    "filename", "language", "language_name", "transcript",
+    "status", "size", "mtime_ns", "sha256",
+]
+# Rows with these statuses are complete and skipped on resume
+DONE_STATUSES = ("ok", "no_speech")
+
+
+def file_signature(path: str) -> Dict[str, str]:
+    """Size and nanosecond mtime of a file, as stored in checkpoint rows."""
+    stat = os.stat(path)
+    return {"size": str(stat.st_size), "mtime_ns": str(stat.st_mtime_ns)}
+
+
+class TranscriptCheckpoint:
+    """
+    Append-only checkpoint over a transcripts CSV.
+
+    Rows written by older versions (without status/size/mtime columns)
+    are kept but not trusted, so those files are transcribed again.
+    """
+
+    def __init__(self, csv_path: str, resume: bool = True):
+        """
+        Args:
+            csv_path: Transcripts CSV used as the checkpoint
+            resume: Load finished rows from an existing CSV (False = start over)
+        """
+        self.csv_path = csv_path
+        self.rows: Dict[str, Dict[str, str]] = {}
+        if resume:
+            self.rows = self._load()
+        self._file = None
+        self._writer = None
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        if not os.path.exists(self.csv_path):
+            return {}
+        rows = {}
+        with open(self.csv_path, "r", newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                # A crash can leave a truncated last row; later rows for a file win
+                if row.get("filename") and row.get("transcript") is not None:
+                    rows[row["filename"]] = row
+        return rows
+
+    def is_done(self, filename: str, path: str) -> bool:
+        """
+        Whether path already has a finished row. Size and mtime must match;
+        if only the mtime changed (e.g. the file was copied), the content
+        hash decides.
+        """
+        row = self.rows.get(filename)
+        if row is None or row.get("status") not in DONE_STATUSES:
+            return False
+        signature = file_signature(path)
+        if row.get("size") != signature["size"]:
+            return False
+        if row.get("mtime_ns") == signature["mtime_ns"]:
+            return True
+        if row.get("sha256") and row["sha256"] == hash_audio_file(path):
+            row.update(signature)  # refresh so the next run skips the hash
+            return True
+        return False
+
+    def open(self):
+        """
+        Rewrite the checkpoint from the loaded rows (dropping duplicates and
+        any partial line) and keep it open for appending.
+        """
+        os.makedirs(os.path.dirname(self.csv_path) or ".", exist_ok=True)
+        self.compact()
+        self._file = open(self.csv_path, "a", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=CHECKPOINT_FIELDS, extrasaction="ignore")
+
+    def append(self, row: Dict[str, str]):
+        """Write one finished row and flush it to disk immediately."""
+        self.rows[row["filename"]] = row
+        self._writer.writerow(row)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def compact(self, order: Optional[List[str]] = None):
+        """
+        Atomically rewrite the CSV with one row per file.
+
+        Args:
+            order: Filenames in output order (default: sorted filenames)
+        """
+        names = order if order is not None else sorted(self.rows)
+        tmp_path = self.csv_path + ".tmp"
+        with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=CHECKPOINT_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            for name in names:
+                if name in self.rows:
+                    writer.writerow(self.rows[name])
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.csv_path)
+
+    def close(self, order: Optional[List[str]] = None):
+        """
+        Stop appending and compact the CSV.
+
+        Args:
+            order: Filenames to keep, in output order (default: all, sorted)
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+        self.compact(order)
@@ -0,0 +1,316 @@
+"""
+Append-only JSONL Translation Log
+Buffered JSONL sink (optionally gzip/zstd) with periodic fsync, daily
+rotation and a sidecar offset index for seeking records by id
+"""
+
+import os
+import io
+import json
+import gzip
+import time
+import atexit
+import threading
+from datetime import date
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Compression for new log files: "none", "gzip" or "zstd"
+TRANSLATION_LOG_COMPRESSION = os.getenv("TRANSLATION_LOG_COMPRESSION", "none").lower()
+TRANSLATION_LOG_FLUSH_INTERVAL = float(os.getenv("TRANSLATION_LOG_FLUSH_INTERVAL", "1.0"))
+TRANSLATION_LOG_FSYNC_INTERVAL = float(os.getenv("TRANSLATION_LOG_FSYNC_INTERVAL", "5.0"))
+
+_EXTENSIONS = {"none": ".jsonl", "gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}
+INDEX_SUFFIX = ".idx"
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    """Compress one flush as a self-contained gzip member / zstd frame."""
+    if compression == "gzip":
+        return gzip.compress(data)
+    if compression == "zstd":
+        return zstandard.ZstdCompressor().compress(data)
+    return data
+
+
+def _decompress(data: bytes, compression: str) -> bytes:
+    if compression == "gzip":
+        return gzip.decompress(data)
+    if compression == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    return data
+
+
+def _compression_for(path: str) -> str:
+    for compression, extension in _EXTENSIONS.items():
+        if compression != "none" and path.endswith(extension):
+            return compression
+    return "none"
+
+
+class JsonlLogWriter:
+    """
+    Thread-safe buffered append-only JSONL writer.
+
+    Records are buffered in memory and written on flush (every
+    flush_interval seconds, or when the buffer is full). Files rotate daily
+    as <prefix>-YYYY-MM-DD.jsonl[.gz|.zst]. Each flush is written as one
+    independent compressed member/frame so records stay seekable, and every
+    record with an id gets a line in the sidecar <file>.idx:
+        <id>\t<member byte offset>\t<offset within member>
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        prefix: str = "translations",
+        compression: str = TRANSLATION_LOG_COMPRESSION,
+        flush_interval: float = TRANSLATION_LOG_FLUSH_INTERVAL,
+        fsync_interval: float = TRANSLATION_LOG_FSYNC_INTERVAL,
+        max_buffered: int = 500
+    ):
+        """
+        Args:
+            directory: Directory holding the log files
+            prefix: File name prefix
+            compression: "none", "gzip" or "zstd"
+            flush_interval: Seconds between background flushes
+            fsync_interval: Minimum seconds between fsyncs (0 = fsync every flush)
+            max_buffered: Flush as soon as this many records are buffered
+        """
+        if compression not in _EXTENSIONS:
+            raise ValueError(f"Unknown compression: {compression}")
+        if compression == "zstd" and zstandard is None:
+            print("⚠️ zstandard not installed, falling back to gzip for the translation log")
+            compression = "gzip"
+
+        self.directory = directory
+        self.prefix = prefix
+        self.compression = compression
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.max_buffered = max_buffered
+
+        self._buffer: List[Tuple[Optional[str], bytes]] = []
+        self._lock = threading.Lock()
+        self._day: Optional[str] = None
+        self._file = None
+        self._index_file = None
+        self._last_fsync = time.monotonic()
+        self._unsynced = False
+        self._closed = False
+        self.records_written = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+        atexit.register(self.close)
+
+    @property
+    def current_path(self) -> str:
+        """Path of the log file for today."""
+        return self._path_for(date.today().isoformat())
+
+    def _path_for(self, day: str) -> str:
+        return os.path.join(self.directory, f"{self.prefix}-{day}{_EXTENSIONS[self.compression]}")
+
+    def _open_for_today(self):
+        """Open (or rotate to) today's log file and its index."""
+        day = date.today().isoformat()
+        if day == self._day and self._file is not None:
+            return
+        self._close_files()
+        path = self._path_for(day)
+        self._file = open(path, "ab")
+        self._index_file = open(path + INDEX_SUFFIX, "a", encoding="utf-8")
+        self._day = day
+
+    def _close_files(self):
+        for handle in (self._file, self._index_file):
+            if handle is not None:
+                handle.flush()
+                os.fsync(handle.fileno())
+                handle.close()
+        self._file = None
+        self._index_file = None
+
+    def append(self, record: Dict[str, Any], record_id: Optional[str] = None) -> str:
+        """
+        Buffer one record for writing.
+
+        Args:
+            record: JSON-serializable dictionary
+            record_id: Optional id to index the record under
+
+        Returns:
+            Path of the log file the record will be written to
+        """
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            if self._closed:
+                raise ValueError("Log writer is closed")
+            self._buffer.append((record_id, line))
+            if len(self._buffer) >= self.max_buffered:
+                self._flush_locked()
+        return self.current_path
+
+    def flush(self, fsync: bool = False):
+        """Write buffered records to disk (and fsync if requested)."""
+        with self._lock:
+            self._flush_locked(force_fsync=fsync)
+
+    def _flush_locked(self, force_fsync: bool = False):
+        if self._buffer:
+            self._open_for_today()
+            member_offset = self._file.tell()
+            inner_offset = 0
+            index_lines = []
+            for record_id, line in self._buffer:
+                if record_id is not None:
+                    index_lines.append(f"{record_id}\t{member_offset}\t{inner_offset}\n")
+                inner_offset += len(line)
+
+            # Data before index, so an index entry never points past the data
+            self._file.write(_compress(b"".join(line for _, line in self._buffer), self.compression))
+            self._file.flush()
+            self._index_file.writelines(index_lines)
+            self._index_file.flush()
+            self.records_written += len(self._buffer)
+            self._buffer = []
+            self._unsynced = True
+
+        if self._unsynced and (
+            force_fsync or time.monotonic() - self._last_fsync >= self.fsync_interval
+        ):
+            os.fsync(self._file.fileno())
+            os.fsync(self._index_file.fileno())
+            self._last_fsync = time.monotonic()
+            self._unsynced = False
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"❌ [Translation Log] Flush failed: {e}")
+
+    def close(self):
+        """Flush, fsync and close the current files."""
+        self._stop.set()
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_locked(force_fsync=True)
+            self._close_files()
+            self._closed = True
+
+
+class JsonlLogReader:
+    """
+    Lazy reader for logs written by JsonlLogWriter.
+    Iterates records across daily files in order and seeks single records
+    by id through the sidecar offset index.
+    """
+
+    def __init__(self, directory: str, prefix: str = "translations"):
+        self.directory = directory
+        self.prefix = prefix
+        self._indexes: Dict[str, Tuple[float, Dict[str, Tuple[int, int]]]] = {}
+
+    def files(self) -> List[str]:
+        """Log files for this prefix, oldest first."""
+        if not os.path.isdir(self.directory):
+            return []
+        names = [
+            name for name in os.listdir(self.directory)
+            if name.startswith(f"{self.prefix}-")
+            and any(name.endswith(ext) for ext in _EXTENSIONS.values())
+        ]
+        return [os.path.join(self.directory, name) for name in sorted(names)]
+
+    def iter_records(self, day: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield records one at a time without loading whole files.
+
+        Args:
+            day: Only read the file for this ISO date (YYYY-MM-DD)
+        """
+        for path in self.files():
+            if day is not None and f"-{day}." not in os.path.basename(path):
+                continue
+            yield from self._iter_file(path)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.iter_records()
+
+    def _iter_file(self, path: str) -> Iterator[Dict[str, Any]]:
+        compression = _compression_for(path)
+        with open(path, "rb") as raw:
+            if compression == "gzip":
+                stream = gzip.GzipFile(fileobj=raw)
+            elif compression == "zstd":
+                stream = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True)
+            else:
+                stream = raw
+            for line in io.TextIOWrapper(stream, encoding="utf-8"):
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+    def _load_index(self, path: str) -> Dict[str, Tuple[int, int]]:
+        index_path = path + INDEX_SUFFIX
+        if not os.path.exists(index_path):
+            return {}
+        mtime = os.path.getmtime(index_path)
+        cached = self._indexes.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        index: Dict[str, Tuple[int, int]] = {}
+        with open(index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) == 3:
+                    index[parts[0]] = (int(parts[1]), int(parts[2]))
+        self._indexes[path] = (mtime, index)
+        return index
+
+    def get(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """Return the most recent record stored under record_id, or None."""
+        for path in reversed(self.files()):
+            entry = self._load_index(path).get(record_id)
+            if entry is None:
+                continue
+            member_offset, inner_offset = entry
+            compression = _compression_for(path)
+            with open(path, "rb") as f:
+                if compression == "none":
+                    f.seek(member_offset + inner_offset)
+                    return json.loads(f.readline())
+                f.seek(member_offset)
+                # Members are whole flushes; the next index offset bounds this one
+                next_offsets = [o for o, _ in self._load_index(path).values() if o > member_offset]
+                length = (min(next_offsets) if next_offsets else os.path.getsize(path)) - member_offset
+                data = _decompress(f.read(length), compression)
+            end = data.index(b"\n", inner_offset)
+            return json.loads(data[inner_offset:end])
+        return None
+
+
+_writers: Dict[Tuple[str, str], JsonlLogWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_log_writer(directory: str, prefix: str = "translations") -> JsonlLogWriter:
+    """Return the process-wide writer for (directory, prefix), creating it on first use."""
+    key = (os.path.abspath(directory), prefix)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = JsonlLogWriter(directory, prefix)
+            _writers[key] = writer
+        return writer
@@ -4,11 +4,21 @@ Azure Translator integration for translating STT transcripts
 """
 
 import os
-import json
+import re
 import time
-from typing import List, Dict, Optional, Any
+import random
+import threading
+from email.utils import parsedate_to_datetime
+import sqlite3
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Dict, Optional, Any, Union
 from dotenv import load_dotenv
 import requests
+from requests.adapters import HTTPAdapter
+
+from translation_log import get_log_writer, JsonlLogReader
 
 try:
     from language_config import DEFAULT_TARGET_LANGUAGES
@@ -19,26 +29,917 @@ load_dotenv()
 
 TRANSLATOR_KEY = os.getenv("AZURE_TRANSLATOR_KEY")
 TRANSLATOR_REGION = os.getenv("AZURE_TRANSLATOR_REGION") or os.getenv("AZURE_REGION")
-TRANSLATOR_ENDPOINT = "https://api.cognitive.microsofttranslator.com"
+TRANSLATOR_ENDPOINT = os.getenv("AZURE_TRANSLATOR_ENDPOINT", "https://api.cognitive.microsofttranslator.com")
+
+# Translator v3 per-request limits (documents per call, characters per call)
+MAX_DOCUMENTS_PER_REQUEST = 100
+MAX_CHARS_PER_REQUEST = 10000
+
+# Long-text chunking: texts above LONG_TEXT_CHUNK_CHARS are split at sentence
+# boundaries and the chunks translated concurrently
+LONG_TEXT_CHUNK_CHARS = min(int(os.getenv("TRANSLATOR_CHUNK_CHARS", "2000")), MAX_CHARS_PER_REQUEST)
+LONG_TEXT_MAX_WORKERS = int(os.getenv("TRANSLATOR_CHUNK_WORKERS", "8"))
+
+# Sentence terminators: Latin punctuation needs trailing whitespace (so "3.14"
+# is not split); Devanagari/Telugu danda, CJK and Arabic marks do not
+_SENTENCE_END = re.compile(
+    r'[.!?;…]+["\'”’)\]]*\s+'
+    r'|[\u0964\u0965\u3002\uff01\uff1f\uff0e\u061f]+["\'”’」』)\]]*\s*'
+    r'|\n+'
+)
+# Target languages written without spaces between sentences
+NO_SPACE_LANGUAGES = {"zh", "ja", "th", "lo", "km", "my", "yue", "lzh"}
+
+# Connection pool / timeout tuning for the shared Translator session
+TRANSLATOR_POOL_SIZE = int(os.getenv("AZURE_TRANSLATOR_POOL_SIZE", "10"))
+TRANSLATOR_CONNECT_TIMEOUT = float(os.getenv("AZURE_TRANSLATOR_CONNECT_TIMEOUT", "3.05"))
+TRANSLATOR_READ_TIMEOUT = float(os.getenv("AZURE_TRANSLATOR_READ_TIMEOUT", "10"))
+
+# Client-side rate limits shared by every caller in the process (0 = unlimited).
+# Characters are counted the way the service bills them: text length x target languages.
+TRANSLATOR_CHARS_PER_SECOND = float(os.getenv("AZURE_TRANSLATOR_CHARS_PER_SECOND", "11000"))
+TRANSLATOR_REQUESTS_PER_SECOND = float(os.getenv("AZURE_TRANSLATOR_REQUESTS_PER_SECOND", "0"))
+
+# Error kinds reported in result["error_kind"]; only the first two are retried
+ERROR_TRANSIENT = "transient"        # network failures, timeouts, 5xx
+ERROR_THROTTLED = "throttled"        # 429 Too Many Requests
+ERROR_CLIENT = "client_error"        # bad input or other 4xx, permanent
+ERROR_CONFIG = "config_error"        # missing or rejected credentials
+RETRYABLE_ERRORS = (ERROR_TRANSIENT, ERROR_THROTTLED)
 
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
 OUTPUT_DIR = os.path.join(BASE_DIR, "translations")
 
+# Translation cache (in-memory LRU backed by SQLite)
+TRANSLATION_CACHE_ENABLED = os.getenv("TRANSLATION_CACHE_ENABLED", "1").lower() not in ("0", "false", "no")
+TRANSLATION_CACHE_MAX_ENTRIES = int(os.getenv("TRANSLATION_CACHE_MAX_ENTRIES", "10000"))
+TRANSLATION_CACHE_TTL = float(os.getenv("TRANSLATION_CACHE_TTL", str(30 * 24 * 3600)))
+# Rows kept in the SQLite tier; the oldest are dropped beyond this (0 = unbounded)
+TRANSLATION_CACHE_MAX_ROWS = int(os.getenv("TRANSLATION_CACHE_MAX_ROWS", "500000"))
+TRANSLATION_CACHE_PATH = os.getenv(
+    "TRANSLATION_CACHE_PATH",
+    os.path.join(BASE_DIR, "cache", "translation_cache.sqlite3")
+)
+
+
+class RateLimitTimeout(Exception):
+    """Raised when the rate limiter's wait would exceed the caller's time budget."""
+
+    def __init__(self, wait: float):
+        super().__init__(f"Rate limiter wait of {wait:.1f}s exceeds the time budget")
+        self.retry_after = wait
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter on characters/second and requests/second.
+    Callers reserve tokens up front and sleep off any deficit, so concurrent
+    callers queue in arrival order. Requests larger than the bucket are
+    charged in full, so sustained throughput never exceeds the refill rate.
+    Callers with a time budget are turned away instead of queued when the
+    wait would exceed it. Safe to share across threads.
+    """
+
+    def __init__(
+        self,
+        chars_per_second: float = TRANSLATOR_CHARS_PER_SECOND,
+        requests_per_second: float = TRANSLATOR_REQUESTS_PER_SECOND,
+        burst_seconds: float = 1.0
+    ):
+        """
+        Args:
+            chars_per_second: Character refill rate (0 disables the character limit)
+            requests_per_second: Request refill rate (0 disables the request limit)
+            burst_seconds: Bucket capacity expressed in seconds of refill
+        """
+        self.chars_per_second = chars_per_second
+        self.requests_per_second = requests_per_second
+        self.char_capacity = chars_per_second * burst_seconds
+        self.request_capacity = max(1.0, requests_per_second * burst_seconds)
+        self._char_tokens = self.char_capacity
+        self._request_tokens = self.request_capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        
+        self.acquisitions = 0
+        self.delayed = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+
+    def _refill(self, now: float):
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self.chars_per_second > 0:
+            self._char_tokens = min(self.char_capacity, self._char_tokens + elapsed * self.chars_per_second)
+        if self.requests_per_second > 0:
+            self._request_tokens = min(self.request_capacity, self._request_tokens + elapsed * self.requests_per_second)
+
+    def _deficit_wait(self, chars: float, requests: float) -> float:
+        wait = 0.0
+        if self.chars_per_second > 0 and chars > self._char_tokens:
+            wait = (chars - self._char_tokens) / self.chars_per_second
+        if self.requests_per_second > 0 and requests > self._request_tokens:
+            wait = max(wait, (requests - self._request_tokens) / self.requests_per_second)
+        return wait
+
+    def reserve(self, chars: int, max_wait: Optional[float] = None) -> float:
+        """
+        Reserve capacity for one request of the given billed size.
+        
+        Args:
+            chars: Billed characters of the request
+            max_wait: Longest acceptable wait in seconds (None = unbounded)
+        
+        Returns:
+            Seconds the caller must wait before sending
+        
+        Raises:
+            RateLimitTimeout if the wait would exceed max_wait (nothing is reserved)
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            # The full billed size is debited even beyond the bucket: the balance goes
+            # negative and this caller (and those after it) sleep off the deficit
+            chars = chars if self.chars_per_second > 0 else 0
+            wait = self._deficit_wait(chars, 1)
+            if max_wait is not None and wait > max_wait:
+                self.rejected += 1
+                raise RateLimitTimeout(wait)
+            if self.chars_per_second > 0:
+                self._char_tokens -= chars
+            if self.requests_per_second > 0:
+                self._request_tokens -= 1
+            
+            self.acquisitions += 1
+            if wait > 0:
+                self.delayed += 1
+                self.total_wait += wait
+            return wait
+
+    def acquire(self, chars: int, max_wait: Optional[float] = None) -> float:
+        """
+        Block until a request of the given billed size may be sent. Returns seconds waited.
+        Raises RateLimitTimeout instead of waiting longer than max_wait seconds.
+        """
+        wait = self.reserve(chars, max_wait)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def wait_time(self, chars: int = 0) -> float:
+        """Seconds a request of the given billed size would currently have to wait."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._deficit_wait(chars if self.chars_per_second > 0 else 0, 1)
+
+    def stats(self) -> Dict[str, Any]:
+        """Limiter configuration, current wait and accumulated queueing time."""
+        return {
+            "chars_per_second": self.chars_per_second,
+            "requests_per_second": self.requests_per_second,
+            "current_wait": self.wait_time(),
+            "acquisitions": self.acquisitions,
+            "delayed": self.delayed,
+            "rejected": self.rejected,
+            "total_wait": self.total_wait
+        }
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide Translator RateLimiter, creating it on first use."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = RateLimiter()
+    return _rate_limiter
+
+
+def billed_characters(texts: List[str], target_languages: List[str]) -> int:
+    """Characters the service bills for a request: text length x number of targets."""
+    return sum(len(text) for text in texts) * max(1, len(target_languages))
+
+
+class TranslatorClient:
+    """
+    Reusable Azure Translator client.
+    Holds a pooled keep-alive requests.Session so repeated calls skip the
+    DNS lookup, TCP connect and TLS handshake to the Translator endpoint.
+    """
+
+    def __init__(
+        self,
+        key: Optional[str] = None,
+        region: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        pool_size: int = TRANSLATOR_POOL_SIZE,
+        connect_timeout: float = TRANSLATOR_CONNECT_TIMEOUT,
+        read_timeout: float = TRANSLATOR_READ_TIMEOUT,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
+        """
+        Args:
+            key: Translator subscription key (defaults to AZURE_TRANSLATOR_KEY)
+            region: Translator region (defaults to AZURE_TRANSLATOR_REGION / AZURE_REGION)
+            endpoint: Translator base URL
+            pool_size: Maximum number of kept-alive connections
+            connect_timeout: Seconds to wait for a connection to be established
+            read_timeout: Seconds to wait for the service to respond
+            rate_limiter: Limiter to queue requests on (process-wide limiter if None)
+        """
+        self.key = key or TRANSLATOR_KEY
+        self.region = region or TRANSLATOR_REGION
+        self.endpoint = (endpoint or TRANSLATOR_ENDPOINT).rstrip("/")
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Ocp-Apim-Subscription-Key": self.key or "",
+            "Ocp-Apim-Subscription-Region": self.region or "",
+            "Content-Type": "application/json"
+        })
+
+    @property
+    def has_credentials(self) -> bool:
+        """Whether both the subscription key and region are configured."""
+        return bool(self.key and self.region)
+
+    def translate_documents(
+        self,
+        texts: List[str],
+        target_languages: List[str],
+        source_language: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Send one /translate request for the given documents.
+        
+        Args:
+            texts: Documents to translate (one element per document)
+            target_languages: List of target language codes
+            source_language: Source language code (auto-detect if None)
+            timeout: Time budget in seconds: caps the rate-limiter wait and the
+                read timeout (unbounded wait and client default timeout if None)
+        
+        Returns:
+            Raw JSON result list from the service, one entry per document
+        
+        Raises:
+            requests.exceptions.RequestException on transport or HTTP errors
+            RateLimitTimeout if the rate limiter would hold the request past timeout
+        """
+        params = {
+            "api-version": "3.0",
+            "to": target_languages
+        }
+        if source_language:
+            params["from"] = source_language
+        
+        body = [{"text": text} for text in texts]
+        
+        # Queue in-process rather than being throttled by the service
+        waited = self.rate_limiter.acquire(billed_characters(texts, target_languages), max_wait=timeout)
+        if timeout is not None:
+            timeout = max(0.1, timeout - waited)
+        
+        response = self.session.post(
+            f"{self.endpoint}/translate",
+            params=params,
+            json=body,
+            timeout=self.timeout if timeout is None else (self.timeout[0], min(self.timeout[1], timeout))
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
+
+
+_client: Optional[TranslatorClient] = None
+_client_lock = threading.Lock()
+
+
+def get_translator_client() -> TranslatorClient:
+    """Return the process-wide TranslatorClient, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = TranslatorClient()
+    return _client
+
+
+class TranslationCache:
+    """
+    Two-tier translation cache keyed by (normalized text, source, target).
+    Tier 1 is a bounded in-process LRU; tier 2 is an on-disk SQLite store
+    (WAL mode) whose entries expire after a TTL and which is trimmed to
+    max_rows. Safe to share across threads.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = TRANSLATION_CACHE_MAX_ENTRIES,
+        db_path: Optional[str] = TRANSLATION_CACHE_PATH,
+        ttl_seconds: float = TRANSLATION_CACHE_TTL,
+        max_rows: int = TRANSLATION_CACHE_MAX_ROWS
+    ):
+        """
+        Args:
+            max_entries: Maximum number of entries kept in memory
+            db_path: SQLite file for the persistent tier (memory only if None)
+            ttl_seconds: Age after which an entry is treated as a miss
+            max_rows: Rows kept on disk before the oldest are dropped (0 = unbounded)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self.max_rows = max_rows
+        self._writes_since_trim = 0
+        self._memory: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        if db_path:
+            try:
+                os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+                self._db = sqlite3.connect(db_path, check_same_thread=False)
+                # WAL: readers do not block the writer and commits skip the rollback journal
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute("PRAGMA synchronous=NORMAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS translations ("
+                    " text TEXT NOT NULL, source TEXT NOT NULL, target TEXT NOT NULL,"
+                    " translation TEXT NOT NULL, detected_language TEXT,"
+                    " created_at REAL NOT NULL,"
+                    " PRIMARY KEY (text, source, target))"
+                )
+                self._db.execute("CREATE INDEX IF NOT EXISTS translations_created_at ON translations (created_at)")
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"⚠️ Translation cache: SQLite unavailable ({e}), using memory only")
+                self._db = None
+            else:
+                self.purge_expired()
+                self.trim()
+
+    @staticmethod
+    def make_key(text: str, source_language: Optional[str], target_language: str) -> tuple:
+        """Normalize text (Unicode NFC, collapsed whitespace) and build a cache key."""
+        normalized = " ".join(unicodedata.normalize("NFC", text).split())
+        return (normalized, source_language or "auto", target_language)
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl_seconds > 0 and time.time() - created_at > self.ttl_seconds
+
+    def _remember(self, key: tuple, value: tuple):
+        """Insert into the memory tier, evicting least recently used entries."""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def get(
+        self,
+        text: str,
+        source_language: Optional[str],
+        target_language: str
+    ) -> Optional[tuple]:
+        """
+        Look up one translation.
+        
+        Returns:
+            (translation, detected_language) or None on a miss
+        """
+        key = self.make_key(text, source_language, target_language)
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                if not self._expired(value[2]):
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return value[0], value[1]
+                del self._memory[key]
+            
+            if self._db is not None:
+                try:
+                    row = self._db.execute(
+                        "SELECT translation, detected_language, created_at FROM translations"
+                        " WHERE text = ? AND source = ? AND target = ?",
+                        key
+                    ).fetchone()
+                except sqlite3.Error:
+                    row = None
+                if row is not None and not self._expired(row[2]):
+                    self._remember(key, row)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return row[0], row[1]
+            
+            self.misses += 1
+            return None
+
+    def put(
+        self,
+        text: str,
+        source_language: Optional[str],
+        target_language: str,
+        translation: str,
+        detected_language: Optional[str] = None
+    ):
+        """Store one translation in both tiers."""
+        self.put_many([(text, source_language, target_language, translation, detected_language)])
+
+    def put_many(self, entries: Iterable[tuple]):
+        """
+        Store many translations in both tiers with a single SQLite commit.
+
+        Args:
+            entries: (text, source_language, target_language, translation, detected_language) tuples
+        """
+        now = time.time()
+        rows = [
+            self.make_key(text, source, target) + (translation, detected, now)
+            for text, source, target, translation, detected in entries
+        ]
+        if not rows:
+            return
+        with self._lock:
+            for row in rows:
+                self._remember(row[:3], row[3:])
+            if self._db is None:
+                return
+            try:
+                self._db.executemany("INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?)", rows)
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"⚠️ Translation cache write failed: {e}")
+                return
+            self._writes_since_trim += len(rows)
+            trim_due = self.max_rows > 0 and self._writes_since_trim >= max(1000, self.max_rows // 10)
+        if trim_due:
+            self.trim()
+
+    def purge_expired(self) -> int:
+        """Delete expired rows from the SQLite tier. Returns rows removed."""
+        if self._db is None or self.ttl_seconds <= 0:
+            return 0
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM translations WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,)
+            )
+            self._db.commit()
+            return cursor.rowcount
+
+    def trim(self) -> int:
+        """Drop the oldest rows beyond max_rows from the SQLite tier. Returns rows removed."""
+        if self._db is None or self.max_rows <= 0:
+            return 0
+        with self._lock:
+            self._writes_since_trim = 0
+            try:
+                cursor = self._db.execute(
+                    "DELETE FROM translations WHERE rowid IN ("
+                    " SELECT rowid FROM translations ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_rows,)
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"⚠️ Translation cache trim failed: {e}")
+                return 0
+            return cursor.rowcount
+
+    def clear(self):
+        """Drop every cached entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM translations")
+                self._db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters and current memory size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "max_entries": self.max_entries
+        }
+
+
+_cache: Optional[TranslationCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_translation_cache() -> Optional[TranslationCache]:
+    """Return the process-wide TranslationCache (None if disabled via env)."""
+    global _cache
+    if not TRANSLATION_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TranslationCache()
+    return _cache
+
+
+def _lookup_cached(
+    cache: Optional[TranslationCache],
+    text: str,
+    target_languages: List[str],
+    source_language: Optional[str]
+) -> tuple:
+    """
+    Split target languages into cached translations and languages still to fetch.
+    
+    Returns:
+        (cached translations dict, missing language list, detected source language)
+    """
+    if cache is None:
+        return {}, list(target_languages), None
+    cached: Dict[str, str] = {}
+    missing: List[str] = []
+    detected = None
+    for lang in target_languages:
+        entry = cache.get(text, source_language, lang)
+        if entry is None:
+            missing.append(lang)
+        else:
+            cached[lang] = entry[0]
+            detected = detected or entry[1]
+    return cached, missing, detected
+
+
+def _store_cached(
+    cache: Optional[TranslationCache],
+    text: str,
+    source_language: Optional[str],
+    translations: Dict[str, str],
+    detected_language: Optional[str]
+):
+    """Write freshly fetched translations back to the cache (one commit per response)."""
+    if cache is None:
+        return
+    cache.put_many(_cache_entries(text, source_language, translations, detected_language))
+
+
+def _cache_entries(
+    text: str,
+    source_language: Optional[str],
+    translations: Dict[str, str],
+    detected_language: Optional[str]
+) -> List[tuple]:
+    """TranslationCache.put_many() entries for one document's translations."""
+    return [
+        (text, source_language, lang, translated_text, detected_language)
+        for lang, translated_text in translations.items()
+    ]
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls: the first caller for a key runs
+    the work, later callers for the same key block and share its result.
+    """
+
+    class _Call:
+        def __init__(self):
+            self.done = threading.Event()
+            self.result: Any = None
+            self.error: Optional[BaseException] = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Any, "SingleFlight._Call"] = {}
+        self.leaders = 0
+        self.coalesced = 0
+        self.batch_duplicates = 0
+
+    def do(self, key: Any, fn, timeout: Optional[float] = None) -> tuple:
+        """
+        Run fn() once per key among concurrent callers.
+        
+        Returns:
+            (result, shared) where shared is True if another caller did the work
+        
+        Raises:
+            TimeoutError if a waiting caller gives up before the leader finishes
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = SingleFlight._Call()
+                self._calls[key] = call
+                self.leaders += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+        
+        if not leader:
+            if not call.done.wait(timeout):
+                raise TimeoutError("Timed out waiting for identical in-flight request")
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def add_batch_duplicates(self, count: int):
+        """Count in-batch duplicates answered without a request of their own."""
+        with self._lock:
+            self.batch_duplicates += count
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for executed, coalesced and in-flight calls."""
+        return {
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "batch_duplicates": self.batch_duplicates,
+            "in_flight": len(self._calls)
+        }
+
+
+_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """Return the process-wide SingleFlight used for translation requests."""
+    return _single_flight
+
+
+def _failure_result(
+    text: str,
+    error: str,
+    error_kind: str = ERROR_TRANSIENT,
+    retry_after: Optional[float] = None
+) -> Dict[str, Any]:
+    """Build the standard failed-translation result dictionary."""
+    return {
+        "original_text": text,
+        "source_language": None,
+        "translations": {},
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "success": False,
+        "error": error,
+        "error_kind": error_kind,
+        "retry_after": retry_after
+    }
+
+
+def _success_result(text: str, source_language: str, translations: Dict[str, str]) -> Dict[str, Any]:
+    """Build the standard successful-translation result dictionary."""
+    return {
+        "original_text": text,
+        "source_language": source_language,
+        "translations": translations,
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "success": True,
+        "error": None,
+        "error_kind": None,
+        "retry_after": None
+    }
+
+
+def _missing_credentials_result(text: str) -> Dict[str, Any]:
+    return _failure_result(
+        text,
+        "Missing Azure Translator credentials. Add AZURE_TRANSLATOR_KEY and AZURE_TRANSLATOR_REGION to .env",
+        ERROR_CONFIG
+    )
+
+
+def classify_status(status: int) -> str:
+    """Map an HTTP status code from the Translator service to an error kind."""
+    if status == 429:
+        return ERROR_THROTTLED
+    if status in (401, 403):
+        return ERROR_CONFIG
+    if status == 408 or status >= 500:
+        return ERROR_TRANSIENT
+    return ERROR_CLIENT
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _classify_exception(e: Exception) -> tuple:
+    """
+    Classify an exception raised by TranslatorClient.translate_documents.
+    
+    Returns:
+        (error_kind, error message, retry_after seconds or None)
+    """
+    if isinstance(e, requests.exceptions.HTTPError) and e.response is not None:
+        response = e.response
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        return classify_status(response.status_code), f"API request failed: {str(e)}", retry_after
+    if isinstance(e, RateLimitTimeout):
+        return ERROR_THROTTLED, f"Translation error: {str(e)}", e.retry_after
+    if isinstance(e, requests.exceptions.RequestException):
+        return ERROR_TRANSIENT, f"API request failed: {str(e)}", None
+    return ERROR_CLIENT, f"Translation error: {str(e)}", None
+
+
+def backoff_delay(
+    attempt: int,
+    retry_delay: float,
+    max_delay: float,
+    retry_after: Optional[float] = None
+) -> float:
+    """
+    Full-jitter exponential backoff: uniform in [0, min(max_delay, retry_delay * 2**attempt)].
+    A server-provided Retry-After takes precedence as a lower bound.
+    """
+    delay = random.uniform(0, min(max_delay, retry_delay * (2 ** attempt)))
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+def _retry_sleep(
+    attempt: int,
+    max_retries: int,
+    error_kind: Optional[str],
+    retry_delay: float,
+    max_delay: float,
+    retry_after: Optional[float],
+    deadline_at: Optional[float]
+) -> Optional[float]:
+    """
+    Decide whether another attempt should be made.
+    
+    Returns:
+        Seconds to sleep before the next attempt, or None to stop retrying
+    """
+    if error_kind not in RETRYABLE_ERRORS or attempt >= max_retries - 1:
+        return None
+    delay = backoff_delay(attempt, retry_delay, max_delay, retry_after)
+    if deadline_at is not None and time.monotonic() + delay >= deadline_at:
+        return None
+    return delay
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences, keeping each terminator and trailing whitespace
+    with its sentence so that "".join(result) == text.
+    """
+    sentences: List[str] = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        sentences.append(text[start:match.end()])
+        start = match.end()
+    if start < len(text):
+        sentences.append(text[start:])
+    return sentences
+
+
+def chunk_text(text: str, max_chars: int = LONG_TEXT_CHUNK_CHARS) -> List[str]:
+    """
+    Greedily pack sentences into chunks of at most max_chars characters.
+    Sentences longer than max_chars are split at the last whitespace before
+    the limit (or hard-cut if there is none). "".join(result) == text.
+    """
+    chunks: List[str] = []
+    current = ""
+    for sentence in split_sentences(text):
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars) + 1 or max_chars
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(sentence[:cut])
+            sentence = sentence[cut:]
+        if current and len(current) + len(sentence) > max_chars:
+            chunks.append(current)
+            current = ""
+        current += sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _join_chunks(lang: str, pieces: List[str]) -> str:
+    """Stitch translated chunks back together for one target language."""
+    separator = "" if lang.split("-")[0] in NO_SPACE_LANGUAGES else " "
+    return separator.join(piece.strip() for piece in pieces if piece.strip())
+
+
+def _translate_long_text(
+    text: str,
+    target_languages: List[str],
+    source_language: Optional[str],
+    client: TranslatorClient,
+    use_cache: bool,
+    timeout: Optional[float],
+    return_alignment: bool
+) -> Dict[str, Any]:
+    """Translate sentence-aligned chunks of a long text concurrently and reassemble them."""
+    chunks = [chunk for chunk in chunk_text(text) if chunk.strip()]
+    
+    def _translate_chunk(chunk: str) -> Dict[str, Any]:
+        return translate_text(
+            chunk, target_languages, source_language,
+            client=client, use_cache=use_cache, timeout=timeout, chunk=False
+        )
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(LONG_TEXT_MAX_WORKERS, len(chunks)))) as executor:
+        chunk_results = list(executor.map(_translate_chunk, chunks))
+    
+    for chunk_result in chunk_results:
+        if not chunk_result["success"]:
+            return _failure_result(
+                text, chunk_result["error"], chunk_result["error_kind"], chunk_result["retry_after"]
+            )
+    
+    result = _success_result(
+        text,
+        chunk_results[0]["source_language"],
+        {
+            lang: _join_chunks(lang, [r["translations"].get(lang, "") for r in chunk_results])
+            for lang in target_languages
+        }
+    )
+    if return_alignment:
+        result["chunks"] = [
+            {"index": i, "source": chunk, "translations": r["translations"]}
+            for i, (chunk, r) in enumerate(zip(chunks, chunk_results))
+        ]
+    return result
+
 
 def translate_text(
     text: str,
     target_languages: List[str] = None,
-    source_language: Optional[str] = None
+    source_language: Optional[str] = None,
+    client: Optional[TranslatorClient] = None,
+    use_cache: bool = True,
+    timeout: Optional[float] = None,
+    return_alignment: bool = False,
+    chunk: bool = True
 ) -> Dict[str, Any]:
-    if target_languages is None:
-        target_languages = DEFAULT_TARGET_LANGUAGES
     """
     Translate text to one or multiple target languages using Azure Translator.
     
+    Cached translations are looked up per target language, so only the
+    languages missing from the cache are requested from the service.
+    Texts longer than LONG_TEXT_CHUNK_CHARS are split at sentence boundaries
+    (including danda and CJK full stops), translated concurrently and
+    stitched back together in order.
+    
     Args:
         text: Input text to translate
         target_languages: List of target language codes (e.g., ["hi", "te", "es"])
         source_language: Source language code (auto-detect if None)
+        client: TranslatorClient to use (shared process-wide client if None)
+        use_cache: Set False to bypass the translation cache for this call
+        timeout: Time budget in seconds for the request, including any
+            rate-limiter wait (a longer wait fails with error_kind "throttled")
+        return_alignment: Also return per-chunk source/translation pairs
+            under "chunks"
+        chunk: Set False to send the text as a single request
     
     Returns:
         Dictionary with translations and metadata:
@@ -51,90 +952,60 @@ def translate_text(
             },
             "timestamp": str,
             "success": bool,
-            "error": Optional[str]
+            "error": Optional[str],
+            "error_kind": Optional[str],  # transient / throttled / client_error / config_error
+            "retry_after": Optional[float],  # seconds requested by the service on 429
+            "chunks": [  # only with return_alignment=True
+                {"index": int, "source": str, "translations": {"hi": str}}
+            ]
         }
     """
-    if not TRANSLATOR_KEY or not TRANSLATOR_REGION:
-        return {
-            "original_text": text,
-            "source_language": None,
-            "translations": {},
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "success": False,
-            "error": "Missing Azure Translator credentials. Add AZURE_TRANSLATOR_KEY and AZURE_TRANSLATOR_REGION to .env"
-        }
+    if target_languages is None:
+        target_languages = DEFAULT_TARGET_LANGUAGES
+    if client is None:
+        client = get_translator_client()
+    
+    if not client.has_credentials:
+        return _missing_credentials_result(text)
     
     if not text or not text.strip():
-        return {
-            "original_text": text,
-            "source_language": None,
-            "translations": {},
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "success": False,
-            "error": "Empty text provided"
-        }
+        return _failure_result(text, "Empty text provided", ERROR_CLIENT)
+    
+    if chunk and (len(text) > LONG_TEXT_CHUNK_CHARS or return_alignment):
+        return _translate_long_text(
+            text, target_languages, source_language, client, use_cache, timeout, return_alignment
+        )
+    
+    cache = get_translation_cache() if use_cache else None
+    translations, missing, detected_language = _lookup_cached(
+        cache, text, target_languages, source_language
+    )
     
     try:
-        # Prepare API request
-        endpoint = f"{TRANSLATOR_ENDPOINT}/translate"
-        params = {
-            "api-version": "3.0",
-            "to": target_languages
-        }
-        
-        if source_language:
-            params["from"] = source_language
-        
-        headers = {
-            "Ocp-Apim-Subscription-Key": TRANSLATOR_KEY,
-            "Ocp-Apim-Subscription-Region": TRANSLATOR_REGION,
-            "Content-Type": "application/json"
-        }
-        
-        body = [{"text": text}]
-        
-        # Make API call
-        response = requests.post(endpoint, params=params, headers=headers, json=body, timeout=10)
-        response.raise_for_status()
+        if missing:
+            result = client.translate_documents([text], missing, source_language, timeout=timeout)[0]
+            
+            # Extract translations
+            fetched: Dict[str, str] = {}
+            detected_language = result.get("detectedLanguage", {}).get("language", source_language or "unknown")
+            
+            for translation in result.get("translations", []):
+                lang = translation.get("to")
+                translated_text = translation.get("text", "")
+                fetched[lang] = translated_text
+            
+            _store_cached(cache, text, source_language, fetched, detected_language)
+            translations.update(fetched)
         
-        result = response.json()[0]
-        
-        # Extract translations
-        translations: Dict[str, str] = {}
-        detected_language = result.get("detectedLanguage", {}).get("language", source_language or "unknown")
-        
-        for translation in result.get("translations", []):
-            lang = translation.get("to")
-            translated_text = translation.get("text", "")
-            translations[lang] = translated_text
-        
-        return {
-            "original_text": text,
-            "source_language": detected_language,
-            "translations": translations,
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "success": True,
-            "error": None
-        }
+        return _success_result(
+            text,
+            detected_language or source_language or "unknown",
+            {lang: translations[lang] for lang in target_languages if lang in translations}
+        )
     
-    except requests.exceptions.RequestException as e:
-        return {
-            "original_text": text,
-            "source_language": None,
-            "translations": {},
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "success": False,
-            "error": f"API request failed: {str(e)}"
-        }
     except Exception as e:
-        return {
-            "original_text": text,
-            "source_language": None,
-            "translations": {},
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "success": False,
-            "error": f"Translation error: {str(e)}"
-        }
+        error_kind, error, retry_after = _classify_exception(e)
+        return _failure_result(text, error, error_kind, retry_after)
 
 
 def translate_with_retry(
@@ -142,62 +1013,384 @@ def translate_with_retry(
     target_languages: List[str] = None,
     source_language: Optional[str] = None,
     max_retries: int = 3,
-    retry_delay: float = 1.0
+    retry_delay: float = 1.0,
+    client: Optional[TranslatorClient] = None,
+    use_cache: bool = True,
+    max_delay: float = 30.0,
+    deadline: Optional[float] = None,
+    return_alignment: bool = False
 ) -> Dict[str, Any]:
-    if target_languages is None:
-        target_languages = DEFAULT_TARGET_LANGUAGES
     """
     Translate text with retry logic for handling transient failures.
     
+    Only transient and throttled errors are retried, using full-jitter
+    exponential backoff and honoring the service's Retry-After header.
+    Client and configuration errors are returned immediately.
+    
+    Identical concurrent calls (same text, source, target set, client and
+    options) are coalesced: one performs the request and the others share
+    its result.
+    
     Args:
         text: Input text to translate
         target_languages: List of target language codes
         source_language: Source language code (auto-detect if None)
-        max_retries: Maximum number of retry attempts
-        retry_delay: Delay between retries in seconds
+        max_retries: Maximum number of attempts
+        retry_delay: Base backoff delay in seconds
+        client: TranslatorClient to use (shared process-wide client if None)
+        use_cache: Set False to bypass the translation cache for this call
+        max_delay: Upper bound for a single backoff sleep in seconds
+        deadline: Total time budget in seconds across all attempts (None = unbounded)
+        return_alignment: Also return per-chunk source/translation pairs
     
     Returns:
         Translation result dictionary
     """
+    if target_languages is None:
+        target_languages = DEFAULT_TARGET_LANGUAGES
+    
+    # Everything that changes what the leader does is part of the key, so a
+    # use_cache=False call or a custom client never receives another call's result
+    key = (text, source_language, tuple(sorted(target_languages)), return_alignment,
+           use_cache, client, deadline)
+    try:
+        result, shared = _single_flight.do(
+            key,
+            lambda: _translate_with_retry(
+                text, target_languages, source_language, max_retries,
+                retry_delay, client, use_cache, max_delay, deadline, return_alignment
+            ),
+            timeout=deadline
+        )
+    except TimeoutError as e:
+        return _failure_result(text, f"Translation error: {str(e)}", ERROR_TRANSIENT)
+    
+    if not shared:
+        return result
+    # Waiters get their own copy, keyed in the caller's requested language order
+    result = dict(result)
+    translations = result.get("translations", {})
+    result["translations"] = {lang: translations[lang] for lang in target_languages if lang in translations}
+    return result
+
+
+def _translate_with_retry(
+    text: str,
+    target_languages: List[str],
+    source_language: Optional[str],
+    max_retries: int,
+    retry_delay: float,
+    client: Optional[TranslatorClient],
+    use_cache: bool,
+    max_delay: float,
+    deadline: Optional[float],
+    return_alignment: bool
+) -> Dict[str, Any]:
+    """Retry loop behind translate_with_retry (runs once per coalesced key)."""
+    deadline_at = time.monotonic() + deadline if deadline is not None else None
     result: Dict[str, Any] = {}
     for attempt in range(max_retries):
-        result = translate_text(text, target_languages, source_language)
+        timeout = max(0.1, deadline_at - time.monotonic()) if deadline_at is not None else None
+        result = translate_text(
+            text, target_languages, source_language,
+            client=client, use_cache=use_cache, timeout=timeout,
+            return_alignment=return_alignment
+        )
         
         if result["success"]:
             return result
         
-        if attempt < max_retries - 1:
-            time.sleep(retry_delay * (attempt + 1))  # Exponential backoff
-            print(f"⚠️ Retry attempt {attempt + 2}/{max_retries}...")
+        delay = _retry_sleep(
+            attempt, max_retries, result.get("error_kind"),
+            retry_delay, max_delay, result.get("retry_after"), deadline_at
+        )
+        if delay is None:
+            break
+        print(f"⚠️ {result['error_kind']} error, retry attempt {attempt + 2}/{max_retries} in {delay:.1f}s...")
+        time.sleep(delay)
     
     return result
 
 
-def save_translation(translation_result: Dict[str, Any], transcript_id: Optional[str] = None) -> str:
+def _pack_batch(
+    texts: List[str],
+    group_keys: List[Any],
+    indices: List[int],
+    max_documents: int = MAX_DOCUMENTS_PER_REQUEST,
+    max_chars: int = MAX_CHARS_PER_REQUEST
+) -> List[List[int]]:
     """
-    Save translation result to JSON file.
+    Greedily pack item indices into requests that respect the document and
+    character limits. Items are only packed together when they share a
+    group key (source language and target set), since "from" and "to" are
+    per-request parameters.
+    
+    Returns:
+        List of packs, each a list of indices into texts
+    """
+    packs: List[List[int]] = []
+    open_packs: Dict[Any, List[int]] = {}
+    open_chars: Dict[Any, int] = {}
+    
+    for idx in indices:
+        group = group_keys[idx]
+        length = len(texts[idx])
+        pack = open_packs.get(group)
+        
+        if pack is not None and (len(pack) >= max_documents or open_chars[group] + length > max_chars):
+            packs.append(pack)
+            pack = None
+        
+        if pack is None:
+            pack = []
+            open_packs[group] = pack
+            open_chars[group] = 0
+        
+        pack.append(idx)
+        open_chars[group] += length
+    
+    packs.extend(open_packs.values())
+    packs.sort(key=lambda p: p[0])
+    return packs
+
+
+def _plan_batch(
+    texts: List[str],
+    target_languages: List[str],
+    source_language: Union[Optional[str], List[Optional[str]]],
+    cache: Optional["TranslationCache"]
+) -> Dict[str, Any]:
+    """
+    Resolve empty and fully cached items up front and pack the rest.
+    
+    Returns:
+        Batch plan dictionary:
+        {
+            "results": list with a result for every already-resolved item,
+            "sources": per-item source language,
+            "cached": idx -> (cached translations, detected language),
+            "group_keys": idx -> (source language, missing target tuple),
+            "packs": list of index lists, one per Translator request,
+            "oversized": indices too long to share a request,
+            "duplicates": idx -> index of the identical item actually sent
+        }
+    """
+    if isinstance(source_language, (list, tuple)):
+        if len(source_language) != len(texts):
+            raise ValueError("source_language list must have one entry per text")
+        sources = list(source_language)
+    else:
+        sources = [source_language] * len(texts)
+    
+    results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+    cached: Dict[int, tuple] = {}
+    group_keys: List[Any] = [None] * len(texts)
+    pending: List[int] = []
+    oversized: List[int] = []
+    duplicates: Dict[int, int] = {}
+    first_seen: Dict[tuple, int] = {}
+    
+    for idx, text in enumerate(texts):
+        if not text or not text.strip():
+            results[idx] = _failure_result(text, "Empty text provided", ERROR_CLIENT)
+        elif len(text) > MAX_CHARS_PER_REQUEST:
+            oversized.append(idx)
+        else:
+            cached_translations, missing, detected = _lookup_cached(
+                cache, text, target_languages, sources[idx]
+            )
+            cached[idx] = (cached_translations, detected)
+            if missing:
+                group_keys[idx] = (sources[idx], tuple(missing))
+                # Identical rows are only sent once and share the result
+                seen_key = (text, group_keys[idx])
+                if seen_key in first_seen:
+                    duplicates[idx] = first_seen[seen_key]
+                else:
+                    first_seen[seen_key] = idx
+                    pending.append(idx)
+            else:
+                results[idx] = _success_result(
+                    text,
+                    detected or sources[idx] or "unknown",
+                    {lang: cached_translations[lang] for lang in target_languages}
+                )
+    
+    return {
+        "results": results,
+        "sources": sources,
+        "cached": cached,
+        "group_keys": group_keys,
+        "packs": _pack_batch(texts, group_keys, pending),
+        "oversized": oversized,
+        "duplicates": duplicates
+    }
+
+
+def _finish_batch(plan: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Copy results of sent items onto their in-batch duplicates."""
+    results = plan["results"]
+    for idx, source_idx in plan["duplicates"].items():
+        results[idx] = dict(results[source_idx], translations=dict(results[source_idx]["translations"]))
+    _single_flight.add_batch_duplicates(len(plan["duplicates"]))
+    return results
+
+
+def _apply_pack_response(
+    plan: Dict[str, Any],
+    texts: List[str],
+    pack: List[int],
+    response: Optional[List[Dict[str, Any]]],
+    target_languages: List[str],
+    cache: Optional["TranslationCache"],
+    error: Optional[str] = None,
+    error_kind: Optional[str] = None,
+    retry_after: Optional[float] = None
+) -> List[tuple]:
+    """
+    Merge one packed Translator response (or its error) into plan["results"].
+    The fetched translations are written to cache in one commit, if given.
+
+    Returns:
+        The cache entries for the fetched translations (for callers that
+        write them elsewhere, e.g. off the event loop)
+    """
+    results = plan["results"]
+    entries: List[tuple] = []
+    if error is not None:
+        for idx in pack:
+            results[idx] = _failure_result(texts[idx], error, error_kind or ERROR_TRANSIENT, retry_after)
+        return entries
+    
+    pack_source = plan["group_keys"][pack[0]][0]
+    for idx, item in zip(pack, response):
+        fetched = {
+            translation.get("to"): translation.get("text", "")
+            for translation in item.get("translations", [])
+        }
+        detected_language = item.get("detectedLanguage", {}).get("language", pack_source or "unknown")
+        entries += _cache_entries(texts[idx], pack_source, fetched, detected_language)
+        translations = dict(plan["cached"][idx][0], **fetched)
+        results[idx] = _success_result(
+            texts[idx],
+            detected_language,
+            {lang: translations[lang] for lang in target_languages if lang in translations}
+        )
+    for idx in pack[len(response):]:
+        results[idx] = _failure_result(texts[idx], "Translation error: missing result in batch response")
+    if cache is not None:
+        cache.put_many(entries)
+    return entries
+
+
+def translate_batch(
+    texts: List[str],
+    target_languages: List[str] = None,
+    source_language: Union[Optional[str], List[Optional[str]]] = None,
+    max_retries: int = 3,
+    retry_delay: float = 1.0,
+    client: Optional[TranslatorClient] = None,
+    use_cache: bool = True,
+    max_delay: float = 30.0,
+    deadline: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Translate many texts, packing them into as few Translator requests as
+    the per-request document and character limits allow.
     
     Args:
-        translation_result: Result dictionary from translate_text()
-        transcript_id: Optional ID to include in filename
+        texts: Input texts to translate
+        target_languages: List of target language codes
+        source_language: Source language code for every text, or a list with
+            one code (or None for auto-detect) per text
+        max_retries: Maximum number of attempts per packed request
+        retry_delay: Base backoff delay in seconds
+        client: TranslatorClient to use (shared process-wide client if None)
+        use_cache: Set False to bypass the translation cache for this call
+        max_delay: Upper bound for a single backoff sleep in seconds
+        deadline: Total time budget in seconds across the batch, covering
+            retries and rate-limiter waits
     
     Returns:
-        Path to saved file
+        List of translation result dictionaries (same shape as translate_text),
+        in input order, each with its own success flag and error
     """
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    if target_languages is None:
+        target_languages = DEFAULT_TARGET_LANGUAGES
+    if client is None:
+        client = get_translator_client()
     
-    if transcript_id:
-        filename = f"translation_{transcript_id}.json"
-    else:
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        filename = f"translation_{timestamp}.json"
+    if not client.has_credentials:
+        return [_missing_credentials_result(text) for text in texts]
+    
+    deadline_at = time.monotonic() + deadline if deadline is not None else None
+    cache = get_translation_cache() if use_cache else None
+    plan = _plan_batch(texts, target_languages, source_language, cache)
+    results = plan["results"]
+    
+    for idx in plan["oversized"]:
+        # Too large to share a request; translate on its own
+        results[idx] = translate_with_retry(
+            texts[idx], target_languages, plan["sources"][idx],
+            max_retries=max_retries, retry_delay=retry_delay,
+            client=client, use_cache=use_cache, max_delay=max_delay,
+            deadline=max(0.0, deadline_at - time.monotonic()) if deadline_at is not None else None
+        )
     
-    filepath = os.path.join(OUTPUT_DIR, filename)
+    for pack in plan["packs"]:
+        pack_texts = [texts[idx] for idx in pack]
+        pack_source, pack_targets = plan["group_keys"][pack[0]]
+        response = None
+        error = error_kind = retry_after = None
+        
+        for attempt in range(max_retries):
+            try:
+                response = client.translate_documents(
+                    pack_texts, list(pack_targets), pack_source,
+                    timeout=max(0.1, deadline_at - time.monotonic()) if deadline_at is not None else None
+                )
+                error = None
+                break
+            except Exception as e:
+                error_kind, error, retry_after = _classify_exception(e)
+            
+            delay = _retry_sleep(
+                attempt, max_retries, error_kind, retry_delay, max_delay, retry_after, deadline_at
+            )
+            if delay is None:
+                break
+            print(f"⚠️ {error_kind} error, batch retry attempt {attempt + 2}/{max_retries} in {delay:.1f}s...")
+            time.sleep(delay)
+        
+        _apply_pack_response(
+            plan, texts, pack, response, target_languages, cache,
+            error=error, error_kind=error_kind, retry_after=retry_after
+        )
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(translation_result, f, ensure_ascii=False, indent=2)
+    return _finish_batch(plan)
+
+
+def save_translation(translation_result: Dict[str, Any], transcript_id: Optional[str] = None) -> str:
+    """
+    Append translation result to the daily JSONL translation log.
     
-    return filepath
+    Args:
+        translation_result: Result dictionary from translate_text()
+        transcript_id: Optional ID to index the record under
+    
+    Returns:
+        Path to the log file the record is written to
+    """
+    if not transcript_id:
+        transcript_id = f"{time.strftime('%Y%m%d_%H%M%S')}_{int(time.time() * 1000) % 1000:03d}"
+    
+    record = dict(translation_result, transcript_id=transcript_id)
+    return get_log_writer(OUTPUT_DIR).append(record, record_id=transcript_id)
+
+
+def load_translation(transcript_id: str) -> Optional[Dict[str, Any]]:
+    """Look up a saved translation by transcript id via the log's offset index."""
+    return JsonlLogReader(OUTPUT_DIR).get(transcript_id)
 
 
 def test_translator():
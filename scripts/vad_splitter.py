@@ -0,0 +1,153 @@
+"""
+VAD Audio Splitter
+Energy-based voice activity detection over large WAV files, read through
+a NumPy memmap, to cut long recordings at silences into bounded segments
+that can be transcribed concurrently
+"""
+
+import os
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+from audio_utils import BytesLike, WavFormatError, parse_wav_header, read_wav_header
+
+SPLIT_MAX_SEGMENT_SECONDS = float(os.getenv("SPLIT_MAX_SEGMENT_SECONDS", "60"))
+SPLIT_MIN_SEGMENT_SECONDS = float(os.getenv("SPLIT_MIN_SEGMENT_SECONDS", "10"))
+VAD_FRAME_MS = 30
+# Energy frames are computed over blocks of this many seconds to bound memory
+VAD_BLOCK_SECONDS = 30
+
+_DTYPES = {8: np.uint8, 16: np.dtype("<i2"), 32: np.dtype("<i4")}
+
+
+def open_pcm(source: Union[str, BytesLike]) -> Tuple[np.ndarray, Dict[str, int]]:
+    """
+    Map a WAV's PCM payload as a (frames, channels) array without loading it.
+
+    Args:
+        source: Path to a WAV file (memory-mapped) or WAV bytes (zero-copy view)
+
+    Returns:
+        (samples array, header dictionary from parse_wav_header)
+
+    Raises:
+        WavFormatError: Not a PCM WAV, or a 24-bit one (no matching NumPy dtype)
+    """
+    header = read_wav_header(source) if isinstance(source, str) else parse_wav_header(source)
+    dtype = _DTYPES.get(header["bits_per_sample"])
+    if dtype is None:
+        raise WavFormatError(f"{header['bits_per_sample']}-bit PCM cannot be split")
+    frame_bytes = header["channels"] * header["bits_per_sample"] // 8
+
+    if isinstance(source, str):
+        available = os.path.getsize(source) - header["data_offset"]
+    else:
+        available = len(memoryview(source).cast("B")) - header["data_offset"]
+    size = min(header["data_size"], available) if header["data_size"] else available
+    frames = size // frame_bytes
+
+    if isinstance(source, str):
+        if frames == 0:
+            return np.zeros((0, header["channels"]), dtype=dtype), header
+        samples = np.memmap(source, dtype=dtype, mode="r", offset=header["data_offset"],
+                            shape=(frames, header["channels"]))
+    else:
+        samples = np.frombuffer(source, dtype=dtype, count=frames * header["channels"],
+                                offset=header["data_offset"]).reshape(frames, header["channels"])
+    return samples, header
+
+
+def frame_energy_db(samples: np.ndarray, sample_rate: int, bits_per_sample: int,
+                    frame_ms: int = VAD_FRAME_MS) -> np.ndarray:
+    """RMS level in dBFS for each frame_ms frame, computed block by block."""
+    frame_len = max(1, sample_rate * frame_ms // 1000)
+    block_frames = max(1, VAD_BLOCK_SECONDS * 1000 // frame_ms)
+    full_scale = float(2 ** (bits_per_sample - 1))
+    count = len(samples) // frame_len
+    levels = np.empty(count, dtype=np.float32)
+
+    for first in range(0, count, block_frames):
+        last = min(count, first + block_frames)
+        block = np.asarray(samples[first * frame_len:last * frame_len], dtype=np.float32)
+        if bits_per_sample == 8:
+            block = block - 128
+        mono = block.mean(axis=1) / full_scale
+        rms = np.sqrt(np.mean(mono.reshape(-1, frame_len) ** 2, axis=1))
+        levels[first:last] = 20 * np.log10(np.maximum(rms, 1e-6))
+    return levels
+
+
+def find_split_points(
+    levels: np.ndarray,
+    frame_ms: int = VAD_FRAME_MS,
+    max_segment_seconds: float = SPLIT_MAX_SEGMENT_SECONDS,
+    min_segment_seconds: float = SPLIT_MIN_SEGMENT_SECONDS
+) -> List[int]:
+    """
+    Choose cut frames so every segment is at most max_segment_seconds long.
+
+    Within each allowed window the longest silent run wins and the cut
+    goes in its middle; if the window has no silence, the cut goes at
+    its quietest frame.
+
+    Returns:
+        Frame indices at which to cut (excluding 0 and the end)
+    """
+    count = len(levels)
+    max_frames = max(1, int(max_segment_seconds * 1000 / frame_ms))
+    min_frames = min(max_frames, int(min_segment_seconds * 1000 / frame_ms))
+    if count <= max_frames:
+        return []
+
+    # Adaptive threshold between the noise floor and the speech level
+    floor, speech = np.percentile(levels, [10, 90])
+    threshold = floor + max(6.0, 0.2 * (speech - floor))
+    silent = levels < threshold
+
+    cuts = []
+    cursor = 0
+    while count - cursor > max_frames:
+        lo, hi = cursor + min_frames, cursor + max_frames
+        window = silent[lo:hi]
+        # Runs of silence in the window: starts where the mask rises, ends where it falls
+        edges = np.diff(np.concatenate([[0], window.astype(np.int8), [0]]))
+        starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+        if len(starts):
+            longest = np.argmax((ends - starts)[::-1])  # reversed: prefer later runs on ties
+            run = len(starts) - 1 - longest
+            cut = lo + (starts[run] + ends[run]) // 2
+        else:
+            cut = lo + int(np.argmin(levels[lo:hi]))
+        cut = max(cut, cursor + 1)
+        cuts.append(cut)
+        cursor = cut
+    return cuts
+
+
+def split_audio(
+    source: Union[str, BytesLike],
+    max_segment_seconds: float = SPLIT_MAX_SEGMENT_SECONDS,
+    min_segment_seconds: float = SPLIT_MIN_SEGMENT_SECONDS,
+    frame_ms: int = VAD_FRAME_MS
+) -> Tuple[np.ndarray, Dict[str, int], List[Tuple[int, int]]]:
+    """
+    Scan a WAV and cut it at silences into segments of bounded length.
+
+    Args:
+        source: Path to a WAV file or WAV bytes
+        max_segment_seconds: Upper bound for each segment
+        min_segment_seconds: Cuts are not placed closer than this to the previous one
+        frame_ms: VAD frame length
+
+    Returns:
+        (samples array, header, [(start_frame, end_frame), ...]) where frames
+        are sample frames of the samples array
+    """
+    samples, header = open_pcm(source)
+    levels = frame_energy_db(samples, header["sample_rate"], header["bits_per_sample"], frame_ms)
+    frame_len = max(1, header["sample_rate"] * frame_ms // 1000)
+    cuts = [c * frame_len for c in find_split_points(levels, frame_ms, max_segment_seconds, min_segment_seconds)]
+    bounds = [0] + cuts + [len(samples)]
+    segments = [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+    return samples, header, segments
@@ -0,0 +1,17 @@
+"""Shared test setup: scripts/ modules are imported flat, as the pages do."""
+
+import os
+import sys
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts")
+sys.path.insert(0, SCRIPTS_DIR)
+
+# Offline backends and dummy credentials, set before any module reads them
+os.environ.setdefault("SPEECH_BACKEND", "fake")
+os.environ.setdefault("FAKE_SPEECH_LATENCY_MS", "0")
+os.environ.setdefault("AZURE_SPEECH_KEY", "test-key")
+os.environ.setdefault("AZURE_REGION", "test-region")
+os.environ.setdefault("AZURE_TRANSLATOR_KEY", "test-key")
+os.environ.setdefault("AZURE_TRANSLATOR_REGION", "test-region")
+os.environ.setdefault("TRANSLATION_CACHE_ENABLED", "0")
+os.environ.setdefault("STT_CACHE_ENABLED", "0")
@@ -0,0 +1,53 @@
+import threading
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import audio_decode
+import batch_transcriber
+
+
+class _BrokenAfterOne:
+    """Process pool stand-in whose only worker crashes: the first job fails, later submits raise."""
+
+    def __init__(self, max_workers=None):
+        self.submitted = 0
+
+    def submit(self, fn, *args):
+        self.submitted += 1
+        if self.submitted > 1:
+            raise BrokenProcessPool("A process in the process pool was terminated abruptly")
+        future = Future()
+        future.set_exception(BrokenProcessPool("A process in the process pool was terminated abruptly"))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+def _run_with_timeout(fn, seconds=30):
+    outcome = {}
+    thread = threading.Thread(target=lambda: outcome.update(value=fn()), daemon=True)
+    thread.start()
+    thread.join(seconds)
+    assert not thread.is_alive(), "consumer hung waiting for results"
+    return outcome["value"]
+
+
+def test_broken_pool_reports_every_job(monkeypatch):
+    monkeypatch.setattr(audio_decode, "ProcessPoolExecutor", _BrokenAfterOne)
+    jobs = [(index, f"talk{index}.mp3", b"not audio", "en-US") for index in range(5)]
+
+    items = _run_with_timeout(lambda: list(audio_decode.iter_decoded_audio(jobs, max_workers=2)))
+
+    assert sorted(item.index for item in items) == list(range(5))
+    assert all(item.error and "Decoding failed" in item.error for item in items)
+
+
+def test_batch_does_not_hang_when_decoder_pool_breaks(monkeypatch):
+    monkeypatch.setattr(audio_decode, "ProcessPoolExecutor", _BrokenAfterOne)
+    jobs = [(f"talk{index}.mp3", b"not audio", "en-US") for index in range(4)]
+
+    results = _run_with_timeout(lambda: list(batch_transcriber.iter_transcriptions(jobs, use_cache=False)))
+
+    assert sorted(result["index"] for result in results) == list(range(4))
+    assert all(result["status"] == "error" for result in results)
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from audio_preprocess import PcmNormalizer, PolyphaseResampler, normalize_pcm_chunks
+
+
+def _tone(frequency, rate, seconds, amplitude=0.5):
+    return (amplitude * np.sin(2 * np.pi * frequency * np.arange(int(rate * seconds)) / rate)).astype(np.float32)
+
+
+def _resample(resampler, samples, chunk_size):
+    parts = [resampler.process(samples[i:i + chunk_size]) for i in range(0, len(samples), chunk_size)]
+    return np.concatenate(parts + [resampler.flush()])
+
+
+@pytest.mark.parametrize("in_rate", [8000, 22050, 44100, 48000])
+def test_resampler_length_and_tone(in_rate):
+    samples = _tone(440, in_rate, 1.0)
+    out = _resample(PolyphaseResampler(in_rate, 16000), samples, 4096)
+
+    assert len(out) == -(-len(samples) * 16000 // in_rate)
+    # Away from the edges the output is the same tone, in phase (the filter delay is compensated)
+    expected = _tone(440, 16000, len(out) / 16000)
+    interior = slice(200, len(out) - 200)
+    assert np.max(np.abs(out[interior] - expected[interior])) < 1e-3
+
+
+def test_resampler_chunking_does_not_change_output():
+    samples = np.random.default_rng(3).uniform(-0.5, 0.5, 44100).astype(np.float32)
+    whole = _resample(PolyphaseResampler(44100, 16000), samples, len(samples))
+    chunked = _resample(PolyphaseResampler(44100, 16000), samples, 1000)
+    tiny = _resample(PolyphaseResampler(44100, 16000), samples, 7)
+
+    np.testing.assert_allclose(chunked, whole, atol=1e-6)
+    np.testing.assert_allclose(tiny, whole, atol=1e-6)
+
+
+def test_resampler_suppresses_aliasing():
+    # 12 kHz cannot be represented at 16 kHz and would fold back to 4 kHz
+    out = _resample(PolyphaseResampler(48000, 16000), _tone(12000, 48000, 1.0), 4096)
+    assert np.sqrt(np.mean(out[200:-200] ** 2)) < 1e-3
+
+
+def test_normalizer_converts_24bit_stereo_across_split_frames():
+    rate = 48000
+    left = _tone(440, rate, 0.5)
+    stereo = np.stack([left, left], axis=1).reshape(-1)
+    values = np.round(stereo * 8388607).astype("<i4")
+    pcm = b"".join(int(v).to_bytes(3, "little", signed=True) for v in values)
+
+    whole = PcmNormalizer(rate, 2, 24)
+    expected = whole.process(pcm) + whole.flush()
+    split = PcmNormalizer(rate, 2, 24)
+    # 1001-byte chunks cut through 6-byte frames
+    out = b"".join(split.process(pcm[i:i + 1001]) for i in range(0, len(pcm), 1001)) + split.flush()
+
+    assert out == expected
+    assert len(out) == 2 * len(left) // 3
+    assert (split.bytes_in, split.bytes_out) == (len(pcm), len(out))
+    samples = np.frombuffer(out, dtype="<i2").astype(np.float32) / 32768
+    np.testing.assert_allclose(samples[200:-200], _tone(440, 16000, len(samples) / 16000)[200:-200], atol=0.01)
+
+
+def test_normalize_pcm_chunks_passthrough_and_size_estimate():
+    header = {"sample_rate": 16000, "channels": 1, "bits_per_sample": 16, "data_offset": 44, "data_size": 640}
+    chunks = [b"\x00\x01" * 160, b"\x02\x03" * 160]
+    out_header, out = normalize_pcm_chunks(header, chunks)
+    assert out_header is header
+    assert list(out) == chunks
+
+    pcm = np.zeros(44100, dtype="<i2").tobytes()
+    header = dict(header, sample_rate=44100, data_size=len(pcm))
+    out_header, out = normalize_pcm_chunks(header, [pcm[:30000], pcm[30000:]])
+    assert out_header["sample_rate"] == 16000
+    assert out_header["data_size"] == len(b"".join(out))
@@ -0,0 +1,28 @@
+import struct
+
+from audio_utils import WAV_UNKNOWN_SIZE, ProgressiveWavWriter, build_wav_header, parse_wav_header
+
+
+def _sizes(header):
+    (riff_size,) = struct.unpack_from("<I", header, 4)
+    (data_size,) = struct.unpack_from("<I", header, 40)
+    return riff_size, data_size
+
+
+def test_progressive_writer_header_sizes(tmp_path):
+    path = tmp_path / "stream.wav"
+    writer = ProgressiveWavWriter(str(path), 24000)
+    writer.write(b"\x01\x00" * 100)
+
+    # While growing, both sizes say "unknown" and readers take the PCM up to end of file
+    growing = path.read_bytes()
+    assert _sizes(growing) == (WAV_UNKNOWN_SIZE, WAV_UNKNOWN_SIZE)
+    assert parse_wav_header(growing) == {"sample_rate": 24000, "channels": 1, "bits_per_sample": 16,
+                                         "data_offset": 44, "data_size": 0}
+
+    writer.write(b"\x02\x00" * 50)
+    writer.close()
+    finished = path.read_bytes()
+    assert _sizes(finished) == (36 + 300, 300)
+    assert finished[:44] == build_wav_header(300, 24000)
+    assert parse_wav_header(finished)["data_size"] == 300
@@ -0,0 +1,111 @@
+import random
+import threading
+import time
+
+import pytest
+
+from pipeline_stages import (
+    OVERFLOW_BLOCK, OVERFLOW_COALESCE, OVERFLOW_DROP_OLDEST, STOP, ReorderBuffer, StageQueue
+)
+
+
+def test_stage_queue_drop_oldest_keeps_newest_items():
+    dropped = []
+    stage = StageQueue("tts", 2, OVERFLOW_DROP_OLDEST, on_drop=dropped.append)
+    for item in ("a", "b", "c", "d"):
+        stage.put(item)
+
+    assert dropped == ["a", "b"]
+    assert [stage.get(), stage.get()] == ["c", "d"]
+    stats = stage.stats()
+    assert (stats["put"], stats["taken"], stats["dropped"], stats["depth"], stats["max_depth"]) == (4, 2, 2, 0, 2)
+
+
+def test_stage_queue_coalesce_merges_into_newest():
+    stage = StageQueue("translate", 2, OVERFLOW_COALESCE, merge=lambda queued, new: f"{queued} {new}")
+    for item in ("one", "two", "three", "four"):
+        stage.put(item)
+
+    assert [stage.get(), stage.get()] == ["one", "two three four"]
+    assert stage.stats()["coalesced"] == 2
+
+
+def test_stage_queue_block_applies_backpressure():
+    stage = StageQueue("stt", 1, OVERFLOW_BLOCK)
+    stage.put("first")
+    producer = threading.Thread(target=stage.put, args=("second",))
+    producer.start()
+    time.sleep(0.05)
+    assert producer.is_alive()  # waiting for room
+
+    assert stage.get() == "first"
+    producer.join(1)
+    assert not producer.is_alive()
+    assert stage.get() == "second"
+    assert stage.stats()["blocked"] == 1
+
+
+def test_stage_queue_stop_is_never_dropped_or_merged():
+    stage = StageQueue("tts", 1, OVERFLOW_DROP_OLDEST)
+    stage.put("a")
+    stage.put_stop()  # accepted although the queue is full
+    stage.put("b")  # drops "a", not the sentinel
+
+    assert stage.qsize() == 1
+    assert stage.get() is STOP
+    assert stage.get() == "b"
+
+    merging = StageQueue("translate", 1, OVERFLOW_COALESCE, merge=lambda queued, new: queued + new)
+    merging.put("x")
+    merging.put_stop()
+    merging.put("y")
+    assert [merging.get(), merging.get()] == ["xy", STOP]
+
+
+def test_stage_queue_rejects_bad_configuration():
+    with pytest.raises(ValueError):
+        StageQueue("stt", 1, "lifo")
+    with pytest.raises(ValueError):
+        StageQueue("translate", 1, OVERFLOW_COALESCE)
+
+
+def test_reorder_buffer_releases_in_sequence_order():
+    emitted = []
+    buffer = ReorderBuffer(emitted.append)
+
+    for seq in (2, 0, 3, 1):
+        buffer.push(seq, f"item{seq}")
+        if seq == 2:
+            assert emitted == [] and buffer.waiting == 1
+
+    assert emitted == ["item0", "item1", "item2", "item3"]
+    assert buffer.waiting == 0
+    assert buffer.max_waiting == 2
+
+
+def test_reorder_buffer_skips_empty_results():
+    emitted = []
+    buffer = ReorderBuffer(emitted.append, first_seq=5)
+
+    buffer.push(6, "b")
+    buffer.push(5, None)  # e.g. a failed translation must not hold back seq 6
+    buffer.push(7, "c")
+
+    assert emitted == ["b", "c"]
+
+
+def test_reorder_buffer_from_many_workers():
+    emitted = []
+    buffer = ReorderBuffer(emitted.append)
+    sequence = list(range(500))
+    random.Random(7).shuffle(sequence)
+    chunks = [sequence[i::8] for i in range(8)]
+
+    threads = [threading.Thread(target=lambda chunk=chunk: [buffer.push(seq, seq) for seq in chunk])
+               for chunk in chunks]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert emitted == list(range(500))
@@ -0,0 +1,74 @@
+"""RateLimiter: token bucket on characters and requests per second."""
+
+import time
+
+import pytest
+
+from translator import ERROR_THROTTLED, RateLimiter, RateLimitTimeout, TranslatorClient, translate_with_retry
+
+
+def test_requests_within_bucket_do_not_wait():
+    limiter = RateLimiter(chars_per_second=10_000, requests_per_second=0)
+    assert limiter.reserve(4_000) == 0
+    assert limiter.reserve(4_000) == 0
+
+
+def test_oversized_reservations_are_charged_in_full():
+    rate, size, count = 11_000, 150_000, 5
+    limiter = RateLimiter(chars_per_second=rate, requests_per_second=0)
+    waits = [limiter.reserve(size) for _ in range(count)]
+
+    # Waits grow by size/rate each time; the last caller waits for everything billed before it
+    for earlier, later in zip(waits, waits[1:]):
+        assert later - earlier == pytest.approx(size / rate, rel=0.01)
+    assert waits[-1] == pytest.approx((count * size - rate) / rate, rel=0.01)
+
+
+def test_oversized_acquires_take_billed_time():
+    rate, size, count = 100_000, 30_000, 5
+    limiter = RateLimiter(chars_per_second=rate, requests_per_second=0, burst_seconds=0.1)
+    start = time.monotonic()
+    for _ in range(count):
+        limiter.acquire(size)
+    elapsed = time.monotonic() - start
+    expected = count * size / rate - limiter.char_capacity / rate
+    assert elapsed == pytest.approx(expected, abs=0.15)
+
+
+def test_wait_time_reports_deficit_without_reserving():
+    limiter = RateLimiter(chars_per_second=1_000, requests_per_second=0)
+    assert limiter.wait_time(3_000) == pytest.approx(2.0, abs=0.01)
+    assert limiter.acquisitions == 0
+
+
+def test_request_rate_limit():
+    limiter = RateLimiter(chars_per_second=0, requests_per_second=10)
+    waits = [limiter.reserve(0) for _ in range(12)]
+    assert waits[:10] == [0] * 10
+    assert waits[11] == pytest.approx(0.2, abs=0.01)
+
+
+def test_wait_beyond_budget_is_refused_without_reserving():
+    limiter = RateLimiter(chars_per_second=1_000, requests_per_second=0)
+    limiter.reserve(1_000)
+
+    with pytest.raises(RateLimitTimeout) as refused:
+        limiter.acquire(5_000, max_wait=1.0)
+    assert refused.value.retry_after == pytest.approx(5.0, abs=0.01)
+    assert limiter.stats()["rejected"] == 1
+    # The refused request took no tokens: a request that fits the budget still goes through
+    assert limiter.reserve(500, max_wait=1.0) == pytest.approx(0.5, abs=0.01)
+
+
+def test_drained_limiter_fails_translation_fast_within_deadline():
+    limiter = RateLimiter(chars_per_second=1_000, requests_per_second=0)
+    limiter.reserve(60_000)  # about a minute of backlog
+    client = TranslatorClient(key="key", region="region", rate_limiter=limiter)
+
+    start = time.monotonic()
+    result = translate_with_retry("hello", ["hi"], "en", client=client, use_cache=False, deadline=2.0)
+    assert time.monotonic() - start < 1.0
+
+    assert not result["success"]
+    assert result["error_kind"] == ERROR_THROTTLED
+    assert result["retry_after"] > 2.0
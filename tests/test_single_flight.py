@@ -0,0 +1,146 @@
+import threading
+import time
+
+import pytest
+
+import translator
+from translator import SingleFlight
+
+
+def _wait_for(condition, seconds=5.0):
+    deadline = time.monotonic() + seconds
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+def _run_concurrently(calls):
+    threads = [threading.Thread(target=call) for call in calls]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+class _GatedClient:
+    """Translator client stand-in that holds every request until released."""
+
+    has_credentials = True
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def translate_documents(self, texts, target_languages, source_language=None, timeout=None):
+        with self._lock:
+            self.requests += 1
+        self.release.wait(5)
+        return [{"detectedLanguage": {"language": "en"},
+                 "translations": [{"to": lang, "text": f"{lang}:{text}"} for lang in target_languages]}
+                for text in texts]
+
+
+def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    executions = []
+    outcomes = []
+
+    def work():
+        executions.append(1)
+        release.wait(5)
+        return "result"
+
+    threads = _run_concurrently([lambda: outcomes.append(flight.do("key", work)) for _ in range(4)])
+    _wait_for(lambda: flight.coalesced == 3)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(executions) == 1
+    assert sorted(outcomes) == [("result", False)] + [("result", True)] * 3
+    assert flight.stats() == {"leaders": 1, "coalesced": 3, "batch_duplicates": 0, "in_flight": 0}
+
+
+def test_leader_error_reaches_waiters():
+    flight = SingleFlight()
+    release = threading.Event()
+    errors = []
+
+    def work():
+        release.wait(5)
+        raise ValueError("boom")
+
+    def call():
+        try:
+            flight.do("key", work)
+        except ValueError as e:
+            errors.append(str(e))
+
+    threads = _run_concurrently([call, call])
+    _wait_for(lambda: flight.coalesced == 1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert errors == ["boom", "boom"]
+
+
+def test_waiter_times_out():
+    flight = SingleFlight()
+    release = threading.Event()
+    thread = _run_concurrently([lambda: flight.do("key", lambda: release.wait(5))])[0]
+    _wait_for(lambda: flight.leaders == 1)
+
+    with pytest.raises(TimeoutError):
+        flight.do("key", lambda: None, timeout=0.05)
+    release.set()
+    thread.join()
+
+
+def _translate_concurrently(monkeypatch, call_kwargs):
+    client = _GatedClient()
+    monkeypatch.setattr(translator, "get_translator_client", lambda: client)
+    monkeypatch.setattr(translator, "_single_flight", SingleFlight())
+    results = []
+    threads = _run_concurrently([
+        lambda kwargs=kwargs: results.append(translator.translate_with_retry("hello", ["hi"], "en", **kwargs))
+        for kwargs in call_kwargs
+    ])
+    _wait_for(lambda: translator._single_flight.leaders + translator._single_flight.coalesced == len(call_kwargs))
+    client.release.set()
+    for thread in threads:
+        thread.join()
+    assert all(result["translations"] == {"hi": "hi:hello"} for result in results)
+    return client, translator._single_flight
+
+
+def test_identical_translations_are_coalesced(monkeypatch):
+    client, flight = _translate_concurrently(monkeypatch, [{}, {}, {}])
+    assert client.requests == 1
+    assert flight.coalesced == 2
+
+
+def test_cache_bypass_is_not_coalesced_with_cached_calls(monkeypatch):
+    client, flight = _translate_concurrently(monkeypatch, [{}, {"use_cache": False}])
+    assert client.requests == 2
+    assert flight.coalesced == 0
+
+
+def test_calls_with_their_own_client_are_not_coalesced(monkeypatch):
+    own_client = _GatedClient()
+    own_client.release.set()
+    client, flight = _translate_concurrently(monkeypatch, [{}, {"client": own_client}])
+    assert client.requests == 1
+    assert own_client.requests == 1
+    assert flight.coalesced == 0
+
+
+def test_batch_duplicate_counter_is_thread_safe():
+    flight = SingleFlight()
+    threads = _run_concurrently([
+        lambda: [flight.add_batch_duplicates(1) for _ in range(10000)] for _ in range(8)
+    ])
+    for thread in threads:
+        thread.join()
+    assert flight.stats()["batch_duplicates"] == 80000
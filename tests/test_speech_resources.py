@@ -0,0 +1,71 @@
+"""SpeechResourceFactory: shared configs, warmed connections and the synthesizer pool."""
+
+import gc
+import weakref
+
+from speech_backend import speechsdk
+from speech_resources import SpeechResourceFactory
+
+
+def test_configs_are_shared_per_settings():
+    factory = SpeechResourceFactory(key="k", region="r")
+    assert factory.get_config(language="en-US") is factory.get_config(language="en-US")
+    assert factory.get_config(language="en-US") is not factory.get_config(language="de-DE")
+
+
+def test_warmed_recognizers_are_released_with_their_connections():
+    factory = SpeechResourceFactory(key="k", region="r", warm_connections=True)
+    refs = []
+    for _ in range(50):
+        recognizer = factory.create_recognizer(speechsdk.audio.AudioConfig(filename="unused.wav"))
+        refs.append(weakref.ref(recognizer))
+    del recognizer
+    gc.collect()
+
+    assert factory.stats()["connections_opened"] == 50
+    assert all(ref() is None for ref in refs)
+
+
+def test_synthesizer_pool_reuses_and_discards():
+    factory = SpeechResourceFactory(key="k", region="r")
+    pool = factory.synthesizers
+    assert pool.prewarm(["fr-FR-DeniseNeural"]) == 1
+
+    first = pool.acquire("fr-FR-DeniseNeural")
+    pool.release(first)
+    second = pool.acquire("fr-FR-DeniseNeural")
+    assert second is first
+    pool.release(second, healthy=False)
+
+    third = pool.acquire("fr-FR-DeniseNeural")
+    assert third is not first
+    pool.release(third)
+    stats = pool.stats()
+    assert (stats["hits"], stats["misses"], stats["discarded"]) == (2, 1, 1)
+
+
+def test_synthesizer_pool_evicts_idle():
+    factory = SpeechResourceFactory(key="k", region="r")
+    pool = factory.synthesizers
+    pool.prewarm(["fr-FR-DeniseNeural", "de-DE-KatjaNeural"])
+    pool.idle_timeout = 0
+    assert pool.evict_idle() == 2
+    assert pool.stats()["idle"] == 0
+
+
+def test_streaming_synthesis_buffers_only_without_a_sink(tmp_path):
+    factory = SpeechResourceFactory(key="k", region="r")
+    text = "Streaming speech is written as it arrives."
+
+    buffered = factory.synthesize_streaming("en-US-JennyNeural", text)
+    assert buffered["status"] == "success"
+    assert len(buffered["audio"]) == 44 + buffered["bytes"] > 44
+
+    chunks = []
+    path = tmp_path / "speech.wav"
+    streamed = factory.synthesize_streaming("en-US-JennyNeural", text, output_path=str(path),
+                                            on_chunk=chunks.append)
+    assert streamed["status"] == "success"
+    assert streamed["audio"] == b""
+    assert streamed["bytes"] == sum(len(chunk) for chunk in chunks) == buffered["bytes"]
+    assert path.read_bytes() == buffered["audio"]
@@ -0,0 +1,55 @@
+"""Split-mode transcription under the fake backend matches an unsplit run."""
+
+import wave
+
+import numpy as np
+import pytest
+
+import fake_speechsdk
+from transcribe_files import transcribe_file_result
+
+SENTENCES = [
+    "The first part of the talk introduces the project.",
+    "Then we describe how the audio is captured.",
+    "Recognition runs continuously on the stream.",
+    "Translations are produced for every target language.",
+    "Speech is synthesized for each translation.",
+    "Finally the results are written to disk.",
+]
+
+
+def write_talk(path, sample_rate=16000, channels=1):
+    """Noise bursts ("speech") separated by short silences, with a sidecar transcript."""
+    rng = np.random.default_rng(7)
+    parts = []
+    for _ in range(18):
+        parts.append(rng.normal(0, 4000, int(sample_rate * rng.uniform(6, 9))))
+        parts.append(rng.normal(0, 30, int(sample_rate * 0.8)))
+    mono = np.clip(np.concatenate(parts), -32768, 32767).astype("<i2")
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(np.repeat(mono, channels).tobytes())
+    path.with_suffix(".txt").write_text(" ".join(SENTENCES), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def samples_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(fake_speechsdk, "FAKE_SPEECH_SAMPLES_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.parametrize("sample_rate,channels", [(16000, 1), (44100, 2)])
+def test_split_transcript_equals_unsplit(samples_dir, sample_rate, channels):
+    path = write_talk(samples_dir / "talk.wav", sample_rate, channels)
+
+    whole = transcribe_file_result(path, use_cache=False)
+    split = transcribe_file_result(path, use_cache=False, split=True)
+
+    assert whole["status"] == "ok"
+    assert split["status"] == "ok"
+    assert split["transcript"] == whole["transcript"] == " ".join(SENTENCES)
+    assert [s["offset"] for s in split["segments"]] == pytest.approx(
+        [s["offset"] for s in whole["segments"]], abs=0.01)
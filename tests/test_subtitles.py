@@ -0,0 +1,33 @@
+import subtitles
+
+
+def _segments(count):
+    for index in range(count):
+        yield {"text": f"Sentence number {index}.", "offset": index * 2.0, "duration": 1.5}
+
+
+def test_original_track_is_written_before_translation_batches(monkeypatch, tmp_path):
+    output_base = str(tmp_path / "talk")
+    batches = []
+
+    def fake_translate_batch(texts, target_languages, source_language=None):
+        # Every cue of the batch is already in the original track when its translation is requested
+        with open(f"{output_base}.srt", encoding="utf-8") as f:
+            original = f.read()
+        assert all(text in original for text in texts)
+        batches.append(len(texts))
+        return [{"success": True, "translations": {lang: f"{lang}:{text}" for lang in target_languages}}
+                for text in texts]
+
+    monkeypatch.setattr(subtitles, "translate_batch", fake_translate_batch)
+    cue_count = 2 * subtitles.SUBTITLE_TRANSLATE_BATCH + 3
+
+    outcome = subtitles.write_subtitles(_segments(cue_count), output_base, ["srt", "vtt"], ["hi"])
+
+    assert outcome["cues"] == cue_count
+    assert outcome["untranslated"] == 0
+    assert batches == [subtitles.SUBTITLE_TRANSLATE_BATCH] * 2 + [3]
+    with open(f"{output_base}.hi.vtt", encoding="utf-8") as f:
+        translated = f.read()
+    assert translated.startswith("WEBVTT")
+    assert translated.count("hi:Sentence number") == cue_count
@@ -0,0 +1,98 @@
+import csv
+import os
+
+from stt_cache import hash_audio_file
+from transcript_checkpoint import TranscriptCheckpoint, file_signature
+
+
+def _audio(directory, name, content):
+    path = directory / name
+    path.write_bytes(content)
+    return str(path)
+
+
+def _row(path, status="ok", transcript="hello"):
+    return {
+        "filename": os.path.basename(path), "language": "en-US", "language_name": "English",
+        "transcript": transcript, "status": status, **file_signature(path), "sha256": hash_audio_file(path),
+    }
+
+
+def _read_rows(csv_path):
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def test_resume_after_crash_skips_finished_files(tmp_path):
+    csv_path = str(tmp_path / "transcripts.csv")
+    done = _audio(tmp_path, "a.wav", b"A" * 100)
+    failed = _audio(tmp_path, "b.wav", b"B" * 100)
+    unseen = _audio(tmp_path, "c.wav", b"C" * 100)
+
+    checkpoint = TranscriptCheckpoint(csv_path)
+    checkpoint.open()
+    checkpoint.append(_row(done))
+    checkpoint.append(_row(failed, status="error", transcript=""))
+    # Crash mid-write: a partial row and no compaction
+    with open(csv_path, "a", encoding="utf-8") as f:
+        f.write("c.wav,en-US")
+
+    resumed = TranscriptCheckpoint(csv_path)
+    assert resumed.is_done("a.wav", done)
+    assert not resumed.is_done("b.wav", failed)  # errors are retried
+    assert not resumed.is_done("c.wav", unseen)
+
+    resumed.open()
+    resumed.append(_row(failed, transcript="retried"))
+    resumed.append(_row(unseen, transcript="new"))
+    resumed.close(order=["a.wav", "b.wav", "c.wav"])
+
+    rows = _read_rows(csv_path)
+    assert [(row["filename"], row["status"], row["transcript"]) for row in rows] == [
+        ("a.wav", "ok", "hello"), ("b.wav", "ok", "retried"), ("c.wav", "ok", "new")
+    ]
+    assert not os.path.exists(csv_path + ".tmp")
+
+
+def test_changed_files_are_transcribed_again(tmp_path):
+    csv_path = str(tmp_path / "transcripts.csv")
+    touched = _audio(tmp_path, "touched.wav", b"T" * 100)
+    edited = _audio(tmp_path, "edited.wav", b"E" * 100)
+    resized = _audio(tmp_path, "resized.wav", b"R" * 100)
+
+    checkpoint = TranscriptCheckpoint(csv_path)
+    checkpoint.open()
+    for path in (touched, edited, resized):
+        checkpoint.append(_row(path))
+    checkpoint.close()
+
+    later = os.stat(touched).st_mtime_ns + 5_000_000_000
+    os.utime(touched, ns=(later, later))  # same content, new mtime (e.g. copied)
+    _audio(tmp_path, "edited.wav", b"X" * 100)  # same size, new content
+    os.utime(edited, ns=(later, later))
+    _audio(tmp_path, "resized.wav", b"R" * 101)
+
+    resumed = TranscriptCheckpoint(csv_path)
+    assert resumed.is_done("touched.wav", touched)
+    assert resumed.rows["touched.wav"]["mtime_ns"] == str(later)  # next run skips the hash
+    assert not resumed.is_done("edited.wav", edited)
+    assert not resumed.is_done("resized.wav", resized)
+
+
+def test_legacy_rows_and_force_are_not_trusted(tmp_path):
+    csv_path = str(tmp_path / "transcripts.csv")
+    path = _audio(tmp_path, "old.wav", b"O" * 100)
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["filename", "language", "language_name", "transcript"])
+        writer.writeheader()
+        writer.writerow({"filename": "old.wav", "language": "en-US", "language_name": "English",
+                         "transcript": "from an older version"})
+
+    assert not TranscriptCheckpoint(csv_path).is_done("old.wav", path)
+
+    checkpoint = TranscriptCheckpoint(csv_path)
+    checkpoint.open()
+    checkpoint.append(_row(path))
+    checkpoint.close()
+    assert TranscriptCheckpoint(csv_path).is_done("old.wav", path)
+    assert not TranscriptCheckpoint(csv_path, resume=False).is_done("old.wav", path)
@@ -0,0 +1,64 @@
+"""TranslationCache: in-memory LRU in front of a SQLite tier."""
+
+import sqlite3
+import time
+
+from translator import TranslationCache
+
+
+def make_cache(tmp_path, **kwargs) -> TranslationCache:
+    return TranslationCache(db_path=str(tmp_path / "cache.sqlite3"), **kwargs)
+
+
+def test_memory_and_disk_hits(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.put("Hello  world", "en", "fr", "Bonjour le monde", "en")
+    assert cache.get("Hello world", "en", "fr") == ("Bonjour le monde", "en")  # whitespace normalized
+
+    reopened = make_cache(tmp_path)
+    assert reopened.get("Hello world", "en", "fr") == ("Bonjour le monde", "en")
+    assert reopened.stats()["disk_hits"] == 1
+    assert reopened.get("Hello world", "en", "de") is None
+
+
+def test_lru_evicts_from_memory_only(tmp_path):
+    cache = make_cache(tmp_path, max_entries=2)
+    cache.put_many([(f"text {i}", "en", "fr", f"texte {i}", "en") for i in range(3)])
+    assert cache.stats()["memory_entries"] == 2
+    assert cache.get("text 0", "en", "fr") == ("texte 0", "en")
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_put_many_commits_once(tmp_path):
+    cache = make_cache(tmp_path)
+    statements = []
+    cache._db.set_trace_callback(statements.append)
+    cache.put_many([(f"text {i}", "en", lang, "x", "en") for i in range(100) for lang in ("fr", "de", "es")])
+    assert sum(1 for sql in statements if sql.strip().upper() == "COMMIT") == 1
+
+    db = sqlite3.connect(str(tmp_path / "cache.sqlite3"))
+    assert db.execute("SELECT COUNT(*) FROM translations").fetchone()[0] == 300
+    assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_expired_entries_miss_and_are_purged_on_open(tmp_path):
+    cache = make_cache(tmp_path, ttl_seconds=60)
+    cache.put("old", "en", "fr", "vieux", "en")
+    cache._db.execute("UPDATE translations SET created_at = ?", (time.time() - 3600,))
+    cache._db.commit()
+    cache._memory.clear()
+    assert cache.get("old", "en", "fr") is None
+
+    make_cache(tmp_path, ttl_seconds=60)
+    db = sqlite3.connect(str(tmp_path / "cache.sqlite3"))
+    assert db.execute("SELECT COUNT(*) FROM translations").fetchone()[0] == 0
+
+
+def test_disk_tier_is_trimmed_to_max_rows(tmp_path):
+    cache = make_cache(tmp_path, max_rows=5)
+    for i in range(8):
+        cache.put(f"text {i}", "en", "fr", f"texte {i}", "en")
+    assert cache.trim() == 3
+
+    kept = sqlite3.connect(str(tmp_path / "cache.sqlite3")).execute("SELECT text FROM translations").fetchall()
+    assert sorted(text for (text,) in kept) == [f"text {i}" for i in range(3, 8)]
@@ -0,0 +1,73 @@
+"""Energy VAD splitting of long recordings."""
+
+import wave
+
+import numpy as np
+import pytest
+
+from audio_utils import WavFormatError
+from vad_splitter import find_split_points, split_audio
+
+
+def write_wav(path, samples, sample_rate=16000, sampwidth=2):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(sampwidth)
+        wav.setframerate(sample_rate)
+        wav.writeframes(samples)
+    return str(path)
+
+
+def speech_with_pauses(sample_rate=16000, bursts=12, burst_seconds=7.0, pause_seconds=1.0):
+    rng = np.random.default_rng(3)
+    speech = int(sample_rate * burst_seconds)
+    pause = int(sample_rate * pause_seconds)
+    audio = np.concatenate([
+        np.concatenate([rng.normal(0, 5000, speech), rng.normal(0, 20, pause)]) for _ in range(bursts)
+    ])
+    return audio.astype("<i2"), speech, pause
+
+
+def test_segments_are_bounded_and_cut_in_silence(tmp_path):
+    audio, speech, pause = speech_with_pauses()
+    path = write_wav(tmp_path / "long.wav", audio.tobytes())
+
+    samples, header, segments = split_audio(path, max_segment_seconds=20, min_segment_seconds=5)
+
+    assert segments[0][0] == 0 and segments[-1][1] == len(samples)
+    assert all(end == start for (_, end), (start, _) in zip(segments, segments[1:]))
+    assert all((end - start) / 16000 <= 20 for start, end in segments)
+    period = speech + pause
+    for _, cut in segments[:-1]:
+        assert cut % period >= speech  # inside a pause
+
+
+def test_short_audio_is_not_split(tmp_path):
+    audio, _, _ = speech_with_pauses(bursts=2)
+    path = write_wav(tmp_path / "short.wav", audio.tobytes())
+    _, _, segments = split_audio(path, max_segment_seconds=60)
+    assert len(segments) == 1
+
+
+def test_cut_falls_back_to_quietest_frame_without_silence():
+    levels = np.full(1000, -20.0, dtype=np.float32)
+    levels[:100] = -60.0  # the only silence sits before the first allowed cut
+    levels[420] = -25.0
+    cuts = find_split_points(levels, frame_ms=30, max_segment_seconds=15, min_segment_seconds=3)
+    assert cuts[0] == 420
+
+
+def test_split_accepts_wav_bytes(tmp_path):
+    audio, _, _ = speech_with_pauses(bursts=6)
+    path = write_wav(tmp_path / "mem.wav", audio.tobytes())
+    with open(path, "rb") as f:
+        data = f.read()
+    _, _, from_bytes = split_audio(data, max_segment_seconds=20, min_segment_seconds=5)
+    _, _, from_file = split_audio(path, max_segment_seconds=20, min_segment_seconds=5)
+    assert from_bytes == from_file
+
+
+def test_24_bit_pcm_is_rejected(tmp_path):
+    path = write_wav(tmp_path / "24bit.wav", bytes(3 * 16000), sampwidth=3)
+    with pytest.raises(WavFormatError):
+        split_audio(path)